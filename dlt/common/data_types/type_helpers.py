@@ -98,6 +98,9 @@ def coerce_value(to_type: TDataType, from_type: TDataType, value: Any) -> Any:
         if to_type == "complex":
             # complex types need custom encoding to be removed
             return map_nested_in_place(custom_pua_remove, value)
+        if to_type == "binary" and type(value) is not bytes:
+            # store bytes subclasses ie. HexBytes as plain bytes so they serialize like any other binary
+            return bytes(value)
         return value
 
     if to_type == "text":
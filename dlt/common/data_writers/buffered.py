@@ -18,6 +18,7 @@ class BufferedDataWriter:
         buffer_max_items: int = 5000
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
+        line_max_bytes: Optional[int] = 16 * 1024 * 1024
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__ = known_sections.DATA_WRITER
@@ -32,6 +33,7 @@ class BufferedDataWriter:
         buffer_max_items: int = 5000,
         file_max_items: int = None,
         file_max_bytes: int = None,
+        line_max_bytes: int = 16 * 1024 * 1024,
         _caps: DestinationCapabilitiesContext = None
     ):
         self.file_format = file_format
@@ -46,6 +48,8 @@ class BufferedDataWriter:
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
+        # only the extract format splits buffered items into many lines
+        self._writer_options = {"line_max_bytes": line_max_bytes} if file_format == "puae-jsonl" else {}
 
         self._current_columns: TTableSchemaColumns = None
         self._file_name: str = None
@@ -85,6 +89,11 @@ class BufferedDataWriter:
             if self.file_max_items and self._writer.items_count >= self.file_max_items:
                 self._rotate_file()
 
+    def rotate_file(self) -> None:
+        """Flushes buffered items and closes the current file, next items are written to a new file"""
+        self._ensure_open()
+        self._rotate_file()
+
     def close(self) -> None:
         self._ensure_open()
         self._flush_and_close_file()
@@ -113,7 +122,7 @@ class BufferedDataWriter:
                     self._file = open(self._file_name, "wb")
                 else:
                     self._file = open(self._file_name, "wt", encoding="utf-8")
-                self._writer = DataWriter.from_file_format(self.file_format, self._file, caps=self._caps)
+                self._writer = DataWriter.from_file_format(self.file_format, self._file, caps=self._caps, **self._writer_options)
                 self._writer.write_header(self._current_columns)
             # write buffer
             self._writer.write_data(self._buffered_items)
@@ -58,6 +58,23 @@ def escape_duckdb_literal(v: Any) -> Any:
     return str(v)
 
 
+def escape_csv_value(v: Any) -> str:
+    """Escapes a value as a CSV field compatible with postgres COPY. None is written as an empty, unquoted field (NULL)"""
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        # always quote strings so empty string is distinguished from NULL
+        return '"' + v.replace('"', '""') + '"'
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    if isinstance(v, (list, dict)):
+        return '"' + json.dumps(v).replace('"', '""') + '"'
+    if isinstance(v, bytes):
+        return f"\\x{v.hex()}"
+
+    return str(v)
+
+
 def escape_redshift_identifier(v: str) -> str:
     return '"' + v.replace('"', '""').replace("\\", "\\\\") + '"'
 
@@ -1,10 +1,16 @@
 import abc
+import pickle
 # import jsonlines
 from dataclasses import dataclass
-from typing import Any, Dict, Sequence, IO, Type
+from datetime import date, datetime  # noqa: I251
+from enum import Enum
+from typing import Any, ClassVar, Dict, Iterator, List, Sequence, IO, Type
+from uuid import UUID
 
 from dlt.common import json
-from dlt.common.typing import StrAny
+from dlt.common.arithmetics import Decimal
+from dlt.common.json import custom_encode
+from dlt.common.data_writers.escape import escape_csv_value
 from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
 
@@ -47,8 +53,8 @@ class DataWriter(abc.ABC):
         pass
 
     @classmethod
-    def from_file_format(cls, file_format: TLoaderFileFormat, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> "DataWriter":
-        return cls.class_factory(file_format)(f, caps)
+    def from_file_format(cls, file_format: TLoaderFileFormat, f: IO[Any], caps: DestinationCapabilitiesContext = None, **writer_options: Any) -> "DataWriter":
+        return cls.class_factory(file_format)(f, caps, **writer_options)
 
     @classmethod
     def from_destination_capabilities(cls, caps: DestinationCapabilitiesContext, f: IO[Any]) -> "DataWriter":
@@ -64,8 +70,14 @@ class DataWriter(abc.ABC):
             return JsonlWriter
         elif file_format == "puae-jsonl":
             return JsonlListPUAEncodeWriter
+        elif file_format == "pickle":
+            return PickleListWriter
         elif file_format == "insert_values":
             return InsertValuesWriter
+        elif file_format == "parquet":
+            return ParquetDataWriter
+        elif file_format == "csv":
+            return CsvWriter
         else:
             raise ValueError(file_format)
 
@@ -91,12 +103,29 @@ class JsonlWriter(DataWriter):
 
 class JsonlListPUAEncodeWriter(JsonlWriter):
 
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None, line_max_bytes: int = None) -> None:
+        super().__init__(f, caps)
+        # rows are split into lines of at most line_max_bytes so readers decode them in bounded memory
+        self.line_max_bytes = line_max_bytes
+
     def write_data(self, rows: Sequence[Any]) -> None:
         # skip JsonlWriter when calling super
         super(JsonlWriter, self).write_data(rows)
+        self._write_lines(rows)
+
+    def _write_lines(self, rows: Sequence[Any]) -> None:
         # write all rows as one list which will require to write just one line
         # encode types with PUA characters
-        json.typed_dump(rows, self._f)
+        line = json.typed_dumpb(rows)
+        if self.line_max_bytes and len(line) > self.line_max_bytes and len(rows) > 1:
+            # line too long: split rows into parts that should fit and encode each separately, single row is never split
+            parts = -(-len(line) // self.line_max_bytes)
+            del line
+            part_size = -(-len(rows) // parts)
+            for idx in range(0, len(rows), part_size):
+                self._write_lines(rows[idx:idx + part_size])
+            return
+        self._f.write(line)
         self._f.write(b"\n")
 
     @classmethod
@@ -104,52 +133,188 @@ class JsonlListPUAEncodeWriter(JsonlWriter):
         return TFileFormatSpec("puae-jsonl", "jsonl", True, True)
 
 
+_JSON_TYPES = frozenset((str, int, float, bool, type(None)))
+_PUA_ENCODED_TYPES = (str, int, float, Decimal, datetime, date, UUID, bytes)
+
+
+def _to_json_types(obj: Any) -> Any:
+    """Converts `obj` into types that survive the json round trip in `puae-jsonl` files so normalizer receives the same data from both formats.
+    Tuples are converted into lists, objects that json encoders convert into dictionaries (ie. named tuples, dataclasses) into dictionaries.
+    Raises TypeError on types that json encoders reject ie. sets.
+    """
+    if type(obj) in _JSON_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        return {k: _to_json_types(v) for k, v in obj.items()}
+    if isinstance(obj, list) or (isinstance(obj, tuple) and not hasattr(obj, "_asdict")):
+        return [_to_json_types(v) for v in obj]
+    if isinstance(obj, Enum):
+        return _to_json_types(obj.value)
+    if isinstance(obj, _PUA_ENCODED_TYPES):
+        return obj
+    # raises TypeError if obj is not json serializable
+    return _to_json_types(custom_encode(obj))
+
+
+class PickleListWriter(DataWriter):
+    """Writes each chunk of rows as separate pickled list. Python types like Decimal, datetime or bytes are preserved so they
+    do not need to be encoded and decoded again. Used only to pass data items from extract to normalize in the same environment.
+    """
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        pass
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+        pickle.dump(_to_json_types(rows), self._f, protocol=5)
+
+    def write_footer(self) -> None:
+        pass
+
+    @staticmethod
+    def read_data(f: IO[bytes]) -> Iterator[List[Any]]:
+        """Yields lists of rows written to file `f` which must support `read` and `readline` ie. a file object or mmap"""
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec("pickle", "pickle", True, True)
+
+
 class InsertValuesWriter(DataWriter):
 
+    STATEMENT_BOUNDARY: ClassVar[str] = ";\nINSERT INTO "
+    """Separates statements in a file. String literals escape new lines so the boundary may be found without parsing the file"""
+
     def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
         super().__init__(f, caps)
-        self._chunks_written = 0
+        self._rows_written = 0
         self._headers_lookup: Dict[str, int] = None
+        self._header: str = None
+        # rows are split into many statements that fit into the max query length of the destination
+        self._max_statement_length = caps.max_query_length // 2 if caps and caps.max_query_length else None
+        self._statement_length = 0
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
-        assert self._chunks_written == 0
+        assert self._rows_written == 0
         assert columns_schema is not None, "column schema required"
         headers = columns_schema.keys()
         # dict lookup is always faster
         self._headers_lookup = {v: i for i, v in enumerate(headers)}
         # do not write INSERT INTO command, this must be added together with table name by the loader
-        self._f.write("INSERT INTO {}(")
-        self._f.write(",".join(map(self._caps.escape_identifier, headers)))
-        self._f.write(")\nVALUES\n")
+        self._header = "INSERT INTO {}(" + ",".join(map(self._caps.escape_identifier, headers)) + ")\nVALUES\n"
+        self._f.write(self._header)
+        self._statement_length = len(self._header)
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
 
-        def write_row(row: StrAny) -> None:
+        for row in rows:
             output = ["NULL"] * len(self._headers_lookup)
             for n,v  in row.items():
                 output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            self._f.write("(")
+            values = "(" + ",".join(output) + ")"
+            # write separator if this is not the first row
+            if self._rows_written > 0:
+                # account for the separator and the ; that ends the statement
+                if self._max_statement_length and self._statement_length + len(values) + 3 > self._max_statement_length:
+                    # finish the statement and start a new one, the loader executes statements separately
+                    self._f.write(";\n")
+                    self._f.write(self._header)
+                    self._statement_length = len(self._header)
+                else:
+                    self._f.write(",\n")
+                    self._statement_length += 2
+            self._f.write(values)
+            self._statement_length += len(values)
+            self._rows_written += 1
+
+    def write_footer(self) -> None:
+        assert self._rows_written > 0
+        self._f.write(";")
+
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec("insert_values", "insert_values", False, False, requires_destination_capabilities=True)
+
+
+class CsvWriter(DataWriter):
+
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
+        super().__init__(f, caps)
+        self._headers_lookup: Dict[str, int] = None
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        assert self._headers_lookup is None
+        assert columns_schema is not None, "column schema required"
+        headers = columns_schema.keys()
+        # dict lookup is always faster
+        self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        # header line with column names, the loader uses it to build the column list
+        self._f.write(",".join(map(escape_csv_value, headers)))
+        self._f.write("\n")
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        super().write_data(rows)
+
+        for row in rows:
+            # empty, unquoted field is NULL
+            output = [""] * len(self._headers_lookup)
+            for n, v in row.items():
+                output[self._headers_lookup[n]] = escape_csv_value(v)
             self._f.write(",".join(output))
-            self._f.write(")")
+            self._f.write("\n")
 
-        # if next chunk add separator
-        if self._chunks_written > 0:
-            self._f.write(",\n")
+    def write_footer(self) -> None:
+        assert self._headers_lookup is not None
 
-        # write rows
-        for row in rows[:-1]:
-            write_row(row)
-            self._f.write(",\n")
+    @classmethod
+    def data_format(cls) -> TFileFormatSpec:
+        return TFileFormatSpec("csv", "csv", False, False)
+
+
+class ParquetDataWriter(DataWriter):
+
+    def __init__(self, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> None:
+        super().__init__(f, caps)
+        # import pyarrow only when parquet file is written
+        from dlt.common.libs.pyarrow import pyarrow
+        self._writer: pyarrow.parquet.ParquetWriter = None
+        self._schema: pyarrow.Schema = None
+        self._complex_columns: List[str] = None
+
+    def write_header(self, columns_schema: TTableSchemaColumns) -> None:
+        from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_datatype
+
+        assert self._writer is None
+        assert columns_schema is not None, "column schema required"
+        self._schema = pyarrow.schema(
+            [pyarrow.field(name, get_py_arrow_datatype(column["data_type"]), nullable=column["nullable"]) for name, column in columns_schema.items()]
+        )
+        # complex values are stored as json strings
+        self._complex_columns = [name for name, column in columns_schema.items() if column["data_type"] == "complex"]
+        self._writer = pyarrow.parquet.ParquetWriter(self._f, self._schema)
+
+    def write_data(self, rows: Sequence[Any]) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
 
-        # write last row without separator so we can write footer eventually
-        write_row(rows[-1])
-        self._chunks_written += 1
+        super().write_data(rows)
+        # build columns from rows so the rows passed by the caller are not modified
+        columns = {name: [row.get(name) for row in rows] for name in self._schema.names}
+        for name in self._complex_columns:
+            columns[name] = [None if value is None else json.dumps(value) for value in columns[name]]
+        # each flushed buffer becomes a separate row group
+        self._writer.write_batch(pyarrow.RecordBatch.from_pydict(columns, schema=self._schema))
 
     def write_footer(self) -> None:
-        assert self._chunks_written > 0
-        self._f.write(";")
+        assert self._writer is not None
+        self._writer.close()
+        self._writer = None
 
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
-        return TFileFormatSpec("insert_values", "insert_values", False, False, requires_destination_capabilities=True)
+        return TFileFormatSpec("parquet", "parquet", True, False)
@@ -10,7 +10,10 @@ from dlt.common.configuration.specs import ContainerInjectableContext
 # puae-jsonl - internal extract -> normalize format bases on jsonl
 # insert_values - insert SQL statements
 # sql - any sql statement
-TLoaderFileFormat = Literal["jsonl", "puae-jsonl", "insert_values", "sql"]
+# parquet - columnar parquet files written with pyarrow
+# csv - comma separated values with a header, compatible with postgres COPY
+# pickle - internal extract -> normalize format with lists of data items pickled with native python types
+TLoaderFileFormat = Literal["jsonl", "puae-jsonl", "insert_values", "sql", "parquet", "csv", "pickle"]
 
 
 @configspec(init=True)
@@ -164,6 +164,10 @@ class JobClientBase(ABC):
     def complete_load(self, load_id: str) -> None:
         pass
 
+    def is_alive(self) -> bool:
+        """Checks if client opened with `__enter__` may be still used. Clients that hold connections should check if connection is open"""
+        return True
+
     @abstractmethod
     def __enter__(self) -> "JobClientBase":
         pass
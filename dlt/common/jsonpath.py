@@ -1,9 +1,9 @@
-from typing import Iterable, Union, List, Any
+from typing import Iterable, Optional, Union, List, Any
 from itertools import chain
 
 from dlt.common.typing import DictStrAny
 
-from jsonpath_ng import parse as _parse, JSONPath
+from jsonpath_ng import parse as _parse, JSONPath, Child, Fields, Root
 
 
 TJsonPath = Union[str, JSONPath]  # Jsonpath compiled or str
@@ -36,6 +36,17 @@ def find_values(path: TJsonPath, data: DictStrAny) -> List[Any]:
     return [m.value for m in path.find(data)]
 
 
+def extract_simple_field_name(path: TJsonPath) -> Optional[str]:
+    """Return the key name if `path` selects a single top level key ie. `created_at` or `$.created_at`, otherwise None.
+    Such paths may be evaluated with a plain dictionary lookup instead of the jsonpath interpreter"""
+    path = compile_path(path)
+    if isinstance(path, Child) and isinstance(path.left, Root):
+        path = path.right
+    if isinstance(path, Fields) and len(path.fields) == 1 and path.fields[0] != "*":
+        return path.fields[0]  # type: ignore[no-any-return]
+    return None
+
+
 def resolve_paths(paths: TAnyJsonPath, data: DictStrAny) -> List[str]:
     """Return a list of paths resolved against `data`. The return value is a list of strings.
 
@@ -0,0 +1,42 @@
+from typing import Any
+
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.arithmetics import DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE
+from dlt.common.data_types.typing import TDataType
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    raise MissingDependencyException("DLT parquet Helpers", ["pyarrow"], "DLT Helpers for parquet writer.")
+
+
+# arrow decimals are limited to 76 digits which is less than full EVM precision
+WEI_ARROW_PRECISION = 76
+
+
+def get_py_arrow_datatype(column_type: TDataType) -> Any:
+    """Maps dlt data type into arrow data type"""
+    if column_type == "text":
+        return pyarrow.string()
+    elif column_type == "double":
+        return pyarrow.float64()
+    elif column_type == "bool":
+        return pyarrow.bool_()
+    elif column_type == "timestamp":
+        return pyarrow.timestamp("us", tz="UTC")
+    elif column_type == "bigint":
+        return pyarrow.int64()
+    elif column_type == "binary":
+        return pyarrow.binary()
+    elif column_type == "complex":
+        # complex types are stored as json strings
+        return pyarrow.string()
+    elif column_type == "decimal":
+        return pyarrow.decimal128(DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE)
+    elif column_type == "wei":
+        return pyarrow.decimal256(WEI_ARROW_PRECISION, 0)
+    elif column_type == "date":
+        return pyarrow.date32()
+    else:
+        raise ValueError(column_type)
@@ -13,6 +13,7 @@ from dlt.common.validation import validate_dict
 
 EMPTY_KEY_IDENTIFIER = "_empty"  # replace empty keys with this
 DLT_ID_LENGTH_BYTES = 10
+MAX_CACHED_KEYS_PER_PATH = 10000  # caps the flatten cache when keys in data are dynamic ie. ids used as keys
 
 class TDataItemRow(TypedDict, total=False):
     _dlt_id: str  # unique id of current row
@@ -46,6 +47,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     propagation_config: RelationalNormalizerConfigPropagation
     max_nesting: int
     _skip_primary_key: Dict[str, bool]
+    _flatten_cache: Dict[Tuple[str, ...], Dict[str, Tuple[str, str]]]
+    """Maps a path of normalized identifiers and a raw key into (normalized key, column name)"""
 
     def __init__(self, schema: Schema) -> None:
         self.schema = schema
@@ -56,6 +59,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         self.propagation_config = self.normalizer_config.get("propagation", None)
         self.max_nesting = self.normalizer_config.get("max_nesting", 1000)
         self._skip_primary_key = {}
+        self._flatten_cache = {}
         # self.known_types: Dict[str, TDataType] = {}
         # self.primary_keys = Dict[str, ]
 
@@ -91,18 +95,18 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
 
         out_rec_row: DictStrAny = {}
         out_rec_list: Dict[Tuple[str, ...], Sequence[Any]] = {}
-        schema = self.schema
+        flatten_cache = self._flatten_cache
 
         def norm_row_dicts(dict_row: StrAny, __r_lvl: int, path: Tuple[str, ...] = ()) -> None:
+            # normalized names of keys depend only on the path so rows with the same shape are resolved with a single lookup
+            path_cache = flatten_cache.get(path)
+            if path_cache is None or len(path_cache) > MAX_CACHED_KEYS_PER_PATH:
+                path_cache = flatten_cache[path] = {}
             for k, v in dict_row.items():
-                if k.strip():
-                    norm_k = schema.naming.normalize_identifier(k)
-                else:
-                    # for empty keys in the data use _
-                    norm_k = EMPTY_KEY_IDENTIFIER
-                # if norm_k != k:
-                #     print(f"{k} -> {norm_k}")
-                child_name = norm_k if path == () else schema.naming.shorten_fragments(*path, norm_k)
+                try:
+                    norm_k, child_name = path_cache[k]
+                except KeyError:
+                    norm_k, child_name = path_cache[k] = self._normalize_key(path, k)
                 # for lists and dicts we must check if type is possibly complex
                 if isinstance(v, (dict, list)):
                     if not self._is_complex_type(table, child_name, __r_lvl):
@@ -123,6 +127,17 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         norm_row_dicts(dict_row, _r_lvl)
         return cast(TDataItemRow, out_rec_row), out_rec_list
 
+    def _normalize_key(self, path: Tuple[str, ...], k: str) -> Tuple[str, str]:
+        """Normalizes key `k` found under `path` and returns (normalized key, column name)"""
+        naming = self.schema.naming
+        if k.strip():
+            norm_k = naming.normalize_identifier(k)
+        else:
+            # for empty keys in the data use _
+            norm_k = EMPTY_KEY_IDENTIFIER
+        child_name = norm_k if path == () else naming.shorten_fragments(*path, norm_k)
+        return norm_k, child_name
+
     @staticmethod
     def _get_child_row_hash(parent_row_id: str, child_table: str, list_idx: int) -> str:
         # create deterministic unique id of the child row taking into account that all lists are ordered
@@ -217,8 +232,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         _r_lvl: int = 0
     ) -> TNormalizedRowIterator:
 
-        schema = self.schema
-        table = schema.naming.shorten_fragments(*parent_path, *ident_path)
+        table = self.schema.naming.shorten_fragments(*parent_path, *ident_path)
 
         # flatten current row and extract all lists to recur into
         flattened_row, lists = self._flatten(table, dict_row, _r_lvl)
@@ -233,7 +247,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         extend.update(self._get_propagated_values(table, flattened_row, _r_lvl ))
 
         # yield parent table first
-        yield (table, schema.naming.shorten_fragments(*parent_path)), flattened_row
+        yield (table, self.schema.naming.shorten_fragments(*parent_path)), flattened_row
 
         # normalize and yield lists
         for list_path, list_content in lists.items():
@@ -287,6 +301,7 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
             update_dict_nested(norm_config["config"], config)  # type: ignore
         else:
             norm_config["config"] = config
+        schema._mark_modified()
 
     @classmethod
     def get_normalizer_config(cls, schema: Schema) -> RelationalNormalizerConfig:
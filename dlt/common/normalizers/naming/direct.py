@@ -1,6 +1,6 @@
 from typing import Any, Sequence
 
-from dlt.common.normalizers.naming.naming import NamingConvention as BaseNamingConvention
+from dlt.common.normalizers.naming.naming import NamingConvention as BaseNamingConvention, cached_path
 
 
 class NamingConvention(BaseNamingConvention):
@@ -13,8 +13,10 @@ class NamingConvention(BaseNamingConvention):
         norm_identifier = identifier.translate(self._CLEANUP_TABLE)
         return self.shorten_identifier(norm_identifier, identifier, self.max_length)
 
+    @cached_path
     def make_path(self, *identifiers: Any) -> str:
         return self.PATH_SEPARATOR.join(filter(lambda x: x.strip(), identifiers))
 
+    @cached_path
     def break_path(self, path: str) -> Sequence[str]:
         return [ident for ident in path.split(self.PATH_SEPARATOR) if ident.strip()]
\ No newline at end of file
@@ -1,18 +1,59 @@
 import base64
 from abc import abstractmethod, ABC
-from functools import lru_cache
+from functools import lru_cache, wraps
 import math
 import hashlib
-from typing import Any, List, Protocol, Sequence, Type
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Protocol, Sequence, Tuple, Type, TypeVar
+
+TFun = TypeVar("TFun", bound=Callable[..., Any])
+
+
+class TPathCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
+
+
+def cached_path(f: TFun) -> TFun:
+    """Caches results of a path building method of naming convention in the bounded, per instance cache. Arguments must be hashable.
+    Cached values are shared between callers and must not be modified. The cache is created on first use so naming conventions
+    that do not call `NamingConvention.__init__` are supported.
+    """
+    @wraps(f)
+    def _wrap(self: "NamingConvention", *args: Any) -> Any:
+        path_cache = getattr(self, "_path_cache", None)
+        if path_cache is None:
+            path_cache = self._reset_path_cache()
+        key = (f, args)
+        try:
+            rv = path_cache[key]
+            self._path_cache_hits += 1
+            return rv
+        except KeyError:
+            pass
+        rv = f(self, *args)
+        self._path_cache_misses += 1
+        if len(path_cache) >= self.PATH_CACHE_MAX_SIZE:
+            # the working set of paths is typically small so it is just rebuilt
+            path_cache.clear()
+        path_cache[key] = rv
+        return rv
+
+    return _wrap  # type: ignore[return-value]
 
 
 class NamingConvention(ABC):
 
+    PATH_CACHE_MAX_SIZE: ClassVar[int] = 65536
+    """Max number of results kept in the cache of the path building methods"""
+
     _TR_TABLE = bytes.maketrans(b"/+", b"ab")
     _DEFAULT_COLLISION_PROB = 0.001
 
     def __init__(self, max_length: int = None) -> None:
         self.max_length = max_length
+        self._reset_path_cache()
 
     @abstractmethod
     def normalize_identifier(self, identifier: str) -> str:
@@ -34,12 +75,14 @@ class NamingConvention(ABC):
         """Breaks path into sequence of identifiers"""
         pass
 
+    @cached_path
     def normalize_path(self, path: str) -> str:
         """Breaks path into identifiers, normalizes components, reconstitutes and shortens the path"""
         normalized_idents = [self.normalize_identifier(ident) for ident in self.break_path(path)]
         # shorten the whole path
         return self.shorten_identifier(self.make_path(*normalized_idents), path, self.max_length)
 
+    @cached_path
     def shorten_fragments(self, *normalized_idents: str) -> str:
         """Reconstitutes and shortens the path of normalized identifiers"""
         if not normalized_idents:
@@ -58,6 +101,18 @@ class NamingConvention(ABC):
 
         return normalized_ident
 
+    def path_cache_info(self) -> TPathCacheInfo:
+        """Returns hits, misses and size of the cache of the path building methods"""
+        if getattr(self, "_path_cache", None) is None:
+            self._reset_path_cache()
+        return TPathCacheInfo(self._path_cache_hits, self._path_cache_misses, self.PATH_CACHE_MAX_SIZE, len(self._path_cache))
+
+    def _reset_path_cache(self) -> Dict[Tuple[Callable[..., Any], Tuple[Any, ...]], Any]:
+        self._path_cache: Dict[Tuple[Callable[..., Any], Tuple[Any, ...]], Any] = {}
+        self._path_cache_hits = 0
+        self._path_cache_misses = 0
+        return self._path_cache
+
     @staticmethod
     def _compute_tag(identifier: str, collision_prob: float) -> str:
         # assume that shake_128 has perfect collision resistance 2^N/2 then collision prob is 1/resistance: prob = 1/2^N/2, solving for prob
@@ -2,7 +2,7 @@ import re
 from typing import Any, List, Sequence
 from functools import lru_cache
 
-from dlt.common.normalizers.naming.naming import NamingConvention as BaseNamingConvention
+from dlt.common.normalizers.naming.naming import NamingConvention as BaseNamingConvention, cached_path
 
 
 class NamingConvention(BaseNamingConvention):
@@ -24,10 +24,12 @@ class NamingConvention(BaseNamingConvention):
         # print(f"{identifier} -> {self.shorten_identifier(identifier, self.max_length)} ({self.max_length})")
         return self._normalize_identifier(identifier, self.max_length)
 
+    @cached_path
     def make_path(self, *identifiers: str) -> str:
         # only non empty identifiers participate
         return self.PATH_SEPARATOR.join(filter(lambda x: x.strip(), identifiers))
 
+    @cached_path
     def break_path(self, path: str) -> Sequence[str]:
         return [ident for ident in path.split(self.PATH_SEPARATOR) if ident.strip()]
 
@@ -1,6 +1,7 @@
 import yaml
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast
+from functools import partial
+from typing import Callable, ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, Type, cast
 from dlt.common import json
 
 from dlt.common.typing import DictStrAny, StrAny, REPattern, SupportsVariant, VARIANT_FIELD_FORMAT, TDataItem
@@ -29,20 +30,27 @@ class Schema:
     _stored_version: int  # version at load/creation time
     _stored_version_hash: str  # version hash at load/creation time
     _imported_version_hash: str  # version hash of recently imported schema
+    _version_cache: Optional[Tuple[int, str]]  # (version, version hash) of current content, None if content was modified since computed
     _schema_description: str  # optional schema description
     _schema_tables: TSchemaTables
     _settings: TSchemaSettings # schema settings to hold default hints, preferred types and other settings
 
     # list of preferred types: map regex on columns into types
     _compiled_preferred_types: List[Tuple[REPattern, TDataType]]
+    # preferred types resolved for column names, reset when settings are compiled
+    _preferred_types_cache: Dict[str, Optional[TDataType]]
     # compiled default hints
     _compiled_hints: Dict[TColumnHint, Sequence[REPattern]]
     # compiled exclude filters per table
     _compiled_excludes: Dict[str, Sequence[REPattern]]
     # compiled include filters per table
     _compiled_includes: Dict[str, Sequence[REPattern]]
+    # filters applying to table rows (branch of column path, excludes, includes) and memoized exclusion of columns, per table
+    _compiled_row_filters: Dict[str, Tuple[List[Tuple[Sequence[str], Sequence[REPattern], Sequence[REPattern]]], Dict[str, bool]]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # compiled coercers per table: columns of the table and (column name, python type) -> conversion function or None if value passes as is
+    _compiled_coercers: Dict[str, Tuple[TTableSchemaColumns, Dict[Tuple[str, Type[Any]], Optional[Callable[[Any], Any]]]]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -90,7 +98,7 @@ class Schema:
             stored_schema["description"] = self._schema_description
 
         # bump version if modified
-        utils.bump_version_if_modified(stored_schema)
+        self._version_cache = utils.bump_version_if_modified(stored_schema)
         # remove defaults after bumping version
         if remove_defaults:
             utils.remove_defaults(stored_schema)
@@ -113,33 +121,17 @@ class Schema:
             # most of the schema do not use them
             return row
 
-        def _exclude(path: str, excludes: Sequence[REPattern], includes: Sequence[REPattern]) -> bool:
-            is_included = False
-            is_excluded = any(exclude.search(path) for exclude in excludes)
+        filters, excluded_columns = self._get_row_filters(table_name)
+        if not filters:
+            return row
+        for field_name in list(row.keys()):
+            # exclusion of a column is computed once per table
+            is_excluded = excluded_columns.get(field_name)
+            if is_excluded is None:
+                is_excluded = excluded_columns[field_name] = self._is_column_excluded(filters, field_name)
             if is_excluded:
-                # we may have exception if explicitly included
-                is_included = any(include.search(path) for include in includes)
-            return is_excluded and not is_included
-
-        # break table name in components
-        branch = self.naming.break_path(table_name)
-
-        # check if any of the rows is excluded by rules in any of the tables
-        for i in range(len(branch), 0, -1):  # stop is exclusive in `range`
-            # start at the top level table
-            c_t = self.naming.make_path(*branch[:i])
-            excludes = self._compiled_excludes.get(c_t)
-            # only if there's possibility to exclude, continue
-            if excludes:
-                includes = self._compiled_includes.get(c_t) or []
-                for field_name in list(row.keys()):
-                    path = self.naming.make_path(*branch[i:], field_name)
-                    if _exclude(path, excludes, includes):
-                        # TODO: copy to new instance
-                        del row[field_name]  # type: ignore
-            # if row is empty, do not process further
-            if not row:
-                break
+                # TODO: copy to new instance
+                del row[field_name]  # type: ignore
         return row
 
     def coerce_row(self, table_name: str, parent_table: str, row: StrAny) -> Tuple[DictStrAny, TPartialTableSchema]:
@@ -149,6 +141,7 @@ class Schema:
         if not table:
             table = utils.new_table(table_name, parent_table)
         table_columns = table["columns"]
+        coercers = self._get_table_coercers(table_name, table_columns)
 
         new_row: DictStrAny = {}
         for col_name, v in row.items():
@@ -157,8 +150,24 @@ class Schema:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
             else:
+                # use coercer compiled for existing column and type of the value
+                coercer_key = (col_name, type(v))
+                if coercer_key in coercers:
+                    coercer = coercers[coercer_key]
+                    if coercer is None:
+                        new_row[col_name] = v
+                        continue
+                    try:
+                        new_row[col_name] = coercer(v)
+                        continue
+                    except (ValueError, SyntaxError):
+                        # value may still go to a variant column
+                        pass
                 new_col_name, new_col_def, new_v = self._coerce_non_null_value(table_columns, table_name, col_name, v)
                 new_row[new_col_name] = new_v
+                # callable values may be variants so they are never compiled
+                if not new_col_def and new_col_name == col_name and not callable(v):
+                    coercers[coercer_key] = self._compile_coercer(table_columns[col_name]["data_type"], coercer_key[1])
                 if new_col_def:
                     if not updated_table_partial:
                         # create partial table with only the new columns
@@ -185,11 +194,15 @@ class Schema:
         else:
             # merge tables performing additional checks
             partial_table = utils.merge_tables(table, partial_table)
+        # columns changed so drop compiled coercers
+        self._compiled_coercers.pop(table_name, None)
+        self._mark_modified()
         return partial_table
 
     def bump_version(self) -> Tuple[int, str]:
         """Computes schema hash in order to check if schema content was modified. In such case the schema ``stored_version`` and ``stored_version_hash`` are updated.
 
+        Always recomputes the hash so it must be called after schema content (ie. ``tables`` or ``settings``) was modified directly, without using the schema methods.
         Should not be used in production code. The method ``to_dict`` will generate TStoredSchema with correct value, only once before persisting schema to storage.
 
         Returns:
@@ -197,6 +210,7 @@ class Schema:
         """
         version = utils.bump_version_if_modified(self.to_dict())
         self._stored_version, self._stored_version_hash = version
+        self._version_cache = version
         return version
 
     def filter_row_with_hint(self, table_name: str, hint_type: TColumnHint, row: StrAny) -> StrAny:
@@ -274,17 +288,25 @@ class Schema:
         return [t for t in self._schema_tables.values() if t["name"].startswith("_dlt")]
 
     def get_preferred_type(self, col_name: str) -> Optional[TDataType]:
-        return next((m[1] for m in self._compiled_preferred_types if m[0].search(col_name)), None)
+        try:
+            return self._preferred_types_cache[col_name]
+        except KeyError:
+            preferred_type = next((m[1] for m in self._compiled_preferred_types if m[0].search(col_name)), None)
+            self._preferred_types_cache[col_name] = preferred_type
+            return preferred_type
 
     @property
     def version(self) -> int:
         """Version of the schema content that takes into account changes from the time of schema loading/creation.
         The stored version is increased by one if content was modified
 
+        The version is computed only if the content was modified via schema methods since last computation. Call ``bump_version`` if
+        the content was modified directly.
+
         Returns:
             int: Current schema version
         """
-        return utils.bump_version_if_modified(self.to_dict())[0]
+        return self._get_current_version()[0]
 
     @property
     def stored_version(self) -> int:
@@ -297,7 +319,8 @@ class Schema:
 
     @property
     def version_hash(self) -> str:
-        return utils.bump_version_if_modified(self.to_dict())[1]
+        """Version hash of the current schema content, computed like the ``version``"""
+        return self._get_current_version()[1]
 
     @property
     def stored_version_hash(self) -> str:
@@ -328,6 +351,16 @@ class Schema:
         d = deepcopy(self.to_dict())
         return Schema.from_dict(d)  # type: ignore
 
+    def _get_current_version(self) -> Tuple[int, str]:
+        if self._version_cache is None:
+            # computes version and hash of the current content
+            self.to_dict()
+        return self._version_cache
+
+    def _mark_modified(self) -> None:
+        """Marks schema content as modified so version and version hash are recomputed on next access"""
+        self._version_cache = None
+
     def _infer_column(self, k: str, v: Any, data_type: TDataType = None, is_variant: bool = False) -> TColumnSchema:
         column_schema =  TColumnSchema(
             name=k,
@@ -341,6 +374,46 @@ class Schema:
             column_schema["variant"] = is_variant
         return column_schema
 
+    def _get_row_filters(self, table_name: str) -> Tuple[List[Tuple[Sequence[str], Sequence[REPattern], Sequence[REPattern]]], Dict[str, bool]]:
+        """Gets filters of `table_name` and all its parent tables with memoized column exclusions"""
+        compiled = self._compiled_row_filters.get(table_name)
+        if compiled is None:
+            filters: List[Tuple[Sequence[str], Sequence[REPattern], Sequence[REPattern]]] = []
+            # break table name in components
+            branch = self.naming.break_path(table_name)
+            for i in range(len(branch), 0, -1):  # stop is exclusive in `range`
+                # start at the top level table
+                c_t = self.naming.make_path(*branch[:i])
+                excludes = self._compiled_excludes.get(c_t)
+                # only if there's possibility to exclude, keep the filters
+                if excludes:
+                    filters.append((branch[i:], excludes, self._compiled_includes.get(c_t) or []))
+            compiled = self._compiled_row_filters[table_name] = (filters, {})
+        return compiled
+
+    def _is_column_excluded(self, filters: List[Tuple[Sequence[str], Sequence[REPattern], Sequence[REPattern]]], field_name: str) -> bool:
+        for branch, excludes, includes in filters:
+            path = self.naming.make_path(*branch, field_name)
+            # we may have exception if explicitly included
+            if any(exclude.search(path) for exclude in excludes) and not any(include.search(path) for include in includes):
+                return True
+        return False
+
+    def _get_table_coercers(self, table_name: str, table_columns: TTableSchemaColumns) -> Dict[Tuple[str, Type[Any]], Optional[Callable[[Any], Any]]]:
+        compiled = self._compiled_coercers.get(table_name)
+        # table may have been replaced without update_schema
+        if compiled is None or compiled[0] is not table_columns:
+            compiled = self._compiled_coercers[table_name] = (table_columns, {})
+        return compiled[1]
+
+    @staticmethod
+    def _compile_coercer(col_type: TDataType, py_type: Type[Any]) -> Optional[Callable[[Any], Any]]:
+        """Returns function that coerces values of `py_type` into `col_type` or None if values do not need coercion"""
+        sc_type = py_type_to_sc_type(py_type)
+        if sc_type == col_type and col_type != "complex" and (col_type != "binary" or py_type is bytes):
+            return None
+        return partial(coerce_value, col_type, sc_type)
+
     def _coerce_null_value(self, table_columns: TTableSchemaColumns, table_name: str, col_name: str) -> None:
         """Raises when column is explicitly not nullable"""
         if col_name in table_columns:
@@ -442,14 +515,18 @@ class Schema:
         self._stored_version = 1
         self._stored_version_hash: str = None
         self._imported_version_hash: str = None
+        self._version_cache: Optional[Tuple[int, str]] = None
         self._schema_description: str = None
 
         self._settings: TSchemaSettings = {}
         self._compiled_preferred_types: List[Tuple[REPattern, TDataType]] = []
+        self._preferred_types_cache: Dict[str, Optional[TDataType]] = {}
         self._compiled_hints: Dict[TColumnHint, Sequence[REPattern]] = {}
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
+        self._compiled_row_filters: Dict[str, Tuple[List[Tuple[Sequence[str], Sequence[REPattern], Sequence[REPattern]]], Dict[str, bool]]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._compiled_coercers: Dict[str, Tuple[TTableSchemaColumns, Dict[Tuple[str, Type[Any]], Optional[Callable[[Any], Any]]]]] = {}
 
         self._normalizers_config: TNormalizersConfig = normalizers
         self.naming = None
@@ -489,8 +566,15 @@ class Schema:
             else:
                 raise InvalidSchemaName(name, normalized_name)
         self._schema_name = name
+        self._mark_modified()
 
     def _compile_settings(self) -> None:
+        # settings or tables may have changed
+        self._mark_modified()
+        # preferred types may change so drop resolved column names
+        self._preferred_types_cache = {}
+        # filters may change so drop resolved columns
+        self._compiled_row_filters = {}
         # if self._settings:
         for pattern, dt in self._settings.get("preferred_types", {}).items():
             # add tuples to be searched in coercions
@@ -28,10 +28,16 @@ class DataItemStorage(ABC):
     def close_writers(self, extract_id: str) -> None:
         # flush and close all files
         for name, writer in self.buffered_writers.items():
-            if name.startswith(extract_id):
+            if name.startswith(extract_id) and not writer.closed:
                 logger.debug(f"Closing writer for {name} with file {writer._file} and actual name {writer._file_name}")
                 writer.close()
 
+    def rotate_files(self, extract_id: str) -> None:
+        # flush and close current files, writers stay open and will write new files
+        for name, writer in self.buffered_writers.items():
+            if name.startswith(extract_id) and not writer.closed:
+                writer.rotate_file()
+
     def closed_files(self) -> List[str]:
         files: List[str] = []
         for writer in self.buffered_writers.values():
@@ -1,12 +1,14 @@
 import contextlib
+import threading
 from copy import deepcopy
 import os
+import shutil
 import datetime  # noqa: 251
 import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
 from dlt.common import json, pendulum
 from dlt.common.configuration import known_sections
@@ -21,7 +23,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -122,6 +124,36 @@ class LoadPackageInfo(NamedTuple):
         return self.asstr(verbosity=0)
 
 
+class LoadPackageJobsIndex:
+    """Index of job files in a single load package by state and table name. Built once from the job folders and then updated on each job transition
+    done via `LoadStorage` so the state of jobs may be queried without listing and stating the job files.
+    """
+    def __init__(self) -> None:
+        self._states: Dict[str, TJobState] = {}
+        """Job file name -> state"""
+        self._tables: Dict[str, Set[str]] = {}
+        """Table name -> job file names"""
+
+    def add(self, file_name: str, state: TJobState) -> None:
+        self._states[file_name] = state
+        self._tables.setdefault(ParsedLoadJobFileName.parse(file_name).table_name, set()).add(file_name)
+
+    def move(self, file_name: str, state: TJobState, new_file_name: str = None) -> None:
+        if new_file_name and new_file_name != file_name:
+            self.remove(file_name)
+            self.add(new_file_name, state)
+        else:
+            self._states[file_name] = state
+
+    def remove(self, file_name: str) -> None:
+        if self._states.pop(file_name, None) is not None:
+            self._tables[ParsedLoadJobFileName.parse(file_name).table_name].discard(file_name)
+
+    def jobs_for_table(self, table_name: str) -> List[Tuple[TJobState, str]]:
+        """Returns a list of (state, job file name) of all jobs for `table_name`"""
+        return [(self._states[file_name], file_name) for file_name in self._tables.get(table_name, ())]
+
+
 class LoadStorage(DataItemStorage, VersionedStorage):
 
     STORAGE_VERSION = "1.0.0"
@@ -139,6 +171,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
     PACKAGE_COMPLETED_FILE_NAME = "package_completed.json"  # completed package marker file, currently only to store data with os.stat
 
     ALL_SUPPORTED_FILE_FORMATS: Set[TLoaderFileFormat] = set(get_args(TLoaderFileFormat))
+    CONCATENABLE_FILE_FORMATS: Set[TLoaderFileFormat] = {"jsonl"}  # formats where files may be combined by concatenation
 
     @with_config(spec=LoadStorageConfiguration, sections=(known_sections.LOAD,))
     def __init__(
@@ -154,6 +187,9 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             raise TerminalValueError(preferred_file_format)
         self.supported_file_formats = supported_file_formats
         self.config = config
+        self._jobs_indexes: Dict[str, LoadPackageJobsIndex] = {}
+        """Indexes of jobs in packages being loaded, created on first query"""
+        self._jobs_indexes_lock = threading.Lock()
         super().__init__(
             preferred_file_format,
             LoadStorage.STORAGE_VERSION,
@@ -237,8 +273,14 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         return self.storage.list_folder_files(self._get_job_folder_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
 
     def list_jobs_for_table(self, load_id: str, table_name: str) -> Sequence[LoadJobInfo]:
-        info = self.get_load_package_info(load_id)
-        return [job for job in flatten_list_or_items(iter(info.jobs.values())) if job.job_file_info.table_name == table_name]  # type: ignore
+        return [
+            self._read_job_file_info(state, self._get_job_file_path(load_id, state, file_name))
+            for state, file_name in self._get_jobs_index(load_id).jobs_for_table(table_name)
+        ]
+
+    def list_job_states_for_table(self, load_id: str, table_name: str) -> Sequence[Tuple[TJobState, ParsedLoadJobFileName]]:
+        """Returns states and parsed file names of all jobs for `table_name` in package `load_id`. Does not access job files"""
+        return [(state, ParsedLoadJobFileName.parse(file_name)) for state, file_name in self._get_jobs_index(load_id).jobs_for_table(table_name)]
 
     def list_completed_failed_jobs(self, load_id: str) -> Sequence[str]:
         return self.storage.list_folder_files(self._get_job_folder_completed_path(load_id, LoadStorage.FAILED_JOBS_FOLDER))
@@ -310,6 +352,60 @@ class LoadStorage(DataItemStorage, VersionedStorage):
     def add_new_job(self, load_id: str, job_file_path: str, job_state: TJobState = "new_jobs") -> None:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
         self.storage.atomic_import(job_file_path, self._get_job_folder_path(load_id, job_state))
+        with self._jobs_indexes_lock:
+            if load_id in self._jobs_indexes:
+                self._jobs_indexes[load_id].add(FileStorage.get_file_name_from_file_path(job_file_path), job_state)
+
+    def coalesce_new_jobs(self, load_id: str, max_file_size: int) -> int:
+        """Combines new job files of the same table that are smaller than `max_file_size` bytes into files of up to `max_file_size`.
+        Only files in concatenable formats that were not yet retried are combined. Returns the number of jobs removed from the package.
+        """
+        new_jobs_folder = self._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER)
+        groups: Dict[Tuple[str, TLoaderFileFormat, bool], List[Tuple[str, int]]] = {}
+        for job_file in self.list_new_jobs(load_id):
+            job_info = ParsedLoadJobFileName.parse(job_file)
+            if job_info.file_format not in LoadStorage.CONCATENABLE_FILE_FORMATS or job_info.retry_count > 0:
+                continue
+            file_size = os.path.getsize(self.storage.make_full_path(job_file))
+            if file_size >= max_file_size:
+                continue
+            # gzip members may be concatenated but must not be mixed with uncompressed files
+            with self.storage.open_file(job_file, "rb") as f:
+                is_compressed = f.read(2) == b"\x1f\x8b"
+            groups.setdefault((job_info.table_name, job_info.file_format, is_compressed), []).append((job_file, file_size))
+
+        removed_jobs = 0
+        for (table_name, file_format, is_compressed), job_files in groups.items():
+            batches: List[List[str]] = [[]]
+            batch_size = 0
+            for job_file, file_size in job_files:
+                if batch_size + file_size > max_file_size and batches[-1]:
+                    batches.append([])
+                    batch_size = 0
+                batches[-1].append(job_file)
+                batch_size += file_size
+            for batch in batches:
+                if len(batch) < 2:
+                    continue
+                file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, file_format).job_id()
+                # write combined file outside of the new jobs folder so it is not picked up before it is complete
+                temp_path = join(self.get_package_path(load_id), file_name)
+                with self.storage.open_file(temp_path, "wb") as f:
+                    for job_file in batch:
+                        with self.storage.open_file(job_file, "rb") as src:
+                            shutil.copyfileobj(src, f)
+                            # separate the lines of consecutive files
+                            if not is_compressed and src.tell() > 0:
+                                src.seek(-1, os.SEEK_END)
+                                if src.read(1) != b"\n":
+                                    f.write(b"\n")
+                self.storage.atomic_rename(temp_path, join(new_jobs_folder, file_name))
+                for job_file in batch:
+                    self.storage.delete(job_file)
+                removed_jobs += len(batch) - 1
+        if removed_jobs:
+            self._drop_jobs_index(load_id)
+        return removed_jobs
 
     def start_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(load_id, LoadStorage.NEW_JOBS_FOLDER, LoadStorage.STARTED_JOBS_FOLDER, file_name)
@@ -335,6 +431,7 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         return self._move_job(load_id, LoadStorage.STARTED_JOBS_FOLDER, LoadStorage.COMPLETED_JOBS_FOLDER, file_name)
 
     def complete_load_package(self, load_id: str, aborted: bool) -> None:
+        self._drop_jobs_index(load_id)
         load_path = self.get_package_path(load_id)
         has_failed_jobs = len(self.list_failed_jobs(load_id)) > 0
         # delete completed jobs
@@ -382,9 +479,27 @@ class LoadStorage(DataItemStorage, VersionedStorage):
         load_path = self.get_package_path(load_id)
         dest_path = join(load_path, dest_folder, new_file_name or file_name)
         self.storage.atomic_rename(join(load_path, source_folder, file_name), dest_path)
-        # print(f"{join(load_path, source_folder, file_name)} -> {dest_path}")
+        with self._jobs_indexes_lock:
+            if load_id in self._jobs_indexes:
+                self._jobs_indexes[load_id].move(file_name, dest_folder, new_file_name)
         return self.storage.make_full_path(dest_path)
 
+    def _get_jobs_index(self, load_id: str) -> LoadPackageJobsIndex:
+        with self._jobs_indexes_lock:
+            index = self._jobs_indexes.get(load_id)
+            if index is None:
+                index = LoadPackageJobsIndex()
+                for state in WORKING_FOLDERS:
+                    for file_name in self.storage.list_folder_files(self._get_job_folder_path(load_id, state), to_root=False):
+                        if not file_name.endswith(".exception"):
+                            index.add(file_name, state)
+                self._jobs_indexes[load_id] = index
+            return index
+
+    def _drop_jobs_index(self, load_id: str) -> None:
+        with self._jobs_indexes_lock:
+            self._jobs_indexes.pop(load_id, None)
+
     def _get_job_folder_path(self, load_id: str, folder: TJobState) -> str:
         return join(self.get_package_path(load_id), folder)
 
@@ -18,6 +18,7 @@ class NormalizeStorage(VersionedStorage):
 
     STORAGE_VERSION: ClassVar[str] = "1.0.0"
     EXTRACTED_FOLDER: ClassVar[str] = "extracted"  # folder within the volume where extracted files to be normalized are stored
+    EXTRACTED_FILE_EXTENSIONS: ClassVar[Sequence[str]] = ("jsonl", "pickle")  # extensions of the extracted files
 
     @with_config(spec=NormalizeStorageConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(self, is_owner: bool, config: NormalizeStorageConfiguration = config.value) -> None:
@@ -47,7 +48,7 @@ class NormalizeStorage(VersionedStorage):
     @staticmethod
     def parse_normalize_file_name(file_name: str) -> TParsedNormalizeFileName:
         # parse extracted file name and returns (events found, load id, schema_name)
-        if not file_name.endswith("jsonl"):
+        if not file_name.endswith(NormalizeStorage.EXTRACTED_FILE_EXTENSIONS):
             raise ValueError(file_name)
 
         parts = Path(file_name).stem.split(".")
@@ -138,6 +138,10 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
     def native_connection(self) -> bigquery.Client:
         return self._client
 
+    def is_connection_alive(self) -> bool:
+        # client is stateless and reconnects on each request, but the session of unfinished transaction may expire
+        return self._client is not None and self._session_query is None
+
     def has_dataset(self) -> bool:
         try:
             self._client.get_dataset(self.fully_qualified_dataset_name(escape=False), retry=self._default_retry, timeout=self.credentials.http_timeout)
@@ -17,8 +17,9 @@ def _configure(config: DuckDbClientConfiguration = config.value) -> DuckDbClient
 
 def capabilities() -> DestinationCapabilitiesContext:
     caps = DestinationCapabilitiesContext()
-    caps.preferred_loader_file_format = "insert_values"
-    caps.supported_loader_file_formats = ["insert_values", "sql"]
+    # jsonl and parquet files are ingested natively with read_json and read_parquet
+    caps.preferred_loader_file_format = "jsonl"
+    caps.supported_loader_file_formats = ["jsonl", "insert_values", "parquet", "sql"]
     caps.escape_identifier = escape_postgres_identifier
     caps.escape_literal = escape_duckdb_literal
     caps.max_identifier_length = 65536
@@ -1,9 +1,14 @@
-from typing import ClassVar, Dict, Optional
+import os
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 from dlt.common.arithmetics import DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
+from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
+from dlt.common.schema.typing import TTableSchema
+from dlt.common.schema.utils import is_complete_column
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 
@@ -41,6 +46,61 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {
 }
 
 
+def _escape_string(v: str) -> str:
+    return "'" + v.replace("'", "''") + "'"
+
+
+class DuckDbCopyJob(LoadJob, FollowupJob):
+    def __init__(self, table: TTableSchema, file_path: str, sql_client: DuckDbSqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        self._sql_client = sql_client
+        write_disposition = table["write_disposition"]
+        file_format = os.path.splitext(file_path)[1][1:]
+        # ingest the file immediately
+        with self._sql_client.with_staging_dataset(write_disposition=="merge"):
+            qualified_table_name = sql_client.make_qualified_table_name(table["name"])
+            with self._sql_client.begin_transaction():
+                if write_disposition == "replace":
+                    self._sql_client.execute_sql(f"DELETE FROM {qualified_table_name};")
+                if file_format == "parquet":
+                    columns, select_sql = self._read_parquet_sql(file_path)
+                else:
+                    columns, select_sql = self._read_json_sql(table, file_path)
+                columns_sql = ",".join(map(sql_client.capabilities.escape_identifier, columns))
+                self._sql_client.execute_sql(f"INSERT INTO {qualified_table_name} ({columns_sql}) {select_sql};")
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+    def _read_json_sql(self, table: TTableSchema, file_path: str) -> Tuple[List[str], str]:
+        escape_identifier = self._sql_client.capabilities.escape_identifier
+        columns = [c for c in table["columns"].values() if is_complete_column(c)]
+        json_types: List[str] = []
+        select_columns: List[str] = []
+        for c in columns:
+            if c["data_type"] == "binary":
+                # binary values are base64 encoded in json
+                json_types.append(f"{_escape_string(c['name'])}: 'VARCHAR'")
+                select_columns.append(f"from_base64({escape_identifier(c['name'])})")
+            else:
+                json_types.append(f"{_escape_string(c['name'])}: {_escape_string(DuckDbClient._to_db_type(c['data_type']))}")
+                select_columns.append(escape_identifier(c["name"]))
+        # columns with types from the schema, keys missing in a document are NULL
+        select_sql = f"SELECT {','.join(select_columns)} FROM read_json({_escape_string(file_path)}, format='newline_delimited', columns={{{','.join(json_types)}}})"
+        return [c["name"] for c in columns], select_sql
+
+    def _read_parquet_sql(self, file_path: str) -> Tuple[List[str], str]:
+        # parquet files keep the column types, take only the columns present in the file
+        from_sql = f"FROM read_parquet({_escape_string(file_path)})"
+        columns = [row[0] for row in self._sql_client.execute_sql(f"DESCRIBE SELECT * {from_sql}")]
+        return columns, f"SELECT * {from_sql}"
+
+
 class DuckDbClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -55,6 +115,12 @@ class DuckDbClient(InsertValuesJobClient):
         self.sql_client: DuckDbSqlClient = sql_client  # type: ignore
         self.active_hints = HINT_TO_POSTGRES_ATTR if self.config.create_indexes else {}
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        if os.path.splitext(file_path)[1][1:] in ("jsonl", "parquet"):
+            # ingest with duckdb table functions, executed atomically like insert values job so it is restored as completed
+            return DuckDbCopyJob(table, file_path, self.sql_client)
+        return super().start_file_load(table, file_path, load_id)
+
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
         hints_str = " ".join(self.active_hints.get(h, "") for h in self.active_hints.keys() if c.get(h, False) is True)
         column_name = self.capabilities.escape_identifier(c["name"])
@@ -91,6 +91,16 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
     def native_connection(self) -> duckdb.DuckDBPyConnection:
         return self._conn
 
+    def is_connection_alive(self) -> bool:
+        if self._conn is None:
+            return False
+        # duckdb runs in process so the query is cheap, it fails if connection or the database were closed
+        try:
+            self._conn.execute("SELECT 1;")
+            return True
+        except duckdb.Error:
+            return False
+
     def has_dataset(self) -> bool:
         query = """
                 SELECT 1
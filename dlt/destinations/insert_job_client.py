@@ -1,6 +1,9 @@
 import os
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterator, List
 
+from dlt.common.data_writers.writers import InsertValuesWriter
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
 from dlt.common.storages import FileStorage
@@ -17,7 +20,8 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
         # insert file content immediately
         with self._sql_client.with_staging_dataset(write_disposition=="merge"):
             with self._sql_client.begin_transaction():
-                for fragments in self._insert(sql_client.make_qualified_table_name(table_name), write_disposition, file_path):
+                # next chunk is read and prepared while the current one is executed
+                for fragments in self._read_ahead(self._insert(sql_client.make_qualified_table_name(table_name), write_disposition, file_path)):
                     self._sql_client.execute_fragments(fragments)
 
     def state(self) -> TLoadJobState:
@@ -28,18 +32,57 @@ class InsertValuesLoadJob(LoadJob, FollowupJob):
         # this part of code should be never reached
         raise NotImplementedError()
 
+    @staticmethod
+    def _read_ahead(chunks: Iterator[List[str]]) -> Iterator[List[str]]:
+        """Yields from `chunks` while next element is produced in a thread. Database drivers release GIL when waiting for query results
+        so reading the file overlaps with query execution.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="insert_read_ahead") as pool:
+            next_chunk = pool.submit(next, chunks, None)
+            while (chunk := next_chunk.result()) is not None:
+                next_chunk = pool.submit(next, chunks, None)
+                yield chunk
+
     def _insert(self, qualified_table_name: str, write_disposition: TWriteDisposition, file_path: str) -> Iterator[List[str]]:
         # WARNING: maximum redshift statement is 16MB https://docs.aws.amazon.com/redshift/latest/dg/c_redshift-sql.html
-        # the procedure below will split the inserts into max_query_length // 2 packs
+        # the writer splits rows into statements of max_query_length // 2 so each statement is executed separately
+        insert_sql: List[str] = []
+        if write_disposition == "replace":
+            insert_sql.append("DELETE FROM {};".format(qualified_table_name))
+        boundary = InsertValuesWriter.STATEMENT_BOUNDARY.encode("utf-8")
+        with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if m.find(boundary) == -1 and file_size > self._sql_client.capabilities.max_query_length // 2:
+                    # file with a single long statement ie. written without max query length
+                    yield from self._insert_split_rows(qualified_table_name, insert_sql, file_path)
+                    return
+                with memoryview(m) as view:
+                    start = 0
+                    while start < file_size:
+                        end = m.find(boundary, start)
+                        # include the ; in the statement
+                        end = file_size if end == -1 else end + 1
+                        # decode statement directly from mapped file, slice must be released before the file is unmapped
+                        with view[start:end] as statement_view:
+                            statement = str(statement_view, "utf-8")
+                        header_end = statement.index("\n")
+                        # properly formatted statement has a values marker after the header
+                        assert statement.startswith("\nVALUES\n", header_end)
+                        insert_sql.extend([statement[:header_end].format(qualified_table_name), statement[header_end:]])
+                        yield insert_sql
+                        insert_sql = []
+                        # skip new line after ;
+                        start = end + 1
+
+    def _insert_split_rows(self, qualified_table_name: str, insert_sql: List[str], file_path: str) -> Iterator[List[str]]:
+        """Splits a single statement in `file_path` into max_query_length // 2 packs of rows"""
         with open(file_path, "r", encoding="utf-8") as f:
             header = f.readline()
             values_mark = f.readline()
             # properly formatted file has a values marker at the beginning
             assert values_mark == "VALUES\n"
 
-            insert_sql = []
-            if write_disposition == "replace":
-                insert_sql.append("DELETE FROM {};".format(qualified_table_name))
             while content := f.read(self._sql_client.capabilities.max_query_length // 2):
                 # write INSERT
                 insert_sql.extend([header.format(qualified_table_name), values_mark, content])
@@ -152,6 +152,9 @@ class SqlJobClientBase(JobClientBase):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: TracebackType) -> None:
         self.sql_client.close_connection()
 
+    def is_alive(self) -> bool:
+        return self.sql_client.is_connection_alive()
+
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
 
         def _null_to_bool(v: str) -> bool:
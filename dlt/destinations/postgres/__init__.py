@@ -18,8 +18,9 @@ def _configure(config: PostgresClientConfiguration = config.value) -> PostgresCl
 def capabilities() -> DestinationCapabilitiesContext:
     # https://www.postgresql.org/docs/current/limits.html
     caps = DestinationCapabilitiesContext()
-    caps.preferred_loader_file_format = "insert_values"
-    caps.supported_loader_file_formats = ["insert_values", "sql"]
+    # csv files are bulk loaded with COPY which is much faster than parsing INSERT statements
+    caps.preferred_loader_file_format = "csv"
+    caps.supported_loader_file_formats = ["csv", "insert_values", "sql"]
     caps.escape_identifier = escape_postgres_identifier
     caps.escape_literal = escape_postgres_literal
     caps.max_identifier_length = 63
@@ -9,12 +9,17 @@ else:
     from psycopg2.sql import SQL, Composed
 
 
+import os
+import csv
 from typing import ClassVar, Dict, Optional
 
 from dlt.common.arithmetics import DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
+from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
+from dlt.common.schema.typing import TTableSchema, TWriteDisposition
+from dlt.common.storages import FileStorage
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 
@@ -51,6 +56,32 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {
     "unique": "UNIQUE"
 }
 
+
+class PostgresCopyLoadJob(LoadJob, FollowupJob):
+    def __init__(self, table_name: str, write_disposition: TWriteDisposition, file_path: str, sql_client: Psycopg2SqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        self._sql_client = sql_client
+        # stream the csv file immediately
+        with self._sql_client.with_staging_dataset(write_disposition=="merge"):
+            qualified_table_name = sql_client.make_qualified_table_name(table_name)
+            with self._sql_client.begin_transaction():
+                if write_disposition == "replace":
+                    self._sql_client.execute_sql(f"DELETE FROM {qualified_table_name};")
+                with open(file_path, "rb") as f:
+                    # header line contains column names, the rest of the file is passed to COPY as is
+                    headers = next(csv.reader([f.readline().decode("utf-8")]))
+                    columns = ",".join(map(sql_client.capabilities.escape_identifier, headers))
+                    self._sql_client.copy_expert(f"COPY {qualified_table_name} ({columns}) FROM STDIN WITH (FORMAT csv)", f)
+
+    def state(self) -> TLoadJobState:
+        # this job is always done
+        return "completed"
+
+    def exception(self) -> str:
+        # this part of code should be never reached
+        raise NotImplementedError()
+
+
 class PostgresClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -65,6 +96,12 @@ class PostgresClient(InsertValuesJobClient):
         self.sql_client = sql_client
         self.active_hints = HINT_TO_POSTGRES_ATTR if self.config.create_indexes else {}
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        if os.path.splitext(file_path)[1][1:] == "csv":
+            # bulk load with COPY, executed atomically like insert values job so it is restored as completed
+            return PostgresCopyLoadJob(table["name"], table["write_disposition"], file_path, self.sql_client)
+        return super().start_file_load(table, file_path, load_id)
+
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
         hints_str = " ".join(self.active_hints.get(h, "") for h in self.active_hints.keys() if c.get(h, False) is True)
         column_name = self.capabilities.escape_identifier(c["name"])
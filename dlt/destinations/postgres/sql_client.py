@@ -10,7 +10,7 @@ else:
     from psycopg2.sql import SQL, Identifier, Literal as SQLLiteral, Composed, Composable
 
 from contextlib import contextmanager
-from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
+from typing import IO, Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction
@@ -68,6 +68,10 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
     def native_connection(self) -> "psycopg2.connection":
         return self._conn
 
+    def is_connection_alive(self) -> bool:
+        # closed is set when connection is closed or lost
+        return self._conn is not None and not self._conn.closed
+
     def has_dataset(self) -> bool:
         query = """
                 SELECT 1
@@ -114,6 +118,12 @@ class Psycopg2SqlClient(SqlClientBase["psycopg2.connection"], DBTransaction):
         composed =  Composed(sql if isinstance(sql, Composable) else SQL(sql) for sql in fragments)
         return self.execute_sql(composed, *args, **kwargs)
 
+    @raise_database_error
+    def copy_expert(self, sql: AnyStr, f: IO[Any]) -> None:
+        """Executes COPY ... FROM STDIN `sql` statement streaming the content of file `f` from its current position"""
+        with self._conn.cursor() as curr:
+            curr.copy_expert(sql, f)
+
     def fully_qualified_dataset_name(self, escape: bool = True) -> str:
         return self.capabilities.escape_identifier(self.dataset_name) if escape else self.dataset_name
 
@@ -40,6 +40,11 @@ class SqlClientBase(ABC, Generic[TNativeConn]):
             raise AttributeError(name)
         return getattr(self.native_connection, name)
 
+    @abstractmethod
+    def is_connection_alive(self) -> bool:
+        """Checks if connection is open and may be reused to execute queries. Must not contact remote databases"""
+        pass
+
     def __enter__(self) -> "SqlClientBase[TNativeConn]":
         self.open_connection()
         return self
@@ -362,9 +362,9 @@ def resource(
     else:
         # take name from the generator
         source_section: str = None
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
-            func_module = inspect.getmodule(data.gi_frame)
+            func_module = inspect.getmodule(data.gi_frame if inspect.isgenerator(data) else data.ag_frame)
             source_section = _get_source_section_name(func_module)
 
         return make_resource(name, source_section, data)
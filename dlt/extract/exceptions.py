@@ -1,5 +1,5 @@
-from inspect import Signature, isgenerator
-from typing import Any, Set, Type
+from inspect import Signature, isasyncgen, isgenerator
+from typing import Any, List, Set, Type
 
 from dlt.common.exceptions import DltException
 from dlt.common.utils import get_callable_name
@@ -9,6 +9,14 @@ class ExtractorException(DltException):
     pass
 
 
+class ExtractWorkerException(ExtractorException):
+    def __init__(self, source_name: str, resource_names: List[str], exc_info: str) -> None:
+        self.source_name = source_name
+        self.resource_names = resource_names
+        self.exc_info = exc_info
+        super().__init__(f"Extraction of resources {resource_names} of source {source_name} in a worker process failed with:\n{exc_info}")
+
+
 class DltSourceException(DltException):
     pass
 
@@ -58,7 +66,7 @@ class ResourceExtractionError(PipeException):
     def __init__(self, pipe_name: str, gen: Any, msg: str, kind: str) -> None:
         self.msg = msg
         self.kind = kind
-        self.func_name = gen.__name__ if isgenerator(gen) else get_callable_name(gen) if callable(gen) else str(gen)
+        self.func_name = gen.__name__ if isgenerator(gen) or isasyncgen(gen) else get_callable_name(gen) if callable(gen) else str(gen)
         super().__init__(pipe_name, f"extraction of resource {pipe_name} in {kind} {self.func_name} caused an exception: {msg}")
 
 
@@ -245,3 +253,8 @@ class ExplicitSourceNameInvalid(DltSourceException):
 class IncrementalUnboundError(DltResourceException):
     def __init__(self, cursor_path: str) -> None:
         super().__init__("", f"The incremental definition with cursor path {cursor_path} is used without being bound to the resource. This most often happens when you create dynamic resource from a generator function that uses incremental. See https://dlthub.com/docs/general-usage/incremental-loading#incremental-loading-with-last-value for an example.")
+
+
+class ResourceNotBackfillable(DltResourceException):
+    def __init__(self, resource_name: str, msg: str) -> None:
+        super().__init__(resource_name, f"Resource {resource_name} cannot be backfilled in parallel ranges: {msg}")
@@ -1,33 +1,57 @@
 import contextlib
+import inspect
+import multiprocessing
 import os
-from typing import ClassVar, List
+import traceback
+from typing import Any, ClassVar, List, Optional, Sequence, Set, Tuple
 
+from dlt.common import logger
+from dlt.common.configuration import configspec
 from dlt.common.configuration.container import Container
+from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.resolve import inject_section
+from dlt.common.configuration.specs import BaseConfiguration
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
-from dlt.common.pipeline import _reset_resource_state
+from dlt.common.destination import TLoaderFileFormat
+from dlt.common.exceptions import TerminalValueError
+from dlt.common.pipeline import _reset_resource_state, pipeline_state, source_state
 
 from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
-from dlt.common.utils import uniq_id
-from dlt.common.typing import TDataItems, TDataItem
+from dlt.common.utils import graph_edges_to_nodes, uniq_id, update_dict_nested
+from dlt.common.typing import DictStrAny, TDataItems, TDataItem
 from dlt.common.schema import Schema, utils, TSchemaUpdate
 from dlt.common.storages import NormalizeStorageConfiguration, NormalizeStorage, DataItemStorage
 from dlt.common.configuration.specs import known_sections
 
 from dlt.extract.decorators import SourceSchemaInjectableContext
-from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints
+from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, ExtractWorkerException, ResourceNotBackfillable
+from dlt.extract.incremental import Incremental, IncrementalColumnState, IncrementalRange, IncrementalResourceWrapper
 from dlt.extract.pipe import PipeIterator
 from dlt.extract.source import DltResource, DltSource
 from dlt.extract.typing import TableNameMeta
 
 
+@configspec
+class ExtractorConfiguration(BaseConfiguration):
+    process_workers: int = 1
+    """Number of processes that extract independent groups of resources (strongly connected components) of a source. With 1 all resources are extracted in the current process"""
+    file_format: TLoaderFileFormat = "puae-jsonl"
+    """Format of the files passed from extract to normalize: `puae-jsonl` or `pickle` which preserves python types and does not need type encoding"""
+
+    __section__ = "extract"
+
+
 class ExtractorStorage(DataItemStorage, NormalizeStorage):
     EXTRACT_FOLDER: ClassVar[str] = "extract"
+    EXTRACT_FILE_FORMATS: ClassVar[Sequence[TLoaderFileFormat]] = ("puae-jsonl", "pickle")
 
-    def __init__(self, C: NormalizeStorageConfiguration) -> None:
-        # data item storage with jsonl with pua encoding
-        super().__init__("puae-jsonl", True, C)
+    @with_config(spec=ExtractorConfiguration)
+    def __init__(self, C: NormalizeStorageConfiguration, file_format: TLoaderFileFormat = "puae-jsonl") -> None:
+        if file_format not in ExtractorStorage.EXTRACT_FILE_FORMATS:
+            raise TerminalValueError(file_format)
+        # data item storage with jsonl with pua encoding or pickled lists of items
+        super().__init__(file_format, True, C)
         self.storage.create_folder(ExtractorStorage.EXTRACT_FOLDER, exists_ok=True)
 
     def create_extract_id(self) -> str:
@@ -149,13 +173,155 @@ def extract(
     return dynamic_tables
 
 
+# extract job shared with forked worker processes: extract id, source components, storage and pipe iterator settings
+_FORKED_EXTRACT: Tuple[str, Sequence[DltSource], ExtractorStorage, int, int] = None
+
+TComponentExtractRV = Tuple[TSchemaUpdate, DictStrAny, List[IncrementalColumnState], Optional[str]]
+
+
+def _closed_range_states(source: DltSource) -> List[IncrementalColumnState]:
+    """Returns the in-memory states of incrementals with `end_value` in the selected resources of `source`. Those are not stored in the resource state"""
+    states: List[IncrementalColumnState] = []
+    for resource in source.resources.selected.values():
+        incremental = resource.incremental
+        if isinstance(incremental, IncrementalResourceWrapper):
+            incremental = incremental._incremental
+        if incremental is not None and incremental.end_value is not None and incremental._cached_state is not None:
+            states.append(incremental._cached_state)
+    return states
+
+
+def backfill_components(source: DltSource, ranges: Sequence[IncrementalRange]) -> Tuple[Incremental[Any], List[DltSource]]:
+    """Creates a source component for each of the cursor `ranges` of the single incremental resource in `source`. Each component binds the resource
+    function to an `Incremental` with the closed range. Returns the `Incremental` used as a template and the components.
+    """
+    resources = list(source.resources.selected.values())
+    if len(resources) != 1:
+        raise ResourceNotBackfillable(",".join(source.resources.selected.keys()), "exactly one resource must be selected")
+    resource = resources[0]
+    wrapper = resource.incremental
+    if not isinstance(wrapper, IncrementalResourceWrapper) or resource.is_transformer or not callable(resource._pipe.gen):
+        raise ResourceNotBackfillable(resource.name, "pass a resource function with incremental argument without calling it")
+    gen = resource._pipe.gen
+    # regular functions are evaluated when resource is called and all the ranges would share the incremental
+    unwrapped_gen = inspect.unwrap(gen)
+    if not (inspect.isgeneratorfunction(unwrapped_gen) or inspect.isasyncgenfunction(unwrapped_gen)):
+        raise ResourceNotBackfillable(resource.name, "resource function must be a generator")
+    incremental_arg = IncrementalResourceWrapper.get_incremental_arg(inspect.signature(gen))
+    template: Incremental[Any] = wrapper._incremental
+    if template is None and incremental_arg is not None and isinstance(incremental_arg.default, Incremental):
+        template = incremental_arg.default
+    if incremental_arg is None or template is None:
+        raise ResourceNotBackfillable(resource.name, "resource function has no default incremental argument")
+
+    components: List[DltSource] = []
+    for cursor_range in ranges:
+        range_incremental = template.copy()
+        range_incremental.initial_value = cursor_range.start_value
+        range_incremental.end_value = cursor_range.end_value
+        range_resource = resource(**{incremental_arg.name: range_incremental})
+        components.append(DltSource(source.name, source.section, source.schema, [range_resource]))
+    return template, components
+
+
+def _extract_component(component_idx: int) -> TComponentExtractRV:
+    """Extracts a source component in a forked worker process. Returns partial tables, state of the component resources, states of closed incremental ranges
+    and formatted exception if extraction failed
+    """
+    extract_id, components, storage, max_parallel_items, workers = _FORKED_EXTRACT
+    component = components[component_idx]
+    try:
+        dynamic_tables = extract(extract_id, component, storage, max_parallel_items=max_parallel_items, workers=workers)
+    except Exception:
+        # exceptions raised in extract are not always picklable
+        return None, None, None, traceback.format_exc()
+    # send back the state of the resources in the component, the resources do not overlap with other components
+    resources_state: DictStrAny = None
+    _, writable = pipeline_state(Container())
+    if writable:
+        all_resources_state = source_state().get("resources", {})
+        component_resources = graph_edges_to_nodes(component.resources.selected_dag).keys()
+        resources_state = {name: all_resources_state[name] for name in component_resources if name in all_resources_state}
+    return dynamic_tables, resources_state, _closed_range_states(component), None
+
+
+def _merge_resources_state(component: DltSource, resources_state: DictStrAny, merged_resources: Set[str]) -> None:
+    """Merges the state of resources extracted in `component` into the source state. The state of a resource already merged from another component
+    ie. a backfill range of the same resource is merged recursively and its incremental states are merged with `merge_range_states`
+    """
+    all_resources_state = source_state().setdefault("resources", {})
+    for name, state in resources_state.items():
+        if name not in merged_resources:
+            all_resources_state[name] = state
+            merged_resources.add(name)
+            continue
+        incremental_states: DictStrAny = state.pop("incremental", {})
+        update_dict_nested(all_resources_state[name], state)
+        # use last value function of the resource incremental, max otherwise
+        incremental = component.resources[name].incremental if name in component.resources else None
+        if isinstance(incremental, IncrementalResourceWrapper):
+            incremental = incremental._incremental
+        for cursor_path, incremental_state in incremental_states.items():
+            last_value_func = incremental.last_value_func if incremental is not None and incremental.cursor_path == cursor_path else max
+            Incremental(cursor_path, last_value_func=last_value_func).merge_range_states(name, [incremental_state])
+
+
+def extract_components_parallel(
+    extract_id: str,
+    components: Sequence[DltSource],
+    storage: ExtractorStorage,
+    collector: Collector,
+    process_workers: int,
+    max_parallel_items: int,
+    workers: int
+) -> Tuple[List[TSchemaUpdate], List[IncrementalColumnState]]:
+    """Extracts each of the source `components` in a separate forked process, all into the same `extract_id`. Resource state written in the worker processes
+    is merged into the current state. Changes to source-scoped state made in the worker processes are discarded. Returns partial tables and the states of
+    closed incremental ranges from all components.
+    """
+    global _FORKED_EXTRACT
+
+    # components hold generators and closures that cannot be pickled so worker processes must be forked after this is set
+    _FORKED_EXTRACT = (extract_id, components, storage, max_parallel_items, workers)
+    try:
+        pool = multiprocessing.get_context("fork").Pool(processes=min(process_workers, len(components)))
+    finally:
+        _FORKED_EXTRACT = None
+
+    partials: List[TSchemaUpdate] = []
+    range_states: List[IncrementalColumnState] = []
+    merged_resources: Set[str] = set()
+    try:
+        collector.update("Components", 0, len(components))
+        results = [pool.apply_async(_extract_component, (idx, )) for idx in range(len(components))]
+        for component, result in zip(components, results):
+            while not result.ready():
+                result.wait(1.0)
+                signals.raise_if_signalled()
+            dynamic_tables, resources_state, component_range_states, exc_info = result.get()
+            if exc_info:
+                raise ExtractWorkerException(component.name, list(component.resources.selected.keys()), exc_info)
+            collector.update("Components")
+            partials.append(dynamic_tables)
+            range_states.extend(component_range_states)
+            if resources_state:
+                _merge_resources_state(component, resources_state, merged_resources)
+    finally:
+        pool.terminate()
+        pool.join()
+    return partials, range_states
+
+
+@with_config(spec=ExtractorConfiguration)
 def extract_with_schema(
     storage: ExtractorStorage,
     source: DltSource,
     schema: Schema,
     collector: Collector,
     max_parallel_items: int,
-    workers: int
+    workers: int,
+    process_workers: int = 1,
+    backfill_ranges: Sequence[IncrementalRange] = None
 ) -> str:
     # generate extract_id to be able to commit all the sources together later
     extract_id = storage.create_extract_id()
@@ -168,14 +334,42 @@ def extract_with_schema(
                     if resource.write_disposition == "replace":
                         _reset_resource_state(resource._name)
 
-            extractor = extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers)
+            if backfill_ranges:
+                # each range of the incremental resource is a separate component
+                backfill_incremental, components = backfill_components(source, backfill_ranges)
+            else:
+                components = source.decompose("scc") if process_workers > 1 else [source]
+            parallel = len(components) > 1 and process_workers > 1
+            if parallel and "fork" not in multiprocessing.get_all_start_methods():
+                logger.warning(f"Source {source.name} will be extracted in a single process: parallel extraction requires fork start method")
+                parallel = False
+            range_states: List[IncrementalColumnState] = []
+            if parallel:
+                with collector(f"Extract {source.name}"):
+                    extractors, range_states = extract_components_parallel(extract_id, components, storage, collector, process_workers, max_parallel_items, workers)
+            elif backfill_ranges:
+                # ranges share the resource incremental wrapper so they must be extracted one after another
+                wrapper: IncrementalResourceWrapper = next(iter(source.resources.selected.values())).incremental  # type: ignore[assignment]
+                resource_incremental = wrapper._incremental
+                extractors = []
+                try:
+                    for component in components:
+                        extractors.append(extract(extract_id, component, storage, collector, max_parallel_items=max_parallel_items, workers=workers))
+                        range_states.extend(_closed_range_states(component))
+                finally:
+                    # do not leave the incremental of the last range in the resource
+                    wrapper._incremental = resource_incremental
+            else:
+                extractors = [extract(extract_id, source, storage, collector, max_parallel_items=max_parallel_items, workers=workers)]
+            if backfill_ranges:
+                backfill_incremental.merge_range_states(next(iter(source.resources.selected)), range_states)
             # source iterates
             # TODO: implement a real check if source is exhausted. most of the resources should be not
             source.exhausted = True
             # iterate over all items in the pipeline and update the schema if dynamic table hints were present
-            for _, partials in extractor.items():
-                for partial in partials:
-                    schema.update_schema(schema.normalize_table_identifiers(partial))
+            for extractor in extractors:
+                for _, partials in extractor.items():
+                    for partial in partials:
+                        schema.update_schema(schema.normalize_table_identifiers(partial))
 
     return extract_id
-
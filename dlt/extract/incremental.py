@@ -1,12 +1,15 @@
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_origin, Sequence
+from typing import Generic, Literal, NamedTuple, TypeVar, Any, Optional, Callable, List, Set, TypedDict, get_origin, Sequence
+import math
+import hashlib
 import inspect
-from functools import wraps
-from datetime import datetime  # noqa: I251
+from functools import reduce, wraps
+from datetime import date, datetime  # noqa: I251
 
 import dlt
-from dlt.common.json import json
-from dlt.common.jsonpath import compile_path, find_values, JSONPath
-from dlt.common.typing import TDataItem, TDataItems, TFun, extract_inner_type, is_optional_type
+from dlt.common import logger
+from dlt.common.json import json, custom_encode
+from dlt.common.jsonpath import compile_path, extract_simple_field_name, find_values, JSONPath
+from dlt.common.typing import DictStrAny, TDataItem, TDataItems, TFun, extract_inner_type, is_optional_type
 from dlt.common.schema.typing import TColumnKey
 from dlt.common.configuration import configspec
 from dlt.common.configuration.specs import BaseConfiguration
@@ -21,14 +24,96 @@ from dlt.common import pendulum
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
 LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
+TUniqueHashesOverflow = Literal["drop", "bloom"]
 
 
-class IncrementalColumnState(TypedDict):
+class IncrementalRange(NamedTuple):
+    """Range of cursor values to be extracted: `start_value` is inclusive, `end_value` is exclusive and None if range is open"""
+    start_value: Optional[Any]
+    end_value: Optional[Any]
+
+
+class UniqueHashesBloomFilter:
+    """Bloom filter holding unique hashes of records. Stored in resource state via `asdict` and restored with `from_dict`"""
+    ERROR_RATE = 0.001
+
+    def __init__(self, capacity: int, bits: bytes = None, no_hashes: int = None) -> None:
+        self.size = max(8, math.ceil(-capacity * math.log(self.ERROR_RATE) / math.log(2) ** 2))
+        self.no_hashes = no_hashes or max(1, round(self.size / capacity * math.log(2)))
+        self.capacity = capacity
+        self.bits = bytearray(bits) if bits else bytearray((self.size + 7) // 8)
+        self.size = len(self.bits) * 8
+
+    def _positions(self, value: str) -> List[int]:
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.no_hashes)]
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, UniqueHashesBloomFilter):
+            other = other.asdict()
+        return self.asdict() == other
+
+    def asdict(self) -> DictStrAny:
+        return {"capacity": self.capacity, "no_hashes": self.no_hashes, "bits": bytes(self.bits)}
+
+    @classmethod
+    def from_dict(cls, d: DictStrAny) -> "UniqueHashesBloomFilter":
+        return cls(d["capacity"], d["bits"], d["no_hashes"])
+
+
+def split_range(start_value: TCursorValue, end_value: TCursorValue, windows: int) -> List[IncrementalRange]:
+    """Splits the range from `start_value` (inclusive) to `end_value` (exclusive) into at most `windows` adjacent, non overlapping ranges.
+    Works with integer, float, date and datetime values and with ISO 8601 date and timestamp strings. String ranges are split as dates or timestamps
+    and their bounds are returned as ISO strings so they may be compared with string cursor values.
+    """
+    if windows < 1:
+        raise ValueError(f"Range must be split into at least one window, got {windows}")
+    if isinstance(start_value, str) and isinstance(end_value, str):
+        try:
+            start_dt, end_dt = pendulum.parse(start_value, exact=True), pendulum.parse(end_value, exact=True)
+        except Exception:
+            raise ValueError(f"String range bounds must be ISO 8601 dates or timestamps, got {start_value} and {end_value}")
+        if not isinstance(start_dt, date) or not isinstance(end_dt, date):
+            raise ValueError(f"String range bounds must be ISO 8601 dates or timestamps, got {start_value} and {end_value}")
+        # keep the passed bounds as they are, encode the inner bounds like json does
+        encoded = {start_dt: start_value, end_dt: end_value}
+        return [
+            IncrementalRange(encoded.get(start) or custom_encode(start), encoded.get(end) or custom_encode(end))
+            for start, end in split_range(start_dt, end_dt, windows)
+        ]
+    try:
+        span = end_value - start_value
+    except TypeError:
+        raise ValueError(f"Range bounds must be int, float, date, datetime or ISO 8601 strings, got {type(start_value).__name__} and {type(end_value).__name__}")
+    if isinstance(span, int):
+        # round the window size up so integer ranges are not split into empty windows
+        step = -(-span // windows)
+        bounds = [min(start_value + step * i, end_value) for i in range(windows)]
+    else:
+        bounds = [start_value + span * i / windows for i in range(windows)]
+    bounds.append(end_value)
+    return [IncrementalRange(start, end) for start, end in zip(bounds, bounds[1:]) if start != end]
+
+
+class IncrementalColumnStateBase(TypedDict):
     initial_value: Optional[Any]
     last_value: Optional[Any]
     unique_hashes: List[str]
 
 
+class IncrementalColumnState(IncrementalColumnStateBase, total=False):
+    unique_hashes_bloom: Any
+    """Bloom filter with hashes that overflowed `unique_hashes`, present only in "bloom" overflow mode"""
+
+
 class IncrementalCursorPathMissing(PipeException):
     def __init__(self, pipe_name: str, json_path: str, item: TDataItem) -> None:
         self.json_path = json_path
@@ -37,6 +122,12 @@ class IncrementalCursorPathMissing(PipeException):
         super().__init__(pipe_name, msg)
 
 
+class IncrementalRangeInvalid(PipeException):
+    def __init__(self, pipe_name: str, cursor_path: str, msg: str) -> None:
+        self.cursor_path = cursor_path
+        super().__init__(pipe_name, f"Incremental range for cursor {cursor_path} is invalid: {msg}")
+
+
 class IncrementalPrimaryKeyMissing(PipeException):
     def __init__(self, pipe_name: str, primary_key_column: str, item: TDataItem) -> None:
         self.primary_key_column = primary_key_column
@@ -70,21 +161,38 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
     >>> r = some_data().add_step(dlt.sources.incremental("item.ts", initial_value=now, primary_key="delta"))
     >>> info = p.run(r, destination="duckdb")
 
+    The source may query only the items within the incremental range and let the `Incremental` skip the range checks. For example:
+    >>> @dlt.resource(primary_key='id')
+    >>> def some_data(created_at=dlt.sources.incremental('created_at', '2023-01-01T00:00:00Z'):
+    >>>    start_value, end_value = created_at.push_down()
+    >>>    yield from request_data(created_after=start_value, created_before=end_value)
+
+    When `end_value` is provided the range is closed and the incremental does not use the state: the items are extracted from `initial_value`
+    to `end_value` (exclusive). This lets you split a historical backfill into several ranges that are extracted independently.
+
     Args:
         cursor_path: The name or a JSON path to an cursor field. Uses the same names of fields as in your JSON document, before they are normalized to store in the database.
         initial_value: Optional value used for `last_value` when no state is available, e.g. on the first run of the pipeline. If not provided `last_value` will be `None` on the first run.
         last_value_func: Callable used to determine which cursor value to save in state. It is called with a list of the stored state value and all cursor vals from currently processing items. Default is `max`
         primary_key: Optional primary key used to deduplicate data. If not provided, a primary key defined by the resource will be used. Pass a tuple to define a compound key. Pass empty tuple to disable unique checks
+        end_value: Optional value where the extraction stops, items with the cursor at or past it are filtered out. Requires `initial_value`. The state is not read nor updated when set
+        max_unique_hashes: Optional maximum number of hashes of records with the current `last_value` kept in state for deduplication. Unlimited if not provided
+        unique_hashes_overflow: What happens when `max_unique_hashes` is exceeded: "drop" removes the oldest hashes, "bloom" moves the hashes into a bloom filter
+            sized for 10x `max_unique_hashes` records. Dropped hashes and bloom filter false positives may, respectively, let through or filter out records with the boundary cursor value
     """
     cursor_path: str = None
     initial_value: Optional[Any] = None
+    end_value: Optional[Any] = None
 
     def __init__(
             self,
             cursor_path: str = dlt.config.value,
             initial_value: Optional[TCursorValue]=None,
             last_value_func: Optional[LastValueFunc[TCursorValue]]=max,
-            primary_key: Optional[TTableHintTemplate[TColumnKey]] = None
+            primary_key: Optional[TTableHintTemplate[TColumnKey]] = None,
+            max_unique_hashes: Optional[int] = None,
+            unique_hashes_overflow: TUniqueHashesOverflow = "drop",
+            end_value: Optional[TCursorValue] = None
     ) -> None:
         self.cursor_path = cursor_path
         if self.cursor_path:
@@ -94,10 +202,21 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         """Initial value of last_value"""
         self.start_value: Any = initial_value
         """Value of last_value at the beginning of current pipeline run"""
+        self.end_value = end_value
+        """Optional value where the extraction stops (exclusive)"""
         self.resource_name: Optional[str] = None
         self.primary_key: Optional[TTableHintTemplate[TColumnKey]] = primary_key
+        self.max_unique_hashes = max_unique_hashes
+        self.unique_hashes_overflow = unique_hashes_overflow
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
+        self._unique_hashes: Set[str] = set()
+        """Set with unique hashes kept in sync with `unique_hashes` list in the cached state"""
+        self._unique_hashes_bloom: UniqueHashesBloomFilter = None
+        self._cursor_field: Optional[str] = None
+        """Top level key of the cursor if `cursor_path` does not need the jsonpath interpreter"""
+        self._range_pushed_down = False
+        """Set when the source extracts only the items within the range"""
         super().__init__(self.transform)
 
     @classmethod
@@ -109,7 +228,15 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         return i
 
     def copy(self) -> "Incremental[TCursorValue]":
-        return self.__class__(self.cursor_path, initial_value=self.initial_value, last_value_func=self.last_value_func, primary_key=self.primary_key)
+        return self.__class__(
+            self.cursor_path,
+            initial_value=self.initial_value,
+            last_value_func=self.last_value_func,
+            primary_key=self.primary_key,
+            max_unique_hashes=self.max_unique_hashes,
+            unique_hashes_overflow=self.unique_hashes_overflow,
+            end_value=self.end_value
+        )
 
     def on_resolved(self) -> None:
         self.cursor_path_p = compile_path(self.cursor_path)
@@ -118,7 +245,10 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if isinstance(native_value, Incremental):
             self.cursor_path = native_value.cursor_path
             self.initial_value = native_value.initial_value
+            self.end_value = native_value.end_value
             self.last_value_func = native_value.last_value_func
+            self.max_unique_hashes = native_value.max_unique_hashes
+            self.unique_hashes_overflow = native_value.unique_hashes_overflow
             self.cursor_path_p = self.cursor_path_p
             self.resource_name = self.resource_name
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
@@ -131,6 +261,11 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         """Returns an Incremental state for a particular cursor column"""
         if not self.resource_name:
             raise IncrementalUnboundError(self.cursor_path)
+        if self.end_value is not None:
+            # closed range is extracted without the persistent state
+            if self._cached_state is None:
+                self._cached_state = {"initial_value": self.initial_value, "last_value": self.initial_value, "unique_hashes": []}
+            return self._cached_state
         self._cached_state = Incremental._get_state(self.resource_name, self.cursor_path)
         if len(self._cached_state) == 0:
             # set the default like this, setdefault evaluates the default no matter if it is needed or not. and our default is heavy
@@ -154,6 +289,37 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         s = self.get_state()
         return s['last_value']  # type: ignore
 
+    def merge_range_states(self, resource_name: str, states: Sequence[IncrementalColumnState]) -> None:
+        """Merges the states of closed ranges that were extracted separately into the persistent state of `resource_name`"""
+        state = Incremental._get_state(resource_name, self.cursor_path)
+        candidates = [s for s in states if s["last_value"] is not None]
+        if state.get("last_value") is not None:
+            candidates.append(state)
+        if not candidates:
+            return
+        last_value = reduce(lambda a, b: self.last_value_func((a, b)), (s["last_value"] for s in candidates))
+        boundary = [s for s in candidates if s["last_value"] == last_value]
+        # keep order of hashes, same record may be at the end of one range and in the stored state
+        unique_hashes = list(dict.fromkeys(h for s in boundary for h in s["unique_hashes"]))
+        bloom = next((s["unique_hashes_bloom"] for s in boundary if s.get("unique_hashes_bloom") is not None), None)
+        if not state:
+            state["initial_value"] = states[0]["initial_value"]
+        state["last_value"] = last_value
+        state["unique_hashes"] = unique_hashes
+        if bloom is not None:
+            state["unique_hashes_bloom"] = bloom
+        else:
+            state.pop("unique_hashes_bloom", None)
+
+    def push_down(self) -> IncrementalRange:
+        """Returns the range of cursor values that the source should extract and skips the range checks on extracted items.
+
+        Call it only if the source returns just the items with the cursor at or after `start_value` and before `end_value`.
+        Items with the cursor equal to `start_value` are still deduplicated.
+        """
+        self._range_pushed_down = True
+        return IncrementalRange(self.start_value, self.end_value)
+
     def unique_value(self, row: TDataItem) -> str:
         try:
             if self.primary_key:
@@ -165,22 +331,85 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         except KeyError as k_err:
             raise IncrementalPrimaryKeyMissing(self.resource_name, k_err.args[0], row)
 
+    def _has_unique_hash(self, unique_value: str) -> bool:
+        return unique_value in self._unique_hashes or (self._unique_hashes_bloom is not None and unique_value in self._unique_hashes_bloom)
+
+    def _add_unique_hash(self, unique_value: str) -> None:
+        if self._unique_hashes_bloom is not None:
+            self._unique_hashes_bloom.add(unique_value)
+            return
+        unique_hashes = self._cached_state["unique_hashes"]
+        unique_hashes.append(unique_value)
+        self._unique_hashes.add(unique_value)
+        if self.max_unique_hashes is not None and len(unique_hashes) > self.max_unique_hashes:
+            if self.unique_hashes_overflow == "bloom":
+                logger.info(f"Incremental for resource {self.resource_name} and cursor {self.cursor_path} keeps {len(unique_hashes)} unique hashes, moving them into a bloom filter")
+                self._unique_hashes_bloom = UniqueHashesBloomFilter(10 * self.max_unique_hashes)
+                for h in unique_hashes:
+                    self._unique_hashes_bloom.add(h)
+                self._cached_state["unique_hashes_bloom"] = self._unique_hashes_bloom
+                unique_hashes.clear()
+                self._unique_hashes.clear()
+            else:
+                # drop oldest hashes in chunks so dropping is amortized
+                drop_count = len(unique_hashes) - self.max_unique_hashes + self.max_unique_hashes // 10
+                logger.warning(f"Incremental for resource {self.resource_name} and cursor {self.cursor_path} exceeded {self.max_unique_hashes} unique hashes, dropping {drop_count} oldest")
+                self._unique_hashes.difference_update(unique_hashes[:drop_count])
+                del unique_hashes[:drop_count]
+
+    def _reset_unique_hashes(self, unique_value: str) -> None:
+        self._cached_state["unique_hashes"] = [unique_value]
+        self._cached_state.pop("unique_hashes_bloom", None)
+        self._unique_hashes = {unique_value}
+        self._unique_hashes_bloom = None
+
+    def cursor_value(self, row: TDataItem) -> Any:
+        """Finds the cursor value in `row`, uses plain key lookup if cursor path is a top level key"""
+        if self._cursor_field is not None and isinstance(row, dict):
+            try:
+                row_value = row[self._cursor_field]
+            except KeyError:
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+        else:
+            row_values = find_values(self.cursor_path_p, row)
+            if not row_values:
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+            row_value = row_values[0]
+
+        # For datetime cursor, ensure the value is a timezone aware datetime.
+        # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
+        if isinstance(row_value, datetime):
+            row_value = pendulum.instance(row_value)
+        return row_value
+
+    def __call__(self, item: TDataItems, meta: Any = None) -> Optional[TDataItems]:
+        if not isinstance(item, list):
+            return super().__call__(item, meta)
+        if not item:
+            return None
+        # evaluate the cursor on the whole page at once
+        row_values = [None if row is None else self.cursor_value(row) for row in item]
+        # if all rows are older than start value the page was already processed and may be skipped as a whole
+        # custom last value functions may accept only pairs of values so the page is evaluated at once only for max and min
+        if self.last_value_func in (max, min) and self.start_value is not None and not self._range_pushed_down and None not in item:
+            page_value = self.last_value_func(row_values)
+            if page_value != self.start_value and self.last_value_func((page_value, self.start_value)) == self.start_value:
+                return None
+        item = [row for row, row_value in zip(item, row_values) if row is None or self._filter_row(row, row_value)]
+        return item or None
+
     def transform(self, row: TDataItem) -> bool:
         if row is None:
             return True
+        return self._filter_row(row, self.cursor_value(row))
 
-        row_values = find_values(self.cursor_path_p, row)
-        if not row_values:
-            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
-
+    def _filter_row(self, row: TDataItem, row_value: Any) -> bool:
         incremental_state = self._cached_state
         last_value = incremental_state['last_value']
-        row_value = row_values[0]
 
-        # For datetime cursor, ensure the value is a timezone aware datetime.
-        # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
-        if isinstance(row_value, datetime):
-            row_value = pendulum.instance(row_value)
+        # skip the items at or past the end of the range
+        if self.end_value is not None and not self._range_pushed_down and self.last_value_func((row_value, self.end_value)) == row_value:
+            return False
 
         check_values = (row_value,) + ((last_value, ) if last_value is not None else ())
         new_value = self.last_value_func(check_values)
@@ -190,10 +419,13 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 unique_value = self.unique_value(row)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in incremental_state['unique_hashes']:
+                    if self._has_unique_hash(unique_value):
                         return False
                     # add new hash only if the record row id is same as current last value
-                    incremental_state['unique_hashes'].append(unique_value)
+                    self._add_unique_hash(unique_value)
+                return True
+            # the source extracted only the items within the range
+            if self._range_pushed_down:
                 return True
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -206,7 +438,7 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
             incremental_state["last_value"] = new_value
             unique_value = self.unique_value(row)
             if unique_value:
-                incremental_state["unique_hashes"] = [unique_value]
+                self._reset_unique_hashes(unique_value)
         return True
 
     def bind(self, pipe: SupportsPipe) -> "Incremental[TCursorValue]":
@@ -215,10 +447,19 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if self.is_partial():
             raise IncrementalCursorPathMissing(pipe.name, None, None)
         self.resource_name = pipe.name
+        if self.end_value is not None and self.initial_value is None:
+            raise IncrementalRangeInvalid(pipe.name, self.cursor_path, "end_value requires initial_value to be set")
         # set initial value from last value, in case of a new state those are equal
         self.start_value = self.last_value
+        self._cursor_field = extract_simple_field_name(self.cursor_path_p)
         # cache state
         self._cached_state = self.get_state()
+        self._unique_hashes = set(self._cached_state["unique_hashes"])
+        bloom = self._cached_state.get("unique_hashes_bloom")
+        if isinstance(bloom, dict):
+            # restored from stored state
+            bloom = self._cached_state["unique_hashes_bloom"] = UniqueHashesBloomFilter.from_dict(bloom)
+        self._unique_hashes_bloom = bloom
         return self
 
     def __str__(self) -> str:
@@ -3,12 +3,13 @@ import types
 import asyncio
 import makefun
 from asyncio import Future
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
-from threading import Thread
-from typing import Any, ContextManager, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING
+from threading import Event, Thread
+from typing import Any, AsyncIterable, AsyncIterator, ContextManager, Deque, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING
 
-from dlt.common import sleep
+from dlt.common.runtime import signals
 from dlt.common.configuration import configspec
 from dlt.common.configuration.inject import with_config
 from dlt.common.configuration.specs import BaseConfiguration
@@ -59,6 +60,7 @@ class SourcePipeItem(NamedTuple):
 TPipeStep = Union[
     Iterable[TPipedDataItems],
     Iterator[TPipedDataItems],
+    AsyncIterable[TPipedDataItems],
     Callable[[TDataItems, Optional[Any]], TPipedDataItems],
     Callable[[TDataItems, Optional[Any]], Iterator[TPipedDataItems]],
     Callable[[TDataItems, Optional[Any]], Iterator[ResolvablePipeItem]]
@@ -104,7 +106,7 @@ class Pipe(SupportsPipe):
                 self.append_step(step)
 
     @classmethod
-    def from_data(cls, name: str, gen: Union[Iterable[TPipedDataItems], Iterator[TPipedDataItems], AnyFun], parent: "Pipe" = None) -> "Pipe":
+    def from_data(cls, name: str, gen: Union[Iterable[TPipedDataItems], Iterator[TPipedDataItems], AsyncIterable[TPipedDataItems], AnyFun], parent: "Pipe" = None) -> "Pipe":
         return cls(name, [gen], parent=parent)
 
     @property
@@ -249,6 +251,9 @@ class Pipe(SupportsPipe):
             # otherwise it must be an iterator
             if isinstance(gen, Iterable):
                 self.replace_gen(iter(gen))
+            # async iterators are driven by PipeIterator in its event loop, pass them as a single item
+            if isinstance(self.gen, AsyncIterable):
+                self.replace_gen(iter([self.gen.__aiter__()]))
         else:
             # verify if transformer can be called
             self._ensure_transform_step(self._gen_idx, gen)
@@ -314,7 +319,8 @@ class Pipe(SupportsPipe):
             # this partial wraps transformer and sets a signature that is compatible with pipe transform calls
             _data = makefun.wraps(head, new_sig=inspect.signature(_tx_partial))(_tx_partial)
         else:
-            if inspect.isgeneratorfunction(inspect.unwrap(head)) or inspect.isgenerator(head):
+            unwrapped_head = inspect.unwrap(head)
+            if inspect.isgeneratorfunction(unwrapped_head) or inspect.isasyncgenfunction(unwrapped_head) or inspect.isgenerator(head):
                 # if no arguments then no wrap
                 if len(sig.parameters) == 0:
                     return head
@@ -332,13 +338,13 @@ class Pipe(SupportsPipe):
         return _data
 
     def _verify_head_step(self, step: TPipeStep) -> None:
-        # first element must be Iterable, Iterator or Callable in resource pipe
-        if not isinstance(step, (Iterable, Iterator)) and not callable(step):
-            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator or a Callable")
+        # first element must be Iterable, Iterator, AsyncIterable or Callable in resource pipe
+        if not isinstance(step, (Iterable, Iterator, AsyncIterable)) and not callable(step):
+            raise CreatePipeException(self.name, "A head of a resource pipe must be Iterable, Iterator, AsyncIterable or a Callable")
 
     def _wrap_transform_step_meta(self, step_no: int, step: TPipeStep) -> TPipeStep:
         # step must be a callable: a transformer or a transformation
-        if isinstance(step, (Iterable, Iterator)) and not callable(step):
+        if isinstance(step, (Iterable, Iterator, AsyncIterable)) and not callable(step):
             if self.has_parent:
                 raise CreatePipeException(self.name, "Iterable or Iterator cannot be a step in transformer pipe")
             else:
@@ -415,13 +421,17 @@ class Pipe(SupportsPipe):
         return f"Pipe {self.name} ({self._pipe_id})[steps: {len(self._steps)}] at {id(self)}{bound_str}"
 
 
+_ASYNC_SOURCE_EXHAUSTED = object()
+"""Returned by a future that requested an item from exhausted async iterator"""
+
+
 class PipeIterator(Iterator[PipeItem]):
 
     @configspec
     class PipeIteratorConfiguration(BaseConfiguration):
         max_parallel_items: int = 20
         workers: int = 5
-        futures_poll_interval: float = 0.01
+        futures_poll_interval: float = 1.0
         copy_on_fork: bool = False
 
         __section__ = "extract"
@@ -435,11 +445,16 @@ class PipeIterator(Iterator[PipeItem]):
         self._async_pool_thread: Thread = None
         self._thread_pool: ThreadPoolExecutor = None
         self._sources: List[SourcePipeItem] = []
-        self._futures: List[FuturePipeItem] = []
+        # all pending futures, completed futures are pushed to the ready queue by done callbacks
+        self._futures: Dict[TItemFuture, FuturePipeItem] = {}
+        self._futures_ready: Deque[FuturePipeItem] = deque()
+        self._futures_ready_event = Event()
+        # async iterators with pending `__anext__` futures
+        self._async_sources: Dict[TItemFuture, AsyncIterator[TPipedDataItems]] = {}
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
-    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 0.01) -> "PipeIterator":
+    def from_pipe(cls, pipe: Pipe, *, max_parallel_items: int = 20, workers: int = 5, futures_poll_interval: float = 1.0) -> "PipeIterator":
         # join all dependent pipes
         if pipe.parent:
             pipe = pipe.full_pipe()
@@ -463,7 +478,7 @@ class PipeIterator(Iterator[PipeItem]):
         *,
         max_parallel_items: int = 20,
         workers: int = 5,
-        futures_poll_interval: float = 0.01,
+        futures_poll_interval: float = 1.0,
         copy_on_fork: bool = False
     ) -> "PipeIterator":
         # print(f"max_parallel_items: {max_parallel_items} workers: {workers}")
@@ -513,7 +528,8 @@ class PipeIterator(Iterator[PipeItem]):
                         # no more elements in futures or sources
                         raise StopIteration()
                     else:
-                        sleep(self.futures_poll_interval)
+                        # only pending futures left, wait until any of them completes
+                        self._wait_futures_ready()
                     continue
 
             item = pipe_item.item
@@ -524,28 +540,33 @@ class PipeIterator(Iterator[PipeItem]):
                 pipe_item = None
                 continue
 
-            if isinstance(item, Awaitable) or callable(item):
+            if isinstance(item, (Awaitable, AsyncIterator)) or callable(item):
                 # do we have a free slot or one of the slots is done?
-                if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                if len(self._futures) < self.max_parallel_items or len(self._futures_ready) > 0:
+                    if isinstance(item, AsyncIterator):
+                        # async iterator occupies a single slot and is advanced in the event loop
+                        self._add_async_source(item, pipe_item.step, pipe_item.pipe, pipe_item.meta)
+                        pipe_item = None
+                        continue
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
-                    self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._add_future(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
                 else:
                     # print("maximum futures exceeded, waiting")
-                    sleep(self.futures_poll_interval)
+                    self._wait_futures_ready()
                 # try same item later
                 continue
 
             # if we are at the end of the pipe then yield element
             if pipe_item.step == len(pipe_item.pipe) - 1:
                 # must be resolved
-                if isinstance(item, (Iterator, Awaitable)) or callable(item):
+                if isinstance(item, (Iterator, Awaitable, AsyncIterator)) or callable(item):
                     raise PipeItemProcessingError(
                         pipe_item.pipe.name, f"Pipe item at step {pipe_item.step} was not fully evaluated and is of type {type(pipe_item.item).__name__}. This is internal error or you are yielding something weird from resources ie. functions or awaitables.")
                 # mypy not able to figure out that item was resolved
@@ -581,10 +602,16 @@ class PipeIterator(Iterator[PipeItem]):
             loop.stop()
 
         # stop all futures
-        for f, _, _, _ in self._futures:
+        for f in self._futures:
             if not f.done():
                 f.cancel()
         self._futures.clear()
+        self._futures_ready.clear()
+        # close async generators so their finally blocks are executed, cancellation of pending items is processed by the loop first
+        for gen in self._async_sources.values():
+            if inspect.isasyncgen(gen):
+                asyncio.run_coroutine_threadsafe(gen.aclose(), self._async_pool).result()
+        self._async_sources.clear()
 
         # close all generators
         for gen, _, _, _ in self._sources:
@@ -633,21 +660,48 @@ class PipeIterator(Iterator[PipeItem]):
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: types.TracebackType) -> None:
         self.close()
 
-    def _next_future(self) -> int:
-        return next((i for i, val in enumerate(self._futures) if val.item.done()), -1)
+    def _add_future(self, future_item: FuturePipeItem) -> None:
+        self._futures[future_item.item] = future_item
 
-    def _resolve_futures(self) -> ResolvablePipeItem:
-        # no futures at all
-        if len(self._futures) == 0:
-            return None
+        def _on_done(_: TItemFuture) -> None:
+            # called from the thread that completed the future, deque append is thread safe
+            self._futures_ready.append(future_item)
+            self._futures_ready_event.set()
+
+        future_item.item.add_done_callback(_on_done)  # type: ignore[arg-type]
 
+    def _add_async_source(self, gen: AsyncIterator[TPipedDataItems], step: int, pipe: Pipe, meta: Any) -> None:
+        """Schedules next item of async iterator `gen` in the event loop. Only one item per iterator is pending at any time"""
+
+        async def _anext() -> Any:
+            try:
+                return await gen.__anext__()
+            except StopAsyncIteration:
+                return _ASYNC_SOURCE_EXHAUSTED
+
+        future: TItemFuture = asyncio.run_coroutine_threadsafe(_anext(), self._ensure_async_pool())  # type: ignore[assignment]
+        self._async_sources[future] = gen
+        self._add_future(FuturePipeItem(future, step, pipe, meta))
+
+    def _wait_futures_ready(self) -> None:
+        """Blocks until any of the pending futures completes. Wakes up every `futures_poll_interval` to check for signals"""
+        while len(self._futures_ready) == 0:
+            self._futures_ready_event.clear()
+            # future may complete before event was cleared
+            if len(self._futures_ready) > 0:
+                break
+            self._futures_ready_event.wait(self.futures_poll_interval)
+            signals.raise_if_signalled()
+
+    def _resolve_futures(self) -> ResolvablePipeItem:
         # anything done?
-        idx = self._next_future()
-        if idx == -1:
+        if len(self._futures_ready) == 0:
             # nothing done
             return None
 
-        future, step, pipe, meta = self._futures.pop(idx)
+        future_item = self._futures_ready.popleft()
+        future, step, pipe, meta = self._futures.pop(future_item.item)
+        gen = self._async_sources.pop(future, None)
 
         if future.cancelled():
             # get next future
@@ -657,9 +711,16 @@ class PipeIterator(Iterator[PipeItem]):
             ex = future.exception()
             if isinstance(ex, (PipelineException, ExtractorException, DltSourceException, PipeException)):
                 raise ex
+            if gen is not None:
+                raise ResourceExtractionError(pipe.name, gen, str(ex), "generator") from ex
             raise ResourceExtractionError(pipe.name, future, str(ex), "future") from ex
 
         item = future.result()
+        if gen is not None:
+            if item is _ASYNC_SOURCE_EXHAUSTED:
+                return self._resolve_futures()
+            # request next item, async iterator keeps its slot
+            self._add_async_source(gen, step, pipe, meta)
         if isinstance(item, DataItemWithMeta):
             return ResolvablePipeItem(item.data, step, pipe, item.meta)
         else:
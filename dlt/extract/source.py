@@ -22,7 +22,7 @@ from dlt.extract.schema import DltResourceSchema, TTableSchemaTemplate
 from dlt.extract.incremental import Incremental, IncrementalResourceWrapper
 from dlt.extract.exceptions import (
     InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidResourceDataType, InvalidResourceDataTypeFunctionNotAGenerator, InvalidResourceDataTypeIsNone, InvalidTransformerGeneratorFunction,
-    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeAsync, InvalidResourceDataTypeBasic,
+    DataItemRequiredForDynamicTableHints, InvalidResourceDataTypeBasic,
     InvalidResourceDataTypeMultiplePipes, ParametrizedResourceUnbound, ResourceNameMissing, ResourceNotATransformer, ResourcesNotFoundError, SourceExhausted, DeletingResourcesNotSupported)
 
 
@@ -79,7 +79,7 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             name = name or get_callable_name(data)
 
         # if generator, take name from it
-        if inspect.isgenerator(data):
+        if inspect.isgenerator(data) or inspect.isasyncgen(data):
             name = name or get_callable_name(data)  # type: ignore
 
         # name is mandatory
@@ -87,8 +87,6 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             raise ResourceNameMissing()
 
         # several iterable types are not allowed and must be excluded right away
-        if isinstance(data, (AsyncIterator, AsyncIterable)):
-            raise InvalidResourceDataTypeAsync(name, data, type(data))
         if isinstance(data, (str, dict)):
             raise InvalidResourceDataTypeBasic(name, data, type(data))
 
@@ -98,8 +96,8 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             DltResource._ensure_valid_transformer_resource(name, data)
             parent_pipe = DltResource._get_parent_pipe(name, depends_on)
 
-        # create resource from iterator, iterable or generator function
-        if isinstance(data, (Iterable, Iterator)) or callable(data):
+        # create resource from iterator, iterable, async iterator or (async) generator function
+        if isinstance(data, (Iterable, Iterator, AsyncIterable)) or callable(data):
             pipe = Pipe.from_data(name, data, parent=parent_pipe)
             return cls(pipe, table_schema_template, selected, incremental=incremental, section=section)
         else:
@@ -233,6 +231,10 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
             count = 0
             if inspect.isfunction(gen):
                 gen = gen()
+            if isinstance(gen, AsyncIterable):
+                # pass limited async iterator to be resolved by the pipe iterator
+                yield _async_gen_wrap(gen)
+                return
             try:
                 for i in gen:  # type: ignore # TODO: help me fix this later
                     yield i
@@ -243,6 +245,17 @@ class DltResource(Iterable[TDataItem], DltResourceSchema):
                 if inspect.isgenerator(gen):
                     gen.close()
             return
+
+        async def _async_gen_wrap(gen: AsyncIterable[TDataItem]) -> AsyncIterator[TDataItem]:
+            count = 0
+            async for i in gen:
+                yield i
+                count += 1
+                if count == max_items:
+                    break
+            if inspect.isasyncgen(gen):
+                await gen.aclose()
+
         # transformers should be limited by their input, so we only limit non-transformers
         if not self.is_transformer:
             self._pipe.replace_gen(_gen_wrap(self._pipe.gen))
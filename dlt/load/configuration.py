@@ -14,6 +14,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    reuse_clients: bool = True
+    """When True, each loader thread keeps its destination client and connection open for the whole package instead of opening one per job"""
+    coalesce_file_size: int = 0
+    """When gt 0, new job files of the same table smaller than this number of bytes are combined into a single job. Applies to file formats that may be concatenated ie. jsonl"""
     _load_storage_config: LoadStorageConfiguration = None
 
     if TYPE_CHECKING:
@@ -1,9 +1,12 @@
 from functools import reduce
+import threading
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple
-from multiprocessing.pool import ThreadPool
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from multiprocessing.pool import AsyncResult, ThreadPool
 
 from dlt.common import sleep, logger
+from dlt.common.runtime import signals
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
@@ -45,6 +48,11 @@ class Load(Runnable[ThreadPool]):
         self.pool: ThreadPool = None
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._processed_load_ids: Dict[str, int] = {}
+        self._clients: Dict[int, JobClientBase] = {}
+        """Open job clients per thread id"""
+        self._clients_generation = 0
+        """Incremented each time the clients are closed"""
+        self._clients_lock = threading.Lock()
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -56,6 +64,71 @@ class Load(Runnable[ThreadPool]):
         )
         return load_storage
 
+    def get_client(self, schema: Schema) -> JobClientBase:
+        """Returns job client with open connection for the current thread. When `reuse_clients` is set, the client is kept open and reused by subsequent
+        calls from the same thread as long as it was created for the same `schema` instance and is alive. Clients are closed with `close_clients`.
+        """
+        return self._get_client(schema)[0]
+
+    def discard_client(self) -> None:
+        """Closes the client of the current thread ie. when it could be left in a broken state after an error"""
+        with self._clients_lock:
+            client = self._clients.pop(threading.get_ident(), None)
+        if client is not None:
+            self._close_client(client)
+
+    def close_clients(self) -> None:
+        """Closes all job clients opened with `get_client`"""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._clients_generation += 1
+        for client in clients:
+            self._close_client(client)
+
+    def _get_client(self, schema: Schema) -> Tuple[JobClientBase, bool]:
+        """Returns job client for the current thread and a flag telling if the client is kept to be closed with `close_clients`"""
+        thread_id = threading.get_ident()
+        with self._clients_lock:
+            client = self._clients.pop(thread_id, None)
+            generation = self._clients_generation
+        if client is not None:
+            if client.schema is not schema or not client.is_alive():
+                self._close_client(client)
+                client = None
+        if client is None:
+            client = self.destination.client(schema, self.initial_client_config)
+            client.__enter__()
+        with self._clients_lock:
+            # do not keep the client if clients were closed in the meantime, it would never be closed
+            is_kept = generation == self._clients_generation
+            if is_kept:
+                self._clients[thread_id] = client
+        return client, is_kept
+
+    @contextmanager
+    def _borrow_client(self, schema: Schema) -> Iterator[JobClientBase]:
+        if not self.config.reuse_clients:
+            with self.destination.client(schema, self.initial_client_config) as client:
+                yield client
+            return
+        client, is_kept = self._get_client(schema)
+        try:
+            yield client
+        except Exception:
+            self.discard_client()
+            raise
+        finally:
+            if not is_kept:
+                self._close_client(client)
+
+    @staticmethod
+    def _close_client(client: JobClientBase) -> None:
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            logger.exception(f"Could not close job client {client}")
+
     @staticmethod
     def get_load_table(schema: Schema, file_name: str) -> TTableSchema:
         table_name = LoadStorage.parse_job_file_name(file_name).table_name
@@ -73,7 +146,7 @@ class Load(Runnable[ThreadPool]):
     def w_spool_job(self: "Load", file_path: str, load_id: str, schema: Schema) -> Optional[LoadJob]:
         job: LoadJob = None
         try:
-            with self.destination.client(schema, self.initial_client_config) as client:
+            with self._borrow_client(schema) as client:
                 job_info = self.load_storage.parse_job_file_name(file_path)
                 if job_info.file_format not in self.capabilities.supported_loader_file_formats:
                     raise LoadClientUnsupportedFileFormats(job_info.file_format, self.capabilities.supported_loader_file_formats, file_path)
@@ -93,24 +166,21 @@ class Load(Runnable[ThreadPool]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
+    def start_new_jobs_async(self, load_id: str, schema: Schema, load_files: Sequence[str]) -> List["AsyncResult[LoadJob]"]:
+        """Starts jobs for `load_files` in the pool without waiting for them to be started"""
+        logger.info(f"Will load {len(load_files)}, creating jobs")
         # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs: List[LoadJob] = self.pool.starmap(Load.w_spool_job, param_chunk)
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+        return [self.pool.apply_async(Load.w_spool_job, (id(self), file, load_id, schema)) for file in load_files]
+
+    def complete_starting_jobs(self, load_id: str, starting_jobs: Sequence["AsyncResult[LoadJob]"], schema: Schema) -> None:
+        """Waits until jobs in `starting_jobs` are started and moves the jobs that could not be started back to new or failed jobs"""
+        jobs: List[LoadJob] = []
+        for result in starting_jobs:
+            result.wait()
+            if result.successful():
+                jobs.append(result.get())
+        # running and completed jobs are restored from started jobs in the next run
+        self.complete_jobs(load_id, [job for job in jobs if job.state() in ("retry", "failed")], schema)
 
     def retrieve_jobs(self, client: JobClientBase, load_id: str) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
@@ -149,13 +219,14 @@ class Load(Runnable[ThreadPool]):
         table_chain: List[TTableSchema] = []
         # make sure all the jobs for the table chain is completed
         for table in get_child_tables(schema.tables, top_merged_table["name"]):
-            table_jobs = self.load_storage.list_jobs_for_table(load_id, table["name"])
+            # use the jobs index of the package so the job files are not listed and stated on each check
+            table_jobs = self.load_storage.list_job_states_for_table(load_id, table["name"])
             # if no jobs for table then skip the table in the chain. we assume that if parent has no jobs, the child would also have no jobs
             # so it will be eliminated by this loop as well
             if not table_jobs:
                 continue
             # all jobs must be completed in order for merge to be created
-            if any(job.state not in ("failed_jobs", "completed_jobs") and job.job_file_info.job_id() != starting_job.job_file_info().job_id() for job in table_jobs):
+            if any(state not in ("failed_jobs", "completed_jobs") and job_info.job_id() != starting_job.job_file_info().job_id() for state, job_info in table_jobs):
                 return None
             table_chain.append(table)
         # there must be at least 1 job
@@ -223,7 +294,7 @@ class Load(Runnable[ThreadPool]):
     def complete_package(self, load_id: str, schema: Schema, aborted: bool = False) -> None:
         # do not commit load id for aborted packages
         if not aborted:
-            with self.destination.client(schema, self.initial_client_config) as job_client:
+            with self._borrow_client(schema) as job_client:
                 job_client.complete_load(load_id)
         self.load_storage.complete_load_package(load_id, aborted)
         logger.info(f"All jobs completed, archiving package {load_id} with aborted set to {aborted}")
@@ -258,11 +329,18 @@ class Load(Runnable[ThreadPool]):
             # spool or retrieve unfinished jobs
             jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
+        # files to be started in this run, files moved back to new jobs on retry or created by followup jobs are started on the next run
+        new_job_files: List[str] = []
         if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
+            if self.config.coalesce_file_size > 0:
+                coalesced_count = self.load_storage.coalesce_new_jobs(load_id, self.config.coalesce_file_size)
+                if coalesced_count:
+                    logger.info(f"Combined small files into {coalesced_count} fewer jobs in {load_id}")
+            new_job_files = list(self.load_storage.list_new_jobs(load_id))
+            if not new_job_files:
+                logger.info(f"No new jobs found in {load_id}")
         # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
+        if not jobs and not new_job_files:
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
@@ -273,33 +351,67 @@ class Load(Runnable[ThreadPool]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
+        # jobs being started in the pool
+        starting_jobs: List["AsyncResult[LoadJob]"] = []
         # loop until all jobs are processed
-        while True:
-            try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
-                    # get package status
-                    package_info = self.load_storage.get_load_package_info(load_id)
-                    # possibly raise on failed jobs
-                    if self.config.raise_on_failed_jobs:
-                        if package_info.jobs["failed_jobs"]:
-                            failed_job = package_info.jobs["failed_jobs"][0]
-                            raise LoadClientJobFailed(load_id, failed_job.job_file_info.job_id(), failed_job.failed_message)
-                    # possibly raise on too many retires
-                    if self.config.raise_on_max_retries:
-                        for new_job in package_info.jobs["new_jobs"]:
-                            r_c = new_job.job_file_info.retry_count
-                            if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
-                                raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
-                    break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
-            except LoadClientJobFailed:
-                # the package is completed and skipped
-                self.complete_package(load_id, schema, True)
-                raise
+        try:
+            while True:
+                try:
+                    # keep the pool full: start new job as soon as another job is started or completed
+                    free_slots = self.config.workers - len(jobs) - len(starting_jobs)
+                    if free_slots > 0 and new_job_files:
+                        starting_jobs.extend(self.start_new_jobs_async(load_id, schema, new_job_files[:free_slots]))
+                        new_job_files = new_job_files[free_slots:]
+                    started_count = 0
+                    still_starting: List["AsyncResult[LoadJob]"] = []
+                    for result in starting_jobs:
+                        if result.ready():
+                            jobs.append(result.get())
+                            started_count += 1
+                        else:
+                            still_starting.append(result)
+                    starting_jobs = still_starting
+                    remaining_jobs = self.complete_jobs(load_id, jobs, schema)
+                    if len(remaining_jobs) == 0 and not starting_jobs and not new_job_files:
+                        # get package status
+                        package_info = self.load_storage.get_load_package_info(load_id)
+                        # possibly raise on failed jobs
+                        if self.config.raise_on_failed_jobs:
+                            if package_info.jobs["failed_jobs"]:
+                                failed_job = package_info.jobs["failed_jobs"][0]
+                                raise LoadClientJobFailed(load_id, failed_job.job_file_info.job_id(), failed_job.failed_message)
+                        # possibly raise on too many retires
+                        if self.config.raise_on_max_retries:
+                            for new_job in package_info.jobs["new_jobs"]:
+                                r_c = new_job.job_file_info.retry_count
+                                if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
+                                    raise LoadClientJobRetry(load_id, new_job.job_file_info.job_id(), r_c, self.config.raise_on_max_retries)
+                        break
+                    remaining_ids = set(id(job) for job in remaining_jobs)
+                    progressed = started_count > 0 or any(id(job) not in remaining_ids for job in jobs)
+                    # process remaining jobs again
+                    jobs = remaining_jobs
+                    if not progressed:
+                        if starting_jobs:
+                            # wake up as soon as the job is started
+                            starting_jobs[0].wait(1.0)
+                            signals.raise_if_signalled()
+                        else:
+                            # this will raise on signal
+                            sleep(1)
+                except LoadClientJobFailed:
+                    # the package is completed and skipped
+                    self.complete_package(load_id, schema, True)
+                    raise
+        finally:
+            # jobs are being started only when exception or signal is propagated, see the loop exit condition
+            if starting_jobs:
+                # jobs being started move their files in the package, do not leave them behind
+                try:
+                    self.complete_starting_jobs(load_id, starting_jobs, schema)
+                except Exception:
+                    # do not replace the propagated exception
+                    logger.exception(f"Could not complete jobs being started in {load_id}")
 
     def run(self, pool: ThreadPool) -> TRunMetrics:
         # store pool
@@ -322,7 +434,10 @@ class Load(Runnable[ThreadPool]):
         # TODO: another place where tracing must be refactored
         self._processed_load_ids[load_id] = None
         with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
+            try:
+                self.load_single_package(load_id, schema)
+            finally:
+                self.close_clients()
         return TRunMetrics(False, len(self.load_storage.list_packages()))
 
     def get_load_info(self, pipeline: SupportsPipeline, started_at: datetime.datetime = None) -> LoadInfo:
@@ -1,11 +1,15 @@
 import os
-from typing import Any, Callable, List, Dict, Sequence, Tuple
-from multiprocessing.pool import AsyncResult, Pool as ProcessPool
+import mmap
+import queue
+from itertools import groupby
+from typing import Any, Callable, ClassVar, Iterator, List, Dict, Sequence, Tuple
+from multiprocessing.pool import Pool as ProcessPool
 
-from dlt.common import pendulum, json, logger, sleep
+from dlt.common import pendulum, json, logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
+from dlt.common.data_writers.writers import PickleListWriter
 from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.json import custom_pua_decode
 from dlt.common.runners import TRunMetrics, Runnable
@@ -18,7 +22,6 @@ from dlt.common.storages import NormalizeStorage, SchemaStorage, LoadStorage, Lo
 from dlt.common.typing import TDataItem
 from dlt.common.schema import TSchemaUpdate, Schema
 from dlt.common.schema.exceptions import CannotCoerceColumnException
-from dlt.common.utils import chunks
 
 from dlt.normalize.configuration import NormalizeConfiguration
 
@@ -26,12 +29,15 @@ from dlt.normalize.configuration import NormalizeConfiguration
 TMapFuncRV = Sequence[TSchemaUpdate]
 # normalize worker wrapping function signature
 TMapFuncType = Callable[[Schema, str, Sequence[str]], TMapFuncRV]  # input parameters: (schema name, load_id, list of files to process)
-# tuple returned by the worker
-TWorkerRV = Tuple[List[TSchemaUpdate], int, List[str]]
+# list returned by the worker, for each root table: (extracted files, schema updates, items count, load files)
+TWorkerRV = List[Tuple[List[str], List[TSchemaUpdate], int, List[str]]]
 
 
 class Normalize(Runnable[ProcessPool]):
 
+    # number of tasks per worker created by group_worker_files_by_size
+    TASKS_PER_WORKER: ClassVar[int] = 4
+
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(self, collector: Collector = NULL_COLLECTOR, schema_storage: SchemaStorage = None, config: NormalizeConfiguration = config.value) -> None:
         self.config = config
@@ -70,33 +76,55 @@ class Normalize(Runnable[ProcessPool]):
             destination_caps: DestinationCapabilitiesContext,
             stored_schema: TStoredSchema,
             load_id: str,
-            extracted_items_files: Sequence[str]
+            extracted_items_files: Sequence[str],
+            schema_updates: Sequence[TSchemaUpdate] = ()
         ) -> TWorkerRV:
 
-        schema_updates: List[TSchemaUpdate] = []
+        results: TWorkerRV = []
         total_items = 0
         # process all files with data items and write to buffered item storage
         with Container().injectable_context(destination_caps):
             schema = Schema.from_stored_schema(stored_schema)
+            # apply schema changes made after the stored schema was sent
+            for schema_update in schema_updates:
+                for table_updates in schema_update.values():
+                    for partial_table in table_updates:
+                        schema.update_schema(partial_table)
             load_storage = LoadStorage(False, destination_caps.preferred_loader_file_format, LoadStorage.ALL_SUPPORTED_FILE_FORMATS, loader_storage_config)
             normalize_storage = NormalizeStorage(False, normalize_storage_config)
 
+            extracted_items_file: str = None
+            line_no: int = 0
             try:
-                for extracted_items_file in extracted_items_files:
-                    line_no: int = 0
-                    root_table_name = NormalizeStorage.parse_normalize_file_name(extracted_items_file).table_name
-                    logger.debug(f"Processing extracted items in {extracted_items_file} in load_id {load_id} with table name {root_table_name} and schema {schema.name}")
-                    with normalize_storage.storage.open_file(extracted_items_file) as f:
-                        # enumerate jsonl file line by line
-                        for line_no, line in enumerate(f):
-                            items: List[TDataItem] = json.loads(line)
-                            partial_update, items_count = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items)
-                            schema_updates.append(partial_update)
+                # group files by root table, sort so each root table forms a single group
+                for root_table_name, root_table_files in groupby(
+                    sorted(extracted_items_files), lambda f: NormalizeStorage.parse_normalize_file_name(f).table_name
+                ):
+                    table_schema_updates: List[TSchemaUpdate] = []
+                    table_items = 0
+                    table_files = list(root_table_files)
+                    closed_files = set(load_storage.closed_files())
+                    for extracted_items_file in table_files:
+                        line_no = 0
+                        items_count = 0
+                        logger.debug(f"Processing extracted items in {extracted_items_file} in load_id {load_id} with table name {root_table_name} and schema {schema.name}")
+                        # pickled items keep python types, only jsonl items have types encoded with pua
+                        decode_pua = not extracted_items_file.endswith(".pickle")
+                        # enumerate jsonl file line by line or pickled file list by list
+                        for line_no, items in enumerate(Normalize._read_extracted_items(normalize_storage, extracted_items_file)):
+                            partial_update, items_count = Normalize._w_normalize_chunk(load_storage, schema, load_id, root_table_name, items, decode_pua)
+                            table_schema_updates.append(partial_update)
+                            table_items += items_count
                             total_items += items_count
                             logger.debug(f"Processed {line_no} items from file {extracted_items_file}, items {items_count} of total {total_items}")
                         # if any item found in the file
                         if items_count > 0:
                             logger.debug(f"Processed total {line_no + 1} lines from file {extracted_items_file}, total items {total_items}")
+                    # rotate files so load files of each root table can be discarded and produced again separately
+                    # writers stay open as next root tables may write to the same tables
+                    load_storage.rotate_files(load_id)
+                    table_load_files = [f for f in load_storage.closed_files() if f not in closed_files]
+                    results.append((table_files, table_schema_updates, table_items, table_load_files))
             except Exception:
                 logger.exception(f"Exception when processing file {extracted_items_file}, line {line_no}")
                 raise
@@ -105,10 +133,37 @@ class Normalize(Runnable[ProcessPool]):
 
         logger.info(f"Processed total {total_items} items in {len(extracted_items_files)} files")
 
-        return schema_updates, total_items, load_storage.closed_files()
+        return results
+
+    @staticmethod
+    def _read_extracted_items(normalize_storage: NormalizeStorage, extracted_items_file: str) -> Iterator[List[TDataItem]]:
+        """Yields lists of data items from extracted file which is either jsonl with a list in each line or a pickle file with lists"""
+        with normalize_storage.storage.open_file(extracted_items_file, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            # empty files cannot be memory mapped
+            if file_size == 0:
+                return
+            # read from memory mapped file so the content is not buffered and copied
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if extracted_items_file.endswith(".pickle"):
+                    yield from PickleListWriter.read_data(m)  # type: ignore[arg-type]
+                    return
+                # parse jsonl lines directly from the mapped bytes, without decoding to str
+                with memoryview(m) as view:
+                    start = 0
+                    while start < file_size:
+                        end = m.find(b"\n", start)
+                        if end == -1:
+                            end = file_size
+                        if end > start:
+                            # slice must be released before the file is unmapped
+                            with view[start:end] as line:
+                                items: List[TDataItem] = json.loadb(line)
+                            yield items
+                        start = end + 1
 
     @staticmethod
-    def _w_normalize_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem]) -> Tuple[TSchemaUpdate, int]:
+    def _w_normalize_chunk(load_storage: LoadStorage, schema: Schema, load_id: str, root_table_name: str, items: List[TDataItem], decode_pua: bool = True) -> Tuple[TSchemaUpdate, int]:
         column_schemas: Dict[str, TTableSchemaColumns] = {}  # quick access to column schema for writers below
         schema_update: TSchemaUpdate = {}
         schema_name = schema.name
@@ -121,8 +176,9 @@ class Normalize(Runnable[ProcessPool]):
                 # do not process empty rows
                 if row:
                     # decode pua types
-                    for k, v in row.items():
-                        row[k] = custom_pua_decode(v)  # type: ignore
+                    if decode_pua:
+                        for k, v in row.items():
+                            row[k] = custom_pua_decode(v)  # type: ignore
                     # coerce row of values into schema table, generating partial table with new columns if any
                     row, partial_table = schema.coerce_row(table_name, parent_table, row)
                     # theres a new table or new columns in existing table
@@ -146,80 +202,110 @@ class Normalize(Runnable[ProcessPool]):
             signals.raise_if_signalled()
         return schema_update, items_count
 
-    def update_schema(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
+    def update_schema(self, schema: Schema, schema_updates: List[TSchemaUpdate], applied_update: TSchemaUpdate = None) -> None:
+        """Merges `schema_updates` into `schema`. Each merged partial table is recorded in `applied_update` if passed,
+        so the changes already made to `schema` are known when a conflicting partial raises"""
         for schema_update in schema_updates:
             for table_name, table_updates in schema_update.items():
                 logger.info(f"Updating schema for table {table_name} with {len(table_updates)} deltas")
                 for partial_table in table_updates:
                     # merge columns
                     schema.update_schema(partial_table)
+                    if applied_update is not None:
+                        applied_update.setdefault(table_name, []).append(partial_table)
 
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -=1
-            l_idx = idx + 1
-        return chunk_files
+    def group_worker_files_by_size(files: Sequence[str], file_sizes: Sequence[int], no_workers: int) -> List[List[str]]:
+        """Groups `files` into tasks of similar total size, several tasks per worker so idle workers pick up remaining tasks.
+
+        Files are sorted so the same tables stay together. Any file larger than the target task size becomes a separate task.
+        Tasks are returned from the largest so the longest ones are started first.
+        """
+        if not files:
+            return []
+        sizes = dict(zip(files, file_sizes))
+        target_size = max(sum(file_sizes) // (no_workers * Normalize.TASKS_PER_WORKER), 1)
+        tasks: List[Tuple[int, List[str]]] = []
+        task_files: List[str] = []
+        task_size = 0
+        for file in sorted(files):
+            if sizes[file] >= target_size and task_files:
+                # big file starts a new task
+                tasks.append((task_size, task_files))
+                task_files = []
+                task_size = 0
+            task_files.append(file)
+            task_size += sizes[file]
+            if task_size >= target_size:
+                tasks.append((task_size, task_files))
+                task_files = []
+                task_size = 0
+        if task_files:
+            tasks.append((task_size, task_files))
+        # stable sort so tasks with equal size keep the file order
+        tasks.sort(key=lambda t: t[0], reverse=True)
+        return [task_files for _, task_files in tasks]
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TMapFuncRV:
         workers = self.pool._processes  # type: ignore
-        chunk_files = self.group_worker_files(files, workers)
+        file_sizes = [os.path.getsize(self.normalize_storage.storage.make_full_path(file)) for file in files]
+        chunk_files = self.group_worker_files_by_size(files, file_sizes, workers)
         schema_dict: TStoredSchema = schema.to_dict()
         config_tuple = (self.normalize_storage.config, self.load_storage.config, self.config.destination_capabilities, schema_dict)
         param_chunk = [[*config_tuple, load_id, files] for files in chunk_files]
-        tasks: List[Tuple[AsyncResult[TWorkerRV], List[Any]]] = []
+        # results are pushed by the pool as soon as a task completes
+        completed: "queue.Queue[Tuple[List[Any], TWorkerRV, BaseException]]" = queue.Queue()
+
+        def _submit(params: List[Any]) -> None:
+            self.pool.apply_async(
+                Normalize.w_normalize_files,
+                params,
+                callback=lambda result: completed.put((params, result, None)),
+                error_callback=lambda exc: completed.put((params, None, exc))
+            )
 
         # return stats
         schema_updates: List[TSchemaUpdate] = []
 
-        # push all tasks to queue
+        # push all tasks to queue, pool dispatches them to idle workers
         for params in param_chunk:
-            pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-            tasks.append((pending, params))
-
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.ready():
-                    if pending.successful():
-                        result: TWorkerRV = pending.get()
-                        try:
-                            # gather schema from all manifests, validate consistency and combine
-                            self.update_schema(schema, result[0])
-                            schema_updates.extend(result[0])
-                            # update metrics
-                            self.collector.update("Files", len(result[2]))
-                            self.collector.update("Items", result[1])
-                        except CannotCoerceColumnException as exc:
-                            # schema conflicts resulting from parallel executing
-                            logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
-                            # delete all files produced by the task
-                            for file in result[2]:
-                                os.remove(file)
-                            # schedule the task again
-                            schema_dict = schema.to_dict()
-                            # TODO: it's time for a named tuple
-                            params[3] = schema_dict
-                            retry_pending: AsyncResult[TWorkerRV] = self.pool.apply_async(Normalize.w_normalize_files, params)
-                            tasks.append((retry_pending, params))
-                        # remove finished tasks
-                        tasks.remove(task)
-                    else:
-                        # raise the exception
-                        pending.get()
-                        raise AssertionError("unreachable code: pending.get must raise")
+            _submit(params)
+        pending_count = len(param_chunk)
+
+        while pending_count > 0:
+            try:
+                params, result, exc = completed.get(timeout=1.0)
+            except queue.Empty:
+                signals.raise_if_signalled()
+                continue
+            pending_count -= 1
+            if exc is not None:
+                # raise the exception
+                raise exc
+            for table_files, table_schema_updates, table_items, table_load_files in result:
+                # partial tables merged into the schema, also when conflicting one is found
+                applied_update: TSchemaUpdate = {}
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_schema(schema, table_schema_updates, applied_update)
+                    # update metrics
+                    self.collector.update("Files", len(table_load_files))
+                    self.collector.update("Items", table_items)
+                except CannotCoerceColumnException as coerce_ex:
+                    # keep partial tables merged before the conflict, the schema already contains them
+                    if applied_update:
+                        schema_updates.append(applied_update)
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying {len(table_files)} files of table {coerce_ex.table_name} ({str(coerce_ex)}")
+                    # delete only the files produced for the conflicting root table
+                    for file in table_load_files:
+                        os.remove(file)
+                    # schedule the files again, send all the schema changes made since the stored schema was created
+                    # TODO: it's time for a named tuple
+                    _submit([*params[:5], table_files, list(schema_updates)])
+                    pending_count += 1
+                else:
+                    schema_updates.append(applied_update)
 
         return schema_updates
 
@@ -232,10 +318,13 @@ class Normalize(Runnable[ProcessPool]):
             load_id,
             files
         )
-        self.update_schema(schema, result[0])
-        self.collector.update("Files", len(result[2]))
-        self.collector.update("Items", result[1])
-        return result[0]
+        schema_updates: List[TSchemaUpdate] = []
+        for _, table_schema_updates, table_items, table_load_files in result:
+            self.update_schema(schema, table_schema_updates)
+            schema_updates.extend(table_schema_updates)
+            self.collector.update("Files", len(table_load_files))
+            self.collector.update("Items", table_items)
+        return schema_updates
 
     def spool_files(self, schema_name: str, load_id: str, map_f: TMapFuncType, files: Sequence[str]) -> None:
         schema = Normalize.load_or_create_schema(self.schema_storage, schema_name)
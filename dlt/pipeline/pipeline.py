@@ -33,6 +33,7 @@ from dlt.destinations.exceptions import DatabaseUndefinedRelation
 from dlt.extract.exceptions import DataItemRequiredForDynamicTableHints, SourceExhausted
 from dlt.extract.extract import ExtractorStorage, extract_with_schema
 from dlt.extract.source import DltResource, DltSource
+from dlt.extract.incremental import IncrementalRange, split_range
 from dlt.normalize import Normalize
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.destinations.sql_client import SqlClientBase
@@ -255,9 +256,13 @@ class Pipeline(SupportsPipeline):
         primary_key: TColumnKey = None,
         schema: Schema = None,
         max_parallel_items: int = None,
-        workers: int = None
+        workers: int = None,
+        process_workers: int = None,
+        backfill_ranges: Sequence[IncrementalRange] = None
     ) -> ExtractInfo:
-        """Extracts the `data` and prepare it for the normalization. Does not require destination or credentials to be configured. See `run` method for the arguments' description."""
+        """Extracts the `data` and prepare it for the normalization. Does not require destination or credentials to be configured. See `run` method for the arguments' description.
+        Each of the `backfill_ranges` of a single incremental resource in `data` is extracted separately, see `backfill` method.
+        """
         # create extract storage to which all the sources will be extracted
         storage = ExtractorStorage(self._normalize_storage_config)
         extract_ids: List[str] = []
@@ -269,7 +274,7 @@ class Pipeline(SupportsPipeline):
                         raise SourceExhausted(source.name)
                     # TODO: merge infos for all the sources
                     extract_ids.append(
-                        self._extract_source(storage, source, max_parallel_items, workers)
+                        self._extract_source(storage, source, max_parallel_items, workers, process_workers, backfill_ranges)
                     )
                 # commit extract ids
                 # TODO: if we fail here we should probably wipe out the whole extract folder
@@ -280,6 +285,34 @@ class Pipeline(SupportsPipeline):
             # TODO: provide metrics from extractor
             raise PipelineStepFailed(self, "extract", exc, ExtractInfo()) from exc
 
+    def backfill(
+        self,
+        data: Any,
+        initial_value: Any,
+        end_value: Any,
+        windows: int = 4,
+        *,
+        schema: Schema = None,
+        max_parallel_items: int = None,
+        workers: int = None,
+        process_workers: int = None
+    ) -> ExtractInfo:
+        """Extracts the incremental resource `data` from `initial_value` to `end_value` (exclusive) split into `windows` non overlapping ranges.
+
+        The ranges are extracted in `process_workers` processes (by default one per range), each with its own `Incremental` with the range bounds.
+        Use `push_down` on the incremental in the resource function to query the source only for the range. The resource state of all the ranges is merged
+        into the incremental state of the resource so the next incremental load continues from the end of the backfill. `data` must be a resource
+        created from a generator function with an incremental argument, passed without calling it.
+        """
+        return self.extract(
+            data,
+            schema=schema,
+            max_parallel_items=max_parallel_items,
+            workers=workers,
+            process_workers=windows if process_workers is None else process_workers,
+            backfill_ranges=split_range(initial_value, end_value, windows)
+        )
+
     @with_runtime_trace
     @with_schemas_sync
     @with_config_section((known_sections.NORMALIZE,))
@@ -812,11 +845,21 @@ class Pipeline(SupportsPipeline):
 
         return sources
 
-    def _extract_source(self, storage: ExtractorStorage, source: DltSource, max_parallel_items: int, workers: int) -> str:
+    def _extract_source(
+        self,
+        storage: ExtractorStorage,
+        source: DltSource,
+        max_parallel_items: int,
+        workers: int,
+        process_workers: int = None,
+        backfill_ranges: Sequence[IncrementalRange] = None
+    ) -> str:
         # discover the schema from source
         source_schema = source.schema
 
-        extract_id = extract_with_schema(storage, source, source_schema, self.collector, max_parallel_items, workers)
+        extract_id = extract_with_schema(
+            storage, source, source_schema, self.collector, max_parallel_items, workers, process_workers=process_workers, backfill_ranges=backfill_ranges
+        )
 
         # if source schema does not exist in the pipeline
         if source_schema.name not in self._schema_storage:
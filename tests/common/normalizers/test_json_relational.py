@@ -44,6 +44,31 @@ def test_flatten_fix_field_name(norm: RelationalNormalizer) -> None:
     assert ("f_3", "fx6", "c_x", ) in lists
 
 
+def test_flatten_cache_per_path(norm: RelationalNormalizer) -> None:
+    row = {"f-1": 1, "f!3": {"f4": "a", "c x": []}}
+    flattened_row, lists = norm._flatten("mock_table", row, 0)
+    # keys are resolved per path
+    assert norm._flatten_cache[()] == {"f-1": ("f_1", "f_1"), "f!3": ("f_3", "f_3")}
+    assert norm._flatten_cache[("f_3",)] == {"f4": ("f4", "f_3__f4"), "c x": ("c_x", "f_3__c_x")}
+    # same shape gives the same result from cache
+    assert norm._flatten("mock_table", {"f-1": 1, "f!3": {"f4": "a", "c x": []}}, 0) == (flattened_row, lists)
+    # same key under different path is normalized separately
+    flattened_row, _ = norm._flatten("mock_table", {"f4": {"f4": "b"}}, 0)
+    assert flattened_row == {"f4__f4": "b"}
+    assert norm._flatten_cache[("f4",)] == {"f4": ("f4", "f4__f4")}
+
+
+def test_flatten_cache_preferred_type_change(norm: RelationalNormalizer) -> None:
+    row = {"value": {"complex": True}}
+    flattened_row, _ = norm._flatten("any_table", row, 0)
+    assert flattened_row == {"value__complex": True}
+    # preferred type added after the key was seen must be respected
+    norm.schema._settings.setdefault("preferred_types", {})["re:^value$"] = "complex"
+    norm.schema._compile_settings()
+    flattened_row, _ = norm._flatten("any_table", row, 0)
+    assert flattened_row == {"value": {"complex": True}}
+
+
 def test_preserve_complex_value(norm: RelationalNormalizer) -> None:
     # add table with complex column
     norm.schema.update_schema(
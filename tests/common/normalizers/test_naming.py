@@ -241,3 +241,46 @@ def assert_short_path(norm_path: str, naming: NamingConvention) -> None:
     assert len(norm_path) == naming.max_length
     assert naming.normalize_path(norm_path) == norm_path
     assert all(len(ident) <= naming.max_length for ident in naming.break_path(norm_path))
+
+
+@pytest.mark.parametrize("convention", (SnakeCaseNamingConvention, DirectNamingConvention))
+def test_path_cache(convention: Type[NamingConvention]) -> None:
+    naming = convention(len(RAW_IDENT) * 2)
+    raw_path_str = naming.make_path(*RAW_PATH)
+    norm_path_str = naming.normalize_path(raw_path_str)
+    info = naming.path_cache_info()
+    assert info.hits == 0
+    assert info.size == info.misses > 0
+    # same results are returned from cache
+    assert naming.make_path(*RAW_PATH) == raw_path_str
+    assert naming.normalize_path(raw_path_str) == norm_path_str
+    assert naming.path_cache_info().hits == 2
+    # methods do not share cached values, shorten_fragments calls make_path with new arguments
+    assert naming.shorten_fragments(raw_path_str) == naming.shorten_identifier(raw_path_str, raw_path_str, naming.max_length)
+    assert naming.path_cache_info().misses == info.misses + 2
+    # cache is bounded
+    naming.PATH_CACHE_MAX_SIZE = 4
+    for i in range(10):
+        naming.break_path(f"path_{i}")
+    assert naming.path_cache_info().size <= 4
+
+
+def test_path_cache_without_base_init() -> None:
+
+    class CustomNamingConvention(SnakeCaseNamingConvention):
+        def __init__(self, max_length: int = None) -> None:
+            # does not call NamingConvention.__init__
+            self.max_length = max_length
+
+    naming = CustomNamingConvention()
+    assert naming.path_cache_info().size == 0
+    raw_path_str = naming.make_path(*RAW_PATH)
+    assert naming.make_path(*RAW_PATH) == raw_path_str
+    info = naming.path_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+    # cache is also created when used before path_cache_info
+    naming = CustomNamingConvention()
+    assert naming.make_path(*RAW_PATH) == raw_path_str
+    assert naming.path_cache_info().misses == 1
@@ -10,6 +10,7 @@ from pendulum.tz import UTC
 from dlt.common import Decimal, Wei, json, pendulum
 from dlt.common.json import _DATETIME, custom_pua_decode_nested
 from dlt.common.data_types import coerce_value, py_type_to_sc_type, TDataType
+from dlt.common.schema import Schema
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
 
@@ -215,6 +216,25 @@ def test_coerce_type_to_binary() -> None:
         assert coerce_value("binary", "text", "!YmluYXJ5IHN0cmluZw==")
 
 
+def test_coerce_bytes_subclass_to_binary() -> None:
+    # HexBytes into plain bytes
+    coerced_hb = coerce_value("binary", "binary", HexBytes(b'binary string'))
+    assert type(coerced_hb) is bytes
+    assert coerced_hb == b'binary string'
+    # plain bytes are passed as they are
+    assert Schema._compile_coercer("binary", bytes) is None
+    assert type(Schema._compile_coercer("binary", HexBytes)(HexBytes(b'binary string'))) is bytes
+    # coerced in new and existing columns
+    schema = Schema("event")
+    row, partial = schema.coerce_row("event_bot", None, {"hb": HexBytes(b'binary string')})
+    assert type(row["hb"]) is bytes
+    assert partial["columns"]["hb"]["data_type"] == "binary"
+    schema.update_schema(partial)
+    row, partial = schema.coerce_row("event_bot", None, {"hb": HexBytes(b'binary string')})
+    assert type(row["hb"]) is bytes
+    assert partial is None
+
+
 def test_py_type_to_sc_type() -> None:
     assert py_type_to_sc_type(bool) == "bool"
     assert py_type_to_sc_type(int) == "bigint"
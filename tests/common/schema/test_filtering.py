@@ -30,6 +30,24 @@ def test_row_field_filter(schema: Schema) -> None:
     assert ref_case["data__custom"] == "remains"
 
 
+def test_row_field_filter_memoized(schema: Schema) -> None:
+    _add_excludes(schema)
+    bot_case: StrAny = load_json_case("mod_bot_case")
+    filtered_case = schema.filter_row("event_bot", deepcopy(bot_case))
+    # exclusion of each column was memoized
+    _, excluded_columns = schema._compiled_row_filters["event_bot"]
+    assert set(excluded_columns.keys()) == set(bot_case.keys())
+    assert {k for k, v in excluded_columns.items() if not v} == set(filtered_case.keys())
+    # second pass gives the same result
+    assert schema.filter_row("event_bot", deepcopy(bot_case)) == filtered_case
+    # tables without filters in the path are not filtered
+    assert schema.filter_row("event_user", deepcopy(bot_case)) == bot_case
+    assert schema._compiled_row_filters["event_user"] == ([], {})
+    # compiling settings drops the memoized columns
+    schema._compile_settings()
+    assert schema._compiled_row_filters == {}
+
+
 def test_whole_row_filter(schema: Schema) -> None:
     _add_excludes(schema)
     bot_case: StrAny = load_json_case("mod_bot_case")
@@ -498,3 +498,38 @@ def test_autodetect_convert_type(schema: Schema) -> None:
     assert c_row["evm2"] == 22.2
     assert isinstance(c_row["evm2"], float)
 
+
+
+def test_coerce_row_compiled_coercers(schema: Schema) -> None:
+    _add_preferred_types(schema)
+    row = {"confidence": "0.1", "count": 1}
+    _, new_table = schema.coerce_row("event_user", None, row)
+    # new columns are not compiled
+    assert schema._compiled_coercers["event_user"][1] == {}
+    schema.update_schema(new_table)
+    assert "event_user" not in schema._compiled_coercers
+
+    new_row, new_table = schema.coerce_row("event_user", None, row)
+    assert new_table is None
+    assert new_row == {"confidence": 0.1, "count": 1}
+    coercers = schema._compiled_coercers["event_user"][1]
+    # matching type passes as is
+    assert coercers[("count", int)] is None
+    assert coercers[("confidence", str)] is not None
+    # compiled coercer is used
+    new_row, new_table = schema.coerce_row("event_user", None, {"confidence": "0.5", "count": 2})
+    assert new_table is None
+    assert new_row == {"confidence": 0.5, "count": 2}
+    # value that cannot be coerced with compiled coercer still creates variant
+    new_row, new_table = schema.coerce_row("event_user", None, {"confidence": "STR"})
+    assert new_row == {"confidence__v_text": "STR"}
+    assert new_table["columns"]["confidence__v_text"]["variant"] is True
+    schema.update_schema(new_table)
+    assert "event_user" not in schema._compiled_coercers
+
+    # replaced table does not use stale coercers
+    schema.coerce_row("event_user", None, row)
+    assert ("confidence", str) in schema._compiled_coercers["event_user"][1]
+    schema._schema_tables["event_user"] = utils.new_table("event_user", columns=[{"name": "confidence", "data_type": "text", "nullable": True}])
+    new_row, _ = schema.coerce_row("event_user", None, row)
+    assert new_row["confidence"] == "0.1"
@@ -82,6 +82,42 @@ def test_infer_column_bumps_version() -> None:
     assert saved_schema["version"] == 2
 
 
+def test_version_hash_computed_on_modification(monkeypatch) -> None:
+    schema = Schema("event")
+    version_hash = schema.version_hash
+    calls = []
+    generate_version_hash = utils.generate_version_hash
+
+    def _generate_version_hash(stored_schema: TStoredSchema) -> str:
+        calls.append(stored_schema)
+        return generate_version_hash(stored_schema)
+
+    monkeypatch.setattr(utils, "generate_version_hash", _generate_version_hash)
+    # content not modified: hash is not recomputed
+    assert schema.version_hash == version_hash
+    assert schema.version == 1
+    assert len(calls) == 0
+    # modified via update_schema
+    row = {"floatX": 78172.128, "confidenceX": 1.2, "strX": "STR"}
+    _, new_table = schema.coerce_row("event_user", None, row)
+    schema.update_schema(new_table)
+    assert schema.version == 2
+    assert schema.version_hash != version_hash
+    assert len(calls) == 1
+    # modified via hints
+    version_hash = schema.version_hash
+    schema.merge_hints({"partition": ["floatX"]})
+    assert schema.version_hash != version_hash
+    assert len(calls) == 2
+    # direct modification requires bump_version
+    version_hash = schema.version_hash
+    schema.tables["event_user"]["write_disposition"] = "replace"
+    assert schema.version_hash == version_hash
+    schema.bump_version()
+    assert schema.version_hash != version_hash
+    assert schema.version == 3
+
+
 def test_preserve_version_on_load() -> None:
     eth_v5: TStoredSchema = load_yml_case("schemas/eth/ethereum_schema_v5")
     version = eth_v5["version"]
@@ -159,6 +159,25 @@ def test_retry_job(storage: LoadStorage) -> None:
     assert LoadStorage.parse_job_file_name(new_fp).retry_count == 2
 
 
+def test_list_job_states_for_table(storage: LoadStorage) -> None:
+    load_id, fn = start_loading_file(storage, "test file")
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("started_jobs", LoadStorage.parse_job_file_name(fn))]
+    assert storage.list_job_states_for_table(load_id, "other_table") == []
+    # index follows the job transitions
+    new_fp = storage.retry_job(load_id, fn)
+    new_fn = Path(new_fp).name
+    assert storage.list_job_states_for_table(load_id, "mock_table") == [("new_jobs", LoadStorage.parse_job_file_name(new_fn))]
+    storage.start_job(load_id, new_fn)
+    storage.complete_job(load_id, new_fn)
+    jobs = storage.list_jobs_for_table(load_id, "mock_table")
+    assert len(jobs) == 1
+    assert jobs[0].state == "completed_jobs"
+    assert jobs[0].file_path == storage.storage.make_full_path(storage._get_job_file_path(load_id, "completed_jobs", new_fn))
+    # index is dropped with the package
+    storage.complete_load_package(load_id, False)
+    assert load_id not in storage._jobs_indexes
+
+
 def test_build_parse_job_path(storage: LoadStorage) -> None:
     file_id = uniq_id(5)
     f_n_t = ParsedLoadJobFileName("test_table", file_id, 0, "jsonl")
@@ -1,6 +1,7 @@
 import os
 import pytest
 
+from dlt.common import json
 from dlt.common.data_writers.buffered import BufferedDataWriter
 from dlt.common.data_writers.exceptions import BufferedDataWriterClosed
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
@@ -28,6 +29,27 @@ def test_write_no_item() -> None:
     assert writer.closed_files == []
 
 
+def test_rotate_file() -> None:
+    c1 = new_column("col1", "bigint")
+    t1 = {"col1": c1}
+
+    with get_insert_writer() as writer:
+        # nothing written, no file to rotate
+        writer.rotate_file()
+        assert writer.closed_files == []
+        # buffered items are flushed into rotated file
+        writer.write_data_item([{"col1": 1}], t1)
+        writer.rotate_file()
+        assert len(writer.closed_files) == 1
+        assert not writer.closed
+        # writer may be used after rotation and writes a new file
+        writer.write_data_item([{"col1": 2}], t1)
+    assert len(writer.closed_files) == 2
+    assert writer.closed_files[0] != writer.closed_files[1]
+    with pytest.raises(BufferedDataWriterClosed):
+        writer.rotate_file()
+
+
 def test_rotation_on_schema_change() -> None:
 
     c1 = new_column("col1", "bigint")
@@ -164,3 +186,21 @@ def test_writer_optional_schema() -> None:
     with get_insert_writer(_format="jsonl") as writer:
             writer.write_data_item([{"col1": 1}], None)
             writer.write_data_item([{"col1": 1}], None)
+
+
+def test_puae_writer_line_max_bytes() -> None:
+    file_template = os.path.join(TEST_STORAGE_ROOT, "puae.%s")
+    items = [{"col1": idx, "col2": "x" * 100} for idx in range(100)]
+    # single list of items is split into lines that do not exceed the limit
+    with BufferedDataWriter("puae-jsonl", file_template, buffer_max_items=1000, line_max_bytes=1024) as writer:
+        writer.write_data_item(items, None)
+    with open(writer.closed_files[0], "rb") as f:
+        lines = f.readlines()
+    assert len(lines) > 10
+    assert all(len(line) <= 1024 + 1 for line in lines)
+    assert [item for line in lines for item in json.loadb(line)] == items
+    # without a limit whole buffer is written in a single line
+    with BufferedDataWriter("puae-jsonl", file_template, buffer_max_items=1000, line_max_bytes=None) as writer:
+        writer.write_data_item(items, None)
+    with open(writer.closed_files[0], "rb") as f:
+        assert len(f.readlines()) == 1
@@ -7,7 +7,7 @@ from dlt.common.typing import AnyFun
 # from dlt.destinations.postgres import capabilities
 from dlt.destinations.redshift import capabilities as redshift_caps
 from dlt.common.data_writers.escape import escape_redshift_identifier, escape_bigquery_identifier, escape_redshift_literal, escape_postgres_literal, escape_duckdb_literal
-from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter, JsonlWriter
+from dlt.common.data_writers.writers import CsvWriter, DataWriter, InsertValuesWriter, JsonlWriter
 
 from tests.common.utils import load_json_case, row_to_column_schemas
 
@@ -36,6 +36,54 @@ def test_simple_insert_writer(insert_writer: DataWriter) -> None:
     assert len(lines) == 4
 
 
+def test_insert_writer_split_statements() -> None:
+    caps = redshift_caps()
+    caps.max_query_length = 512
+    rows = load_json_case("simple_row") * 20
+    with io.StringIO() as f:
+        writer = InsertValuesWriter(f, caps=caps)
+        writer.write_header(row_to_column_schemas(rows[0]))
+        # rows written in many chunks
+        writer.write_data(rows[:7])
+        writer.write_data(rows[7:])
+        writer.write_footer()
+        content = f.getvalue()
+    statements = content.split(InsertValuesWriter.STATEMENT_BOUNDARY)
+    assert len(statements) > 1
+    header, _ = content.split("\n", 1)
+    values_count = 0
+    for idx, statement in enumerate(statements):
+        if idx > 0:
+            statement = "INSERT INTO " + statement
+        if idx < len(statements) - 1:
+            statement += ";"
+        # each statement fits into half of max query length and is complete
+        assert len(statement) <= caps.max_query_length // 2
+        assert statement.startswith(header + "\nVALUES\n")
+        assert statement.endswith(");")
+        values_count += len(statement.split("\n")) - 2
+    assert values_count == len(rows)
+
+
+def test_csv_writer() -> None:
+    rows = [
+        {"text": 'a "quoted", value\nwith new line', "int": 1, "bytes": b"bytes", "complex": {"a": "b"}, "date": pendulum.from_timestamp(1658928602.575267)},
+        {"text": "", "bool": True}
+    ]
+    columns = row_to_column_schemas(rows[0])
+    columns.update(row_to_column_schemas(rows[1]))
+    with io.StringIO() as f:
+        CsvWriter(f).write_all(columns, rows)
+        content = f.getvalue()
+    lines = content.split("\n")
+    assert lines[0] == '"text","int","bytes","complex","date","bool"'
+    assert lines[1] == '"a ""quoted"", value'
+    assert lines[2] == 'with new line",1,\\x6279746573,"{""a"":""b""}",2022-07-27T13:30:02.575267+00:00,'
+    # empty string is quoted, NULL is empty
+    assert lines[3] == '"",,,,,True'
+    assert lines[4] == ""
+
+
 def test_simple_jsonl_writer(jsonl_writer: DataWriter) -> None:
     rows = load_json_case("simple_row")
     jsonl_writer.write_all(None, rows)
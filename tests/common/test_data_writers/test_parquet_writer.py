@@ -0,0 +1,84 @@
+import os
+import pytest
+
+from dlt.common import pendulum, Decimal, Wei
+from dlt.common.data_writers.buffered import BufferedDataWriter
+from dlt.common.schema.utils import new_column
+
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
+from tests.common.test_data_writers.test_buffered_writer import get_insert_writer
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.parquet  # noqa: E402
+
+
+def get_parquet_writer(buffer_max_items: int = 10, **kwargs: int) -> BufferedDataWriter:
+    writer = get_insert_writer("parquet", buffer_max_items=buffer_max_items)
+    for k, v in kwargs.items():
+        setattr(writer, k, v)
+    return writer
+
+
+def test_parquet_writer_schema_and_types() -> None:
+    columns = {
+        "col1": new_column("col1", "bigint", nullable=False),
+        "col2": new_column("col2", "double"),
+        "col3": new_column("col3", "text"),
+        "col4": new_column("col4", "timestamp"),
+        "col5": new_column("col5", "complex"),
+        "col6": new_column("col6", "decimal"),
+        "col7": new_column("col7", "wei"),
+        "col8": new_column("col8", "binary"),
+        "col9": new_column("col9", "date"),
+        "col10": new_column("col10", "bool"),
+    }
+    now = pendulum.now()
+    rows = [{
+        "col1": 1, "col2": 2.5, "col3": "text", "col4": now, "col5": {"a": [1, 2]}, "col6": Decimal("1.21"),
+        "col7": Wei(2**100), "col8": b"bytes", "col9": now.date(), "col10": True
+    }, {"col1": 2}]
+    with get_parquet_writer() as writer:
+        writer.write_data_item(rows, columns)
+    assert len(writer.closed_files) == 1
+    assert writer.closed_files[0].endswith(".parquet")
+
+    table = pyarrow.parquet.read_table(writer.closed_files[0])
+    assert table.schema.names == list(columns.keys())
+    assert table.schema.field("col1").nullable is False
+    assert table.schema.field("col4").type == pyarrow.timestamp("us", tz="UTC")
+    read_rows = table.to_pylist()
+    assert read_rows[0]["col1"] == 1
+    assert read_rows[0]["col4"] == now
+    # complex types are stored as json
+    assert read_rows[0]["col5"] == '{"a":[1,2]}'
+    # rows passed to the writer are not modified
+    assert rows[0]["col5"] == {"a": [1, 2]}
+    assert read_rows[0]["col6"] == Decimal("1.21")
+    assert read_rows[0]["col7"] == 2**100
+    assert read_rows[0]["col8"] == b"bytes"
+    # missing values are null
+    assert read_rows[1] == {**{k: None for k in columns}, "col1": 2}
+
+
+def test_parquet_writer_row_groups_and_rotation() -> None:
+    c1 = {"col1": new_column("col1", "bigint")}
+    c2 = {"col1": new_column("col1", "bigint"), "col2": new_column("col2", "text")}
+
+    with get_parquet_writer(buffer_max_items=5) as writer:
+        for i in range(12):
+            writer.write_data_item({"col1": i}, c1)
+        # schema change rotates file
+        writer.write_data_item({"col1": 12, "col2": "a"}, c2)
+    assert len(writer.closed_files) == 2
+    metadata = pyarrow.parquet.ParquetFile(writer.closed_files[0]).metadata
+    # each flushed buffer is a row group
+    assert metadata.num_row_groups == 3
+    assert metadata.num_rows == 12
+    assert pyarrow.parquet.read_table(writer.closed_files[1]).to_pylist() == [{"col1": 12, "col2": "a"}]
+
+    # rotate on max items
+    with get_parquet_writer(buffer_max_items=5, file_max_items=5) as writer:
+        for i in range(12):
+            writer.write_data_item({"col1": i}, c1)
+    assert [pyarrow.parquet.ParquetFile(f).metadata.num_rows for f in writer.closed_files] == [5, 5, 2]
+    assert all(os.path.isfile(f) for f in writer.closed_files)
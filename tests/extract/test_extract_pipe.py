@@ -467,6 +467,86 @@ def test_circular_deps() -> None:
         _f_items(list(PipeIterator.from_pipes(pipes)))
 
 
+def test_futures_resolved_on_completion() -> None:
+    # items complete in reverse order of submission, iterator must not wait for poll interval
+    @dlt.defer
+    def _deferred(item: int) -> int:
+        sleep(0.01 * (10 - item % 10))
+        return item
+
+    async def _awaitable(item: int) -> int:
+        await asyncio.sleep(0.01 * (10 - item % 10))
+        return item
+
+    for step in (_deferred, _awaitable):
+        pit = PipeIterator.from_pipe(
+            Pipe.from_data("slow", step, parent=Pipe.from_data("items", list(range(100)))),
+            max_parallel_items=20,
+            futures_poll_interval=10.0
+        )
+        with pit:
+            items = _f_items(list(pit))
+        assert sorted(items) == list(range(100))
+        assert pit._futures == {}
+        assert len(pit._futures_ready) == 0
+
+
+def test_async_gen_pipe() -> None:
+    async def _numbers():
+        for i in range(5):
+            await asyncio.sleep(0.001)
+            yield i
+
+    async def _fail():
+        yield 1
+        raise RuntimeError("we fail")
+
+    # async generator as head and as a transformer result
+    pipe = Pipe.from_data("numbers", _numbers)
+    assert _f_items(list(PipeIterator.from_pipe(pipe))) == list(range(5))
+
+    async def _double(item: int):
+        yield item
+        yield item
+    items = _f_items(list(PipeIterator.from_pipe(Pipe.from_data("double", _double, parent=pipe))))
+    assert sorted(items) == sorted(list(range(5)) * 2)
+
+    with PipeIterator.from_pipe(Pipe.from_data("fail", _fail())) as pit:
+        with pytest.raises(ResourceExtractionError) as py_ex:
+            list(pit)
+        assert py_ex.value.kind == "generator"
+        assert py_ex.value.func_name == "_fail"
+        assert isinstance(py_ex.value.__cause__, RuntimeError)
+
+
+def test_close_async_gen_pipe() -> None:
+    closed: List[str] = []
+
+    async def _waiting():
+        try:
+            yield 1
+            # closed while waiting for the next item
+            await asyncio.sleep(10)
+            yield 2
+        finally:
+            closed.append("waiting")
+
+    async def _yielding():
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            closed.append("yielding")
+
+    for gen in [_waiting, _yielding]:
+        with PipeIterator.from_pipe(Pipe.from_data(gen.__name__, gen)) as pit:
+            # close after the first item
+            assert next(pit).item in (0, 1)
+            assert len(pit._async_sources) == 1
+        assert pit._async_sources == {}
+    assert closed == ["waiting", "yielding"]
+
+
 close_pipe_got_exit = False
 close_pipe_yielding = False
 
@@ -17,7 +17,7 @@ from dlt.common.json import json
 
 from dlt.extract.source import DltSource
 from dlt.sources.helpers.transform import take_first
-from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
+from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing, IncrementalRangeInvalid, IncrementalRange, split_range
 
 from tests.pipeline.utils import drop_pipeline
 # from tests.load.pipeline.utils import load_table_counts
@@ -62,6 +62,30 @@ def test_batch_items_last_value_state_is_updated() -> None:
     assert s['last_value'] == 9
 
 
+def test_batch_items_filtered_by_page() -> None:
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('$.created_at')):
+        yield [{'id': i, 'created_at': i // 2} for i in range(10)]
+        yield [{'id': i, 'created_at': i // 2} for i in range(10, 20)]
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert s['last_value'] == 9
+    assert s['unique_hashes'] == [digest128('18'), digest128('19')]
+
+    # pages older than last value are skipped, boundary items are deduplicated
+    assert list(some_data()) == []
+
+    @dlt.resource(primary_key="id", name="some_data")
+    def more_data(created_at=dlt.sources.incremental('$.created_at')):
+        yield [{'id': i, 'created_at': i // 2} for i in range(10)]
+        yield [{'id': i, 'created_at': i // 2} for i in range(16, 24)]
+
+    assert [i['id'] for i in more_data()] == [20, 21, 22, 23]
+
+
 def test_last_value_access_in_resource() -> None:
     values = []
 
@@ -349,6 +373,40 @@ def test_descending_order_unique_hashes() -> None:
     assert list(some_data()) == []
 
 
+@pytest.mark.parametrize("overflow", ["drop", "bloom"])
+def test_max_unique_hashes(overflow: str) -> None:
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at', max_unique_hashes=100, unique_hashes_overflow=overflow)):
+        # many records share the boundary cursor value
+        for i in range(1000):
+            yield {'id': i, 'created_at': 1}
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert len(s['unique_hashes']) <= 100
+    if overflow == "bloom":
+        assert len(s['unique_hashes']) == 0
+        assert "unique_hashes_bloom" in s
+        # all records are deduplicated on the next run, state restored from storage
+        assert list(some_data()) == []
+    else:
+        assert "unique_hashes_bloom" not in s
+        # hashes of the most recent records are kept
+        assert s['unique_hashes'] == [digest128(str(i)) for i in range(1000 - len(s['unique_hashes']), 1000)]
+
+    # new last value resets the hashes
+    @dlt.resource(primary_key="id", name="some_data")
+    def new_data(created_at=dlt.sources.incremental('created_at', max_unique_hashes=100, unique_hashes_overflow=overflow)):
+        yield {'id': 0, 'created_at': 2}
+
+    p.extract(new_data())
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert s['unique_hashes'] == [digest128('0')]
+    assert "unique_hashes_bloom" not in s
+
+
 def test_unique_keys_json_identifiers() -> None:
     """Uses primary key name that is matching the name of the JSON element in the original namespace but gets converted into destination namespace"""
     @dlt.resource(primary_key="DelTa")
@@ -644,3 +702,61 @@ def test_timezone_naive_datetime() -> None:
 
     pipeline = dlt.pipeline(pipeline_name=uniq_id())
     pipeline.extract(some_data())
+
+
+def test_end_value() -> None:
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at')):
+        yield [{'id': i, 'created_at': i} for i in range(20)]
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data(created_at=dlt.sources.incremental('created_at', initial_value=10)))
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert s['last_value'] == 19
+
+    # closed ranges are extracted independently of the state
+    chunks = [list(some_data(created_at=dlt.sources.incremental('created_at', initial_value=start, end_value=start + 5))) for start in range(0, 20, 5)]
+    assert [[i['id'] for i in chunk] for chunk in chunks] == [list(range(start, start + 5)) for start in range(0, 20, 5)]
+    s = p.state["sources"][p.default_schema_name]['resources']['some_data']['incremental']['created_at']
+    assert s['last_value'] == 19
+
+    with pytest.raises(IncrementalRangeInvalid):
+        list(some_data(created_at=dlt.sources.incremental('created_at', end_value=5)))
+
+
+def test_range_push_down() -> None:
+    ranges = []
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental('created_at', initial_value=5)):
+        start_value, end_value = created_at.push_down()
+        ranges.append(IncrementalRange(start_value, end_value))
+        # source ignores the range, items are not checked against it
+        yield [{'id': i, 'created_at': i} for i in range(10)]
+
+    p = dlt.pipeline(pipeline_name=uniq_id())
+    p.extract(some_data())
+    assert ranges == [(5, None)]
+
+    # items with the cursor equal to start value are still deduplicated
+    assert [i['id'] for i in some_data()] == list(range(9))
+    assert ranges[-1] == (9, None)
+
+
+def test_split_range() -> None:
+    assert split_range(0, 10, 3) == [(0, 4), (4, 8), (8, 10)]
+    assert split_range(0, 2, 4) == [(0, 1), (1, 2)]
+    assert split_range(0.0, 1.0, 2) == [(0.0, 0.5), (0.5, 1.0)]
+    start_dt = pendulum.datetime(2020, 1, 1)
+    ranges = split_range(start_dt, start_dt.add(days=3), 3)
+    assert ranges == [(start_dt.add(days=i), start_dt.add(days=i + 1)) for i in range(3)]
+    with pytest.raises(ValueError):
+        split_range(0, 10, 0)
+    # ISO strings are split as timestamps and dates, bounds are strings
+    assert split_range("2020-01-01T00:00:00Z", "2020-01-03T00:00:00Z", 2) == [("2020-01-01T00:00:00Z", "2020-01-02T00:00:00Z"), ("2020-01-02T00:00:00Z", "2020-01-03T00:00:00Z")]
+    assert split_range("2020-01-01", "2020-01-03", 2) == [("2020-01-01", "2020-01-02"), ("2020-01-02", "2020-01-03")]
+    with pytest.raises(ValueError):
+        split_range("a", "b", 2)
+    with pytest.raises(ValueError):
+        split_range(0, "2020-01-01", 2)
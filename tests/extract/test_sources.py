@@ -1,3 +1,4 @@
+import asyncio
 import itertools
 import pytest
 
@@ -735,6 +736,43 @@ def test_limit_source() -> None:
     assert list(infinite_source().add_limit(2)) == ['A', 'A', 0, 'A', 'A', 'A', 1] * 3
 
 
+def test_async_resources() -> None:
+
+    async def _sleep_item(item: int) -> int:
+        await asyncio.sleep(0.01)
+        return item
+
+    async def numbers(n: int = 10):
+        for i in range(n):
+            await asyncio.sleep(0.001)
+            yield i
+
+    async_numbers = dlt.resource(numbers, name="async_numbers")
+
+    @dlt.transformer
+    async def async_mul(item: int):
+        for _ in range(2):
+            yield await _sleep_item(item * 10)
+
+    # async generator function, bound and unbound
+    assert list(async_numbers) == list(range(10))
+    assert list(async_numbers(3)) == [0, 1, 2]
+    # async generator object
+    assert list(dlt.resource(numbers(4), name="gen")) == list(range(4))
+    # async transformer
+    assert sorted(async_numbers(3) | async_mul) == [0, 0, 10, 10, 20, 20]
+    # limit async resource
+    assert list(async_numbers(100).add_limit(5)) == list(range(5))
+
+    # async sources are iterated concurrently
+    @dlt.source
+    def async_source():
+        for idx in range(3):
+            yield dlt.resource(numbers(5), name=f"numbers_{idx}")
+
+    assert sorted(async_source()) == sorted(list(range(5)) * 3)
+
+
 def test_source_state() -> None:
 
     @dlt.source
@@ -6,6 +6,7 @@ from dlt.common.configuration.resolve import resolve_configuration
 from dlt.common.configuration.utils import get_resolved_traces
 
 from dlt.destinations.duckdb.configuration import DUCK_DB_NAME, DuckDbClientConfiguration, DEFAULT_DUCK_DB_NAME
+from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
 
 from tests.load.pipeline.utils import drop_pipeline
 from tests.utils import patch_home_dir, autouse_test_storage, preserve_environ, TEST_STORAGE_ROOT
@@ -216,6 +217,22 @@ def test_external_duckdb_database() -> None:
     conn.close()
 
 
+def test_duckdb_connection_alive() -> None:
+    import duckdb
+
+    conn = duckdb.connect(":memory:")
+    c = resolve_configuration(DuckDbClientConfiguration(dataset_name="test_dataset", credentials=conn))
+    client = DuckDbSqlClient("test_dataset", c.credentials)
+    assert client.is_connection_alive() is False
+    client.open_connection()
+    assert client.is_connection_alive() is True
+    # connection closed outside of the client
+    client.native_connection.close()
+    assert client.is_connection_alive() is False
+    client.close_connection()
+    assert client.is_connection_alive() is False
+    conn.close()
+
 
 def delete_quack_db() -> None:
     if os.path.isfile(DEFAULT_DUCK_DB_NAME):
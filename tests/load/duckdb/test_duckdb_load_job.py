@@ -0,0 +1,62 @@
+import codecs
+import pytest
+from typing import Iterator
+
+from dlt.common import pendulum, json
+from dlt.common.data_writers import DataWriter
+from dlt.common.schema.utils import new_table
+from dlt.common.storages import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
+from dlt.common.utils import uniq_id
+
+from dlt.destinations.duckdb.duck import DuckDbClient, DuckDbCopyJob
+from dlt.destinations.insert_job_client import InsertValuesLoadJob
+
+from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
+from tests.load.utils import TABLE_ROW, TABLE_UPDATE, yield_client_with_storage
+
+
+@pytest.fixture
+def file_storage() -> FileStorage:
+    return FileStorage(TEST_STORAGE_ROOT, file_type="b", makedirs=True)
+
+
+@pytest.fixture(scope="function")
+def client() -> Iterator[DuckDbClient]:
+    yield from yield_client_with_storage("duckdb")
+
+
+@pytest.mark.parametrize("file_format", ["jsonl", "parquet", "insert_values"])
+def test_load_file_formats(client: DuckDbClient, file_storage: FileStorage, file_format: str) -> None:
+    columns = TABLE_UPDATE
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+        # duckdb cannot read decimal256 used for wei in parquet files
+        columns = [c if c["data_type"] != "wei" else dict(c, data_type="bigint") for c in columns]  # type: ignore[misc]
+    table_name = "event_test_table" + uniq_id()
+    client.schema.update_schema(new_table(table_name, write_disposition="replace", columns=columns))
+    client.schema.bump_version()
+    client.update_storage_schema()
+    canonical_name = client.sql_client.make_qualified_table_name(table_name)
+    # coerce values like normalizer does
+    row, _ = client.schema.coerce_row(table_name, None, dict(TABLE_ROW))
+
+    for _ in range(2):
+        file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, file_format).job_id()
+        with file_storage.open_file(file_name, "wb") as f:
+            if not DataWriter.data_format_from_file_format(file_format).is_binary_format:
+                f = codecs.getwriter("utf-8")(f)
+            DataWriter.from_file_format(file_format, f, client.capabilities).write_all({c["name"]: c for c in columns}, [dict(row)])
+        job = client.start_file_load(client.schema.get_table(table_name), file_storage.make_full_path(file_name), uniq_id())
+        assert isinstance(job, InsertValuesLoadJob if file_format == "insert_values" else DuckDbCopyJob)
+        assert job.state() == "completed"
+
+    # replace disposition keeps only the last file
+    db_rows = client.sql_client.execute_sql(f"SELECT * FROM {canonical_name}")
+    assert len(db_rows) == 1
+    db_row = list(db_rows[0])
+    db_row[3] = str(pendulum.instance(db_row[3]))
+    db_row[6] = bytes(db_row[6])
+    db_row[8] = json.loads(db_row[8])
+    db_row[9] = db_row[9].isoformat()
+    assert db_row == list(TABLE_ROW.values())
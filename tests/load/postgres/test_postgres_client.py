@@ -1,16 +1,20 @@
+import io
 from typing import Iterator
 import pytest
 
 from dlt.common import pendulum, Wei
 from dlt.common.configuration.resolve import resolve_configuration
+from dlt.common.data_writers.writers import CsvWriter
 from dlt.common.storages import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.postgres.configuration import PostgresCredentials
-from dlt.destinations.postgres.postgres import PostgresClient, psycopg2
+from dlt.destinations.postgres.postgres import PostgresClient, PostgresCopyLoadJob, psycopg2
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, skipifpypy
 from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage
+from tests.common.utils import row_to_column_schemas
 
 
 @pytest.fixture
@@ -53,12 +57,40 @@ def test_wei_value(client: PostgresClient, file_storage: FileStorage) -> None:
     # postgres supports EVM precisions
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1)});"
-    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
 
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 18)});"
-    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
 
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__metadata__rasa_x_id)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {Wei.from_int256(2*256-1, 78)});"
-    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
+
+
+def test_copy_load(client: PostgresClient, file_storage: FileStorage) -> None:
+    user_table_name = prepare_table(client)
+    canonical_name = client.sql_client.make_qualified_table_name(user_table_name)
+    rows = [
+        {"_dlt_id": uniq_id(), "_dlt_root_id": uniq_id(), "sender_id": 'quoted "value", with comma', "timestamp": pendulum.now(), "text": "multi\nline\\"},
+        {"_dlt_id": uniq_id(), "_dlt_root_id": uniq_id(), "sender_id": "", "timestamp": pendulum.now()},
+    ]
+    columns = row_to_column_schemas(rows[0])
+
+    def load_csv(write_disposition: str) -> None:
+        with io.StringIO() as f:
+            CsvWriter(f).write_all(columns, rows)
+            file_name = ParsedLoadJobFileName(user_table_name, uniq_id(), 0, "csv").job_id()
+            file_storage.save(file_name, f.getvalue().encode("utf-8"))
+        table = dict(client.schema.get_table(user_table_name), write_disposition=write_disposition)
+        job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
+        assert isinstance(job, PostgresCopyLoadJob)
+        assert job.state() == "completed"
+
+    load_csv("append")
+    load_csv("append")
+    assert client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {canonical_name}")[0][0] == 4
+    # replace deletes previous content in the same transaction
+    load_csv("replace")
+    db_rows = client.sql_client.execute_sql(f"SELECT sender_id, text FROM {canonical_name} ORDER BY sender_id DESC")
+    assert db_rows == [('quoted "value", with comma', "multi\nline\\"), ("", None)]
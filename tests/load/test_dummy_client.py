@@ -1,13 +1,15 @@
 import shutil
 import os
+import signal
 from multiprocessing.pool import ThreadPool
 from time import sleep
 from typing import List, Sequence, Tuple
 import pytest
 from unittest.mock import patch
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
-from dlt.common.schema import Schema
+from dlt.common.exceptions import SignalReceivedException, TerminalException, TerminalValueError
+from dlt.common.runtime import signals
+from dlt.common.schema import Schema, TTableSchema
 from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
 from dlt.common.utils import uniq_id
@@ -186,12 +188,15 @@ def test_spool_job_retry_spool_new() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
-    # call higher level function that returns jobs and counts
+    # start jobs in the pool like the loader does
     with ThreadPool() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
-        assert len(jobs) == 2
+        load.load_single_package(load_id, schema)
+    # jobs were moved back to new jobs to be retried
+    files = load.load_storage.list_new_jobs(load_id)
+    assert len(files) == 2
+    for fn in files:
+        assert LoadStorage.parse_job_file_name(fn).retry_count == 1
 
 
 def test_spool_job_retry_started() -> None:
@@ -253,8 +258,8 @@ def test_try_retrieve_job() -> None:
         NORMALIZED_FILES
     )
     load.pool = ThreadPool()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    jobs = [result.get() for result in load.start_new_jobs_async(load_id, schema, load.load_storage.list_new_jobs(load_id))]
+    assert len(jobs) == 2
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -314,6 +319,108 @@ def test_retry_on_new_loop() -> None:
             assert LoadStorage.parse_job_file_name(fn).retry_count == 2
 
 
+def test_coalesce_new_jobs() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    # add more small files for the same table
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    content = load.load_storage.storage.load(os.path.join(new_jobs_path, NORMALIZED_FILES[0]))
+    for _ in range(3):
+        load.load_storage.storage.save(os.path.join(new_jobs_path, f"event_user.{uniq_id()}.0.jsonl"), content)
+    # files bigger than the limit are not combined
+    assert load.load_storage.coalesce_new_jobs(load_id, len(content)) == 0
+    assert len(load.load_storage.list_new_jobs(load_id)) == 5
+    assert load.load_storage.coalesce_new_jobs(load_id, 1024 * 1024) == 3
+    files = load.load_storage.list_new_jobs(load_id)
+    assert len(files) == 2
+    user_file = next(f for f in files if LoadStorage.parse_job_file_name(f).table_name == "event_user")
+    assert load.load_storage.storage.load(user_file).splitlines() == content.splitlines() * 4
+
+    # combined jobs are loaded with the package
+    load.config.coalesce_file_size = 1024 * 1024
+    with ThreadPool() as pool:
+        # load jobs and then complete package
+        load.run(pool)
+        load.run(pool)
+    completed_path = load.load_storage.get_completed_package_path(load_id)
+    assert len(load.load_storage.storage.list_folder_files(os.path.join(completed_path, LoadStorage.COMPLETED_JOBS_FOLDER))) == 2
+
+
+def test_reuse_clients() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    client = load.get_client(schema)
+    # same thread and schema reuses the client
+    assert load.get_client(schema) is client
+    # other schema instance gets new client
+    other_client = load.get_client(load.load_storage.load_package_schema(load_id))
+    assert other_client is not client
+    with patch.object(dummy_impl.DummyClient, "__exit__") as client_exit:
+        load.close_clients()
+        client_exit.assert_called_once()
+    assert load.get_client(schema) is not other_client
+
+    # clients are closed after package is loaded
+    with patch.object(dummy_impl.DummyClient, "__exit__") as client_exit:
+        with ThreadPool() as pool:
+            load.run(pool)
+        assert client_exit.call_count >= 1
+    assert load._clients == {}
+
+    # client created while clients are closed is not kept and is closed when returned
+    enter = dummy_impl.DummyClient.__enter__
+
+    def _close_clients_and_enter(client: dummy_impl.DummyClient) -> dummy_impl.DummyClient:
+        load.close_clients()
+        return enter(client)
+
+    with patch.object(dummy_impl.DummyClient, "__enter__", _close_clients_and_enter):
+        with patch.object(dummy_impl.DummyClient, "__exit__") as client_exit:
+            with load._borrow_client(schema):
+                assert load._clients == {}
+            client_exit.assert_called_once()
+    assert load._clients == {}
+
+
+def test_signal_while_starting_jobs(monkeypatch) -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
+    load_id, _ = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    start_file_load = dummy_impl.DummyClient.start_file_load
+
+    def _signal_and_start_file_load(client: dummy_impl.DummyClient, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        # signal comes while the job is being started
+        monkeypatch.setattr(signals, "_received_signal", signal.SIGINT)
+        sleep(1.5)
+        return start_file_load(client, table, file_path, load_id)
+
+    monkeypatch.setattr(dummy_impl.DummyClient, "start_file_load", _signal_and_start_file_load)
+    with ThreadPool() as pool:
+        with pytest.raises(SignalReceivedException):
+            load.run(pool)
+    # jobs that could not be started are moved back to new jobs, not left in started jobs
+    assert len(load.load_storage.list_new_jobs(load_id)) == 2
+    assert len(load.load_storage.list_started_jobs(load_id)) == 0
+    assert load._clients == {}
+
+    # errors when completing jobs being started do not replace the signal
+    def _raise_retry_job(load_id: str, file_name: str) -> str:
+        raise OSError("cannot move job")
+
+    monkeypatch.setattr(load.load_storage, "retry_job", _raise_retry_job)
+    with ThreadPool() as pool:
+        with pytest.raises(SignalReceivedException):
+            load.run(pool)
+
+
 def test_retry_exceptions() -> None:
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     prepare_load_package(
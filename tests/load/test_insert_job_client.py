@@ -6,9 +6,10 @@ from dlt.common import pendulum, Decimal
 from dlt.common.arithmetics import numeric_default_context
 from dlt.common.storages import FileStorage
 from dlt.common.utils import uniq_id
+from dlt.common.data_writers.writers import InsertValuesWriter
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
-from dlt.destinations.insert_job_client import InsertValuesJobClient
+from dlt.destinations.insert_job_client import InsertValuesJobClient, InsertValuesLoadJob
 
 from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage, skipifpypy
 from tests.load.utils import expect_load_file, prepare_table, yield_client_with_storage, ALL_CLIENTS_SUBSET
@@ -48,18 +49,18 @@ def test_simple_load(client: InsertValuesJobClient, file_storage: FileStorage) -
     # create insert
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}')"
-    expect_load_file(client, file_storage, insert_sql+insert_values+";", user_table_name)
+    expect_load_file(client, file_storage, insert_sql+insert_values+";", user_table_name, file_format="insert_values")
     rows_count = client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {canonical_name}")[0][0]
     assert rows_count == 1
     # insert 100 more rows
     query = insert_sql + (insert_values + ",\n") * 99 + insert_values + ";"
-    expect_load_file(client, file_storage, query, user_table_name)
+    expect_load_file(client, file_storage, query, user_table_name, file_format="insert_values")
     rows_count = client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {canonical_name}")[0][0]
     assert rows_count == 101
     # insert null value
     insert_sql_nc = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, text)\nVALUES\n"
     insert_values_nc = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', NULL);"
-    expect_load_file(client, file_storage, insert_sql_nc+insert_values_nc, user_table_name)
+    expect_load_file(client, file_storage, insert_sql_nc+insert_values_nc, user_table_name, file_format="insert_values")
     rows_count = client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {canonical_name}")[0][0]
     assert rows_count == 102
 
@@ -89,26 +90,26 @@ def test_loading_errors(client: InsertValuesJobClient, file_storage: FileStorage
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, _unk_)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', NULL);"
     with pytest.raises(DatabaseTerminalException) as exv:
-        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     assert type(exv.value.dbapi_exception) is TUndefinedColumn
     # insert null value
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', NULL);"
     with pytest.raises(DatabaseTerminalException) as exv:
-        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     assert type(exv.value.dbapi_exception) is TNotNullViolation
     # insert wrong type
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp)\nVALUES\n"
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', TRUE);"
     with pytest.raises(DatabaseTerminalException) as exv:
-        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     assert type(exv.value.dbapi_exception) is TDatatypeMismatch
     # numeric overflow on bigint
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, metadata__rasa_x_id)\nVALUES\n"
     # 2**64//2 - 1 is a maximum bigint value
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {2**64//2});"
     with pytest.raises(DatabaseTerminalException) as exv:
-        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     assert type(exv.value.dbapi_exception) in (TNumericValueOutOfRange, )
     # numeric overflow on NUMERIC
     insert_sql = "INSERT INTO {}(_dlt_id, _dlt_root_id, sender_id, timestamp, parse_data__intent__id)\nVALUES\n"
@@ -118,11 +119,11 @@ def test_loading_errors(client: InsertValuesJobClient, file_storage: FileStorage
         above_limit = Decimal(10**29)
     # this will pass
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {below_limit});"
-    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+    expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     # this will raise
     insert_values = f"('{uniq_id()}', '{uniq_id()}', '90238094809sajlkjxoiewjhduuiuehd', '{str(pendulum.now())}', {above_limit});"
     with pytest.raises(DatabaseTerminalException) as exv:
-        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name)
+        expect_load_file(client, file_storage, insert_sql+insert_values, user_table_name, file_format="insert_values")
     assert type(exv.value.dbapi_exception) in (TNumericValueOutOfRange, psycopg2.errors.InternalError_)
 
 
@@ -135,7 +136,7 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     # this guarantees that we execute inserts line by line
     with patch.object(mocked_caps, "max_query_length", 2), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
         user_table_name = prepare_table(client)
-        expect_load_file(client, file_storage, insert_sql, user_table_name)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
         # print(mocked_fragments.mock_calls)
     # split in 10 lines
     assert mocked_fragments.call_count == 10
@@ -153,7 +154,7 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     query_length = (idx - start_idx - 1) * 2
     with patch.object(mocked_caps, "max_query_length", query_length), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
         user_table_name = prepare_table(client)
-        expect_load_file(client, file_storage, insert_sql, user_table_name)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
     # split in 2 on ','
     assert mocked_fragments.call_count == 2
 
@@ -161,7 +162,7 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     query_length = (idx - start_idx) * 2
     with patch.object(mocked_caps, "max_query_length", query_length), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
         user_table_name = prepare_table(client)
-        expect_load_file(client, file_storage, insert_sql, user_table_name)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
     # split in 2 on ','
     assert mocked_fragments.call_count == 2
 
@@ -169,18 +170,58 @@ def test_query_split(client: InsertValuesJobClient, file_storage: FileStorage) -
     query_length = (len(insert_sql) - start_idx - 3) * 2
     with patch.object(mocked_caps, "max_query_length", query_length), patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
         user_table_name = prepare_table(client)
-        expect_load_file(client, file_storage, insert_sql, user_table_name)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
     # split in 2 on ','
     assert mocked_fragments.call_count == 1
 
 
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_statements_split(client: InsertValuesJobClient, file_storage: FileStorage) -> None:
+    insert_sql = prepare_insert_statement(10)
+    header, values = insert_sql.split("VALUES\n")
+    rows = values[:-1].split(",\n")
+    # file with 3 statements written by the writer
+    statements = [header + "VALUES\n" + ",\n".join(rows[idx:idx + 4]) for idx in range(0, len(rows), 4)]
+    insert_sql = ";\n".join(statements) + ";"
+    assert insert_sql.count(InsertValuesWriter.STATEMENT_BOUNDARY) == 2
+    with patch.object(client.sql_client, "execute_fragments") as mocked_fragments:
+        user_table_name = prepare_table(client)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
+    # each statement executed separately
+    assert mocked_fragments.call_count == 3
+    for idx, call in enumerate(mocked_fragments.call_args_list):
+        fragment: List[str] = call.args[0]
+        assert fragment[-1].startswith(f"\nVALUES\n('{idx * 4}'")
+        assert fragment[-1].endswith(");")
+    # load for real
+    user_table_name = prepare_table(client)
+    expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
+    rows_count = client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {user_table_name}")[0][0]
+    assert rows_count == 10
+
+
+def test_read_ahead() -> None:
+    chunks = [["INSERT", str(i)] for i in range(5)]
+    assert list(InsertValuesLoadJob._read_ahead(iter(chunks))) == chunks
+    assert list(InsertValuesLoadJob._read_ahead(iter([]))) == []
+
+    def _failing_chunks() -> Iterator[List[str]]:
+        yield chunks[0]
+        raise ValueError("file error")
+
+    read_ahead = InsertValuesLoadJob._read_ahead(_failing_chunks())
+    assert next(read_ahead) == chunks[0]
+    with pytest.raises(ValueError):
+        next(read_ahead)
+
+
 def assert_load_with_max_query(client: InsertValuesJobClient, file_storage: FileStorage, insert_lines: int, max_query_length: int) -> None:
     # load and check for real
     mocked_caps = client.sql_client.__class__.capabilities
     with patch.object(mocked_caps, "max_query_length", max_query_length):
         user_table_name = prepare_table(client)
         insert_sql = prepare_insert_statement(insert_lines)
-        expect_load_file(client, file_storage, insert_sql, user_table_name)
+        expect_load_file(client, file_storage, insert_sql, user_table_name, file_format="insert_values")
         rows_count = client.sql_client.execute_sql(f"SELECT COUNT(1) FROM {user_table_name}")[0][0]
         assert rows_count == insert_lines
         # get all uniq ids in order
@@ -11,6 +11,7 @@ from dlt.common import json, Decimal, sleep
 from dlt.common.configuration import resolve_configuration
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
+from dlt.common.destination import TLoaderFileFormat
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, DestinationReference, JobClientBase, LoadJob
 from dlt.common.data_writers import DataWriter
 from dlt.common.schema import TColumnSchema, TTableSchemaColumns, Schema
@@ -115,8 +116,8 @@ def load_table(name: str) -> TTableSchemaColumns:
         return cast(TTableSchemaColumns, json.load(f))
 
 
-def expect_load_file(client: JobClientBase, file_storage: FileStorage, query: str, table_name: str, status = "completed") -> LoadJob:
-    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, "jsonl").job_id()
+def expect_load_file(client: JobClientBase, file_storage: FileStorage, query: str, table_name: str, status = "completed", file_format: TLoaderFileFormat = None) -> LoadJob:
+    file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, file_format or client.capabilities.preferred_loader_file_format).job_id()
     file_storage.save(file_name, query.encode("utf-8"))
     table = Load.get_load_table(client.schema, file_name)
     job = client.start_file_load(table, file_storage.make_full_path(file_name), uniq_id())
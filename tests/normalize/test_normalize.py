@@ -10,14 +10,15 @@ from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
 from dlt.common.storages import NormalizeStorage, LoadStorage
-from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.data_writers import DataWriter
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.configuration.container import Container
 
 from dlt.extract.extract import ExtractorStorage
 from dlt.normalize import Normalize
-from dlt.destinations.duckdb import capabilities as duck_insert_caps
+from dlt.destinations.duckdb import capabilities as duck_caps
 from dlt.destinations.redshift import capabilities as rd_insert_caps
-from dlt.destinations.postgres import capabilities as pg_insert_caps
+from dlt.destinations.postgres import capabilities as pg_caps
 from dlt.destinations.bigquery import capabilities as jsonl_caps
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
@@ -25,6 +26,20 @@ from tests.utils import TEST_STORAGE_ROOT, TEST_DICT_CONFIG_PROVIDER, assert_no_
 from tests.normalize.utils import json_case_path
 
 
+def pg_insert_caps() -> DestinationCapabilitiesContext:
+    # postgres prefers csv files, force insert values
+    caps = pg_caps()
+    caps.preferred_loader_file_format = "insert_values"
+    return caps
+
+
+def duck_insert_caps() -> DestinationCapabilitiesContext:
+    # duckdb prefers jsonl files, force insert values
+    caps = duck_caps()
+    caps.preferred_loader_file_format = "insert_values"
+    return caps
+
+
 INSERT_CAPS = [duck_insert_caps, rd_insert_caps, pg_insert_caps]
 JSONL_CAPS = [jsonl_caps]
 ALL_CAPS = INSERT_CAPS + JSONL_CAPS
@@ -234,9 +249,11 @@ def test_normalize_many_schemas(caps: DestinationCapabilitiesContext, rasa_norma
     assert set(schemas) == set(["ethereum", "event"])
 
 
+@pytest.mark.parametrize("extract_file_format", ExtractorStorage.EXTRACT_FILE_FORMATS)
 @pytest.mark.parametrize("caps", ALL_CAPS, indirect=True)
-def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
-    extract_items(raw_normalize.normalize_storage, [JSON_TYPED_DICT], "special", "special")
+def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normalize: Normalize, extract_file_format: TLoaderFileFormat) -> None:
+    extract_items(raw_normalize.normalize_storage, [JSON_TYPED_DICT], "special", "special", extract_file_format)
+    assert all(f.endswith(DataWriter.data_format_from_file_format(extract_file_format).file_extension) for f in raw_normalize.normalize_storage.list_files_to_normalize_sorted())
     with ThreadPool(processes=1) as pool:
         raw_normalize.run(pool)
     loads = raw_normalize.load_storage.list_packages()
@@ -251,6 +268,35 @@ def test_normalize_typed_json(caps: DestinationCapabilitiesContext, raw_normaliz
         assert table[k]["data_type"] == v
 
 
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_normalize_tuples_in_extract_formats(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    item = {"id": 1, "pair": (1, 2), "events": ({"name": "a"}, {"name": "b", "tags": ("x", "y")}), "nested": {"point": (0.5, 1.5)}}
+    normalized: Dict[str, Tuple[Dict[str, List[str]], Dict[str, List[StrAny]]]] = {}
+    for extract_file_format in ExtractorStorage.EXTRACT_FILE_FORMATS:
+        extract_items(raw_normalize.normalize_storage, [item], "tuples", "tuples", extract_file_format)
+        load_id = normalize_pending(raw_normalize, "tuples")
+        schema = raw_normalize.load_storage.load_package_schema(load_id)
+        tables = {t["name"]: sorted(t["columns"]) for t in schema.data_tables()}
+        rows: Dict[str, List[StrAny]] = {}
+        for job_file in raw_normalize.load_storage.list_new_jobs(load_id):
+            table_name = LoadStorage.parse_job_file_name(job_file).table_name
+            for line in raw_normalize.load_storage.storage.load(job_file).splitlines():
+                # drop ids and load id that are different in each package
+                row = {k: v for k, v in json.loads(line).items() if not k.startswith("_dlt_")}
+                rows.setdefault(table_name, []).append(row)
+        normalized[extract_file_format] = (tables, rows)
+    # tuples are normalized into child tables like lists
+    jsonl_tables, jsonl_rows = normalized["puae-jsonl"]
+    assert "tuples__events__tags" in jsonl_tables
+    assert "tuples__pair" in jsonl_tables
+    assert normalized["pickle"] == normalized["puae-jsonl"]
+
+    # types that json cannot encode are rejected in all formats
+    for extract_file_format in ExtractorStorage.EXTRACT_FILE_FORMATS:
+        with pytest.raises(TypeError):
+            extract_items(raw_normalize.normalize_storage, [{"id": 1, "tags": {"x", "y"}}], "tuples", "tuples", extract_file_format)
+
+
 @pytest.mark.parametrize("caps", ALL_CAPS, indirect=True)
 def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
     doc = {"str": "text", "int": 1}
@@ -294,6 +340,28 @@ def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Nor
     assert {"_dlt_id", "_dlt_list_idx", "_dlt_parent_id", "str", "int", "bool", "int__v_text"} == set(doc__comp_table["columns"].keys())
 
 
+def test_parallel_schema_conflict_retries_table(raw_normalize: Normalize) -> None:
+    # each file gets a separate task, columns in "doc" table conflict
+    extract_items(raw_normalize.normalize_storage, [{"value": 1}] * 10, "evolution", "doc")
+    extract_items(raw_normalize.normalize_storage, [{"value": "text"}] * 10, "evolution", "doc")
+    extract_items(raw_normalize.normalize_storage, [{"other": True}] * 10, "evolution", "other")
+    # thread pool shares stored schema between tasks so use real process pool
+    with Pool(processes=3) as pool:
+        raw_normalize.run(pool)
+    load_id = raw_normalize.load_storage.list_packages()[0]
+    _, table_files = expect_load_package(raw_normalize.load_storage, load_id, ["doc", "other"])
+    # conflicting file was normalized again: text goes to a variant column, ints are coerced into text column
+    schema = raw_normalize.load_or_create_schema(raw_normalize.schema_storage, "evolution")
+    doc_columns = set(schema.get_table_columns("doc").keys())
+    assert doc_columns in ({"_dlt_load_id", "_dlt_id", "value", "value__v_text"}, {"_dlt_load_id", "_dlt_id", "value"})
+    # non conflicting table was not retried
+    assert len(table_files["other"]) == 1
+    assert len(table_files["doc"]) == 2
+    _, lines = get_line_from_file(raw_normalize.load_storage, table_files["doc"])
+    # insert writer adds 2 lines per file
+    assert lines in (20, 24)
+
+
 @pytest.mark.parametrize("caps", ALL_CAPS, indirect=True)
 def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
     load_id = extract_and_normalize_cases(raw_normalize, ["github.issues.load_page_5_duck"])
@@ -329,23 +397,30 @@ def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_
     assert_schema(schema)
 
 
-def test_group_worker_files() -> None:
-
-    files = ["f%03d" % idx for idx in range(0, 100)]
-
-    assert Normalize.group_worker_files([], 4) == []
-    assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
-    assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
-    assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert Normalize.group_worker_files(files[:5], 4) == [["f000"], ["f001"], ["f002"], ["f003", "f004"]]
-    assert Normalize.group_worker_files(files[:8], 4) == [["f000", "f001"], ["f002", "f003"], ["f004", "f005"], ["f006", "f007"]]
-    assert Normalize.group_worker_files(files[:8], 3) == [["f000", "f001"], ["f002", "f003", "f006"], ["f004", "f005", "f007"]]
-    assert Normalize.group_worker_files(files[:5], 3) == [["f000"], ["f001", "f003"], ["f002", "f004"]]
-
-    # check if sorted
-    files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert Normalize.group_worker_files(files, 3) == [["chd.3"], ["chd.4", "tab1.2"], ["tab1.1", "tab1.3"]]
-
+def test_read_extracted_items(raw_normalize: Normalize) -> None:
+    storage = raw_normalize.normalize_storage.storage
+    file_name = NormalizeStorage.EXTRACTED_FOLDER + "/event.event.a.jsonl"
+    # empty lines are skipped, last line has no new line
+    storage.save(file_name, '[{"a": "ą"}]\n\n[{"b": 1}, {"c": null}]')
+    assert list(Normalize._read_extracted_items(raw_normalize.normalize_storage, file_name)) == [[{"a": "ą"}], [{"b": 1}, {"c": None}]]
+    storage.save(file_name, "")
+    assert list(Normalize._read_extracted_items(raw_normalize.normalize_storage, file_name)) == []
+
+
+def test_group_worker_files_by_size() -> None:
+    assert Normalize.group_worker_files_by_size([], [], 4) == []
+    assert Normalize.group_worker_files_by_size(["f001"], [10], 4) == [["f001"]]
+    # 2 workers with 4 tasks each: target task size is 10
+    files = ["f%03d" % idx for idx in range(0, 8)]
+    assert Normalize.group_worker_files_by_size(files, [10] * 8, 2) == [[f] for f in files]
+    # small files are packed together, big file gets own task and is scheduled first
+    files = ["a.1", "a.2", "a.3", "b.1", "c.1"]
+    tasks = Normalize.group_worker_files_by_size(files, [1, 1, 1, 100, 1], 1)
+    assert tasks == [["b.1"], ["a.1", "a.2", "a.3"], ["c.1"]]
+    tasks = Normalize.group_worker_files_by_size(files, [10, 10, 10, 100, 10], 4)
+    assert tasks == [["b.1"], ["a.1"], ["a.2"], ["a.3"], ["c.1"]]
+    # all files are always scheduled
+    assert sorted(f for task in tasks for f in task) == files
 
 EXPECTED_ETH_TABLES = ["blocks", "blocks__transactions", "blocks__transactions__logs", "blocks__transactions__logs__topics",
                        "blocks__uncles", "blocks__transactions__access_list", "blocks__transactions__access_list__storage_keys"]
@@ -358,8 +433,8 @@ EXPECTED_USER_TABLES = ["event", "event__parse_data__intent_ranking", "event__pa
          "event__parse_data__response_selector__default__response__responses"]
 
 
-def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str) -> None:
-    extractor = ExtractorStorage(normalize_storage.config)
+def extract_items(normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema_name: str, table_name: str, file_format: TLoaderFileFormat = "puae-jsonl") -> None:
+    extractor = ExtractorStorage(normalize_storage.config, file_format=file_format)
     extract_id = extractor.create_extract_id()
     extractor.write_data_item(extract_id, schema_name, table_name, items, None)
     extractor.close_writers(extract_id)
@@ -15,7 +15,7 @@ from dlt.common.pipeline import PipelineContext
 from dlt.common.runtime.collector import AliveCollector, EnlightenCollector, LogCollector, TqdmCollector
 from dlt.common.schema.exceptions import InvalidDatasetName
 from dlt.common.schema.schema import Schema
-from dlt.common.utils import uniq_id
+from dlt.common.utils import digest128, uniq_id
 from dlt.destinations.redshift.configuration import RedshiftCredentials
 from dlt.extract.exceptions import SourceExhausted
 from dlt.extract.extract import ExtractorStorage
@@ -247,6 +247,73 @@ def test_extract_multiple_sources() -> None:
     assert set(p._schema_storage.list_schemas()) == {"default", "default_2"}
 
 
+def test_extract_process_workers() -> None:
+
+    def numbers(n):
+        dlt.current.resource_state()["pid"] = os.getpid()
+        yield from range(n)
+
+    @dlt.transformer
+    def squares(item):
+        yield item * item
+
+    @dlt.source
+    def independent():
+        return dlt.resource(numbers, name="numbers_1")(3), dlt.resource(numbers, name="numbers_2")(4), dlt.resource(numbers, name="numbers_3")(5) | squares
+
+    p = dlt.pipeline(destination="dummy", full_refresh=True)
+    p.extract(independent(), process_workers=3)
+    storage = ExtractorStorage(p._normalize_storage_config)
+    expect_extracted_file(storage, "independent", "numbers_1", json.dumps([0, 1, 2]))
+    expect_extracted_file(storage, "independent", "numbers_2", json.dumps([0, 1, 2, 3]))
+    expect_extracted_file(storage, "independent", "squares", json.dumps([0, 1, 4, 9, 16]))
+    # each component was extracted in a worker process and its resource state merged back
+    resources_state = p.state["sources"]["independent"]["resources"]
+    pids = {resources_state[name]["pid"] for name in ("numbers_1", "numbers_2", "numbers_3")}
+    assert os.getpid() not in pids
+    # schema contains all the tables
+    assert {"numbers_1", "numbers_2", "squares"}.issubset(p.default_schema.tables.keys())
+
+    # failing component
+    @dlt.resource
+    def i_fail():
+        raise NotImplementedError()
+
+    with pytest.raises(PipelineStepFailed) as py_ex:
+        p.extract([dlt.resource(numbers, name="numbers_4")(3), i_fail], process_workers=2)
+    assert "NotImplementedError" in str(py_ex.value)
+
+
+@pytest.mark.parametrize("process_workers", [1, 4])
+def test_backfill_ranges(process_workers: int) -> None:
+
+    @dlt.resource(primary_key="id")
+    def events(created_at=dlt.sources.incremental("created_at")):
+        start_value, end_value = created_at.push_down()
+        # each range writes its own key into the resource state
+        dlt.current.resource_state().setdefault("ranges", {})[str(start_value)] = end_value
+        yield [{"id": i, "created_at": i} for i in range(start_value, end_value or 110)]
+
+    p = dlt.pipeline(destination="dummy", full_refresh=True)
+    p.backfill(events, 0, 100, windows=4, process_workers=process_workers)
+    storage = ExtractorStorage(p._normalize_storage_config)
+    files = [file for file in storage.list_files_to_normalize_sorted() if storage.parse_normalize_file_name(file).table_name == "events"]
+    ids = []
+    for file in files:
+        for line in storage.storage.load(file).splitlines():
+            item = json.loads(line)
+            ids.extend(i["id"] for i in (item if isinstance(item, list) else [item]))
+    assert sorted(ids) == list(range(100))
+    # states of the ranges are merged into the resource state
+    state = p.state["sources"][p.default_schema_name]["resources"]["events"]["incremental"]["created_at"]
+    assert state["last_value"] == 99
+    assert state["unique_hashes"] == [digest128("99")]
+    # resource state written in all the ranges is preserved
+    assert p.state["sources"][p.default_schema_name]["resources"]["events"]["ranges"] == {"0": 25, "25": 50, "50": 75, "75": 100}
+    # incremental load continues from the end of the backfill
+    assert [i["id"] for i in events()] == list(range(100, 110))
+
+
 def test_restore_state_on_dummy() -> None:
     os.environ["COMPLETED_PROB"] = "1.0"  # make it complete immediately
 